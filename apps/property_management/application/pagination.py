@@ -1,20 +1,39 @@
+from rest_framework.utils.urls import replace_query_param
+
 from common.constants import Success
 from common.pagination.base_pagination import BasePagination
+from common.pagination.count_strategy import CachedCount
+from common.pagination.cursor_pagination import CursorPaginationMixin
 
 
-class PropertiesPagination(BasePagination):
+class PropertiesPagination(CursorPaginationMixin, BasePagination):
     page_size = 8
     message = Success.PROPERTIES_LIST
+    count_strategy = CachedCount()
 
 
-class UnitsPagination(BasePagination):
+class UnitsPagination(CursorPaginationMixin, BasePagination):
     page_size = 8
     message = Success.UNITS_LIST
+    count_strategy = CachedCount()
 
 
 class DocumentsPagination(BasePagination):
     message = Success.DOCUMENTS_LIST
+    count_strategy = CachedCount()
 
 
 class UserPropertiesAndUnitsPagination(BasePagination):
     message = Success.USER_PROPERTIES_AND_UNITS_LIST
+
+
+class PublicListingsPagination(CursorPaginationMixin, BasePagination):
+    message = Success.PUBLIC_LISTINGS_LIST
+    cursor_by_default = True
+
+    def get_link_url(self):
+        # pages are cached for all visitors, their links only carry the page size the cache is keyed on
+        url = self.request.build_absolute_uri(self.request.path)
+        if self.page_size_query_param in self.request.query_params:
+            url = replace_query_param(url, self.page_size_query_param, self.get_page_size(self.request))
+        return url
@@ -0,0 +1,142 @@
+from itertools import groupby
+
+from django.db import transaction
+from django.db.models import FilteredRelation, Q
+
+from apps.property_management.domain.services import DateRangeIndex
+from apps.property_management.domain.value_objects import ONE_DAY
+from apps.property_management.infrastructure.models import CalendarSlot, Unit
+from common.model_version import bump_model_version
+
+
+class AvailabilityService:
+    """
+    Reads and writes the unavailability ranges of a property or unit calendar. Writes load the ranges around the
+    changed days into a DateRangeIndex, apply the change there and store the difference.
+    """
+
+    @staticmethod
+    def get_index(property_id, unit_id, start_date, end_date):
+        slots = CalendarSlot.objects.filter(property=property_id, unit=unit_id, start_date__lte=end_date, end_date__gte=start_date)
+        return DateRangeIndex(slot.as_date_range() for slot in slots)
+
+    @staticmethod
+    def get_days(property_id, unit_id, start_date, end_date):
+        """The day level view of a calendar, every day from start_date to end_date with its covering range."""
+        index = AvailabilityService.get_index(property_id, unit_id, start_date, end_date)
+        return [
+            {
+                'id': date_range.slot_id if date_range else None,
+                'date': day.strftime('%Y-%m-%d'),
+                'status': date_range.status if date_range else 'available',
+                'reason': date_range.reason if date_range else None,
+            }
+            for day, date_range in index.days(start_date, end_date)
+        ]
+
+    @staticmethod
+    def get_matrix(property_id, owner_id, start_date, end_date, encoding='bitmap'):
+        """
+        Availability of every unit of a property of the owner from start_date to end_date, one character per day in a
+        bitmap ('1' = unavailable) or run length encoded as [bit, days] pairs. Units and their overlapping ranges come
+        from one LEFT JOIN query.
+        """
+        days = (end_date - start_date).days + 1
+        rows = (
+            Unit.objects.filter(property=property_id, property__property_owner=owner_id)
+            .annotate(
+                range_slots=FilteredRelation(
+                    'unit_slots',
+                    condition=Q(
+                        unit_slots__start_date__lte=end_date, unit_slots__end_date__gte=start_date, unit_slots__status='unavailable'
+                    ),
+                )
+            )
+            .order_by('id')
+            .values_list('id', 'number', 'range_slots__start_date', 'range_slots__end_date')
+        )
+
+        units = []
+        for (unit_id, number), slots in groupby(rows, key=lambda row: row[:2]):
+            bitmap = bytearray(b'0' * days)
+            for _, _, slot_start, slot_end in slots:
+                if slot_start is None:
+                    continue
+                first = max((slot_start - start_date).days, 0)
+                last = min((slot_end - start_date).days, days - 1)
+                bitmap[first : last + 1] = b'1' * (last - first + 1)
+            availability = bitmap.decode()
+            if encoding == 'rle':
+                availability = [[int(bit), len(list(run))] for bit, run in groupby(availability)]
+            units.append({'id': unit_id, 'number': number, 'availability': availability})
+
+        return {
+            'start': start_date.strftime('%Y-%m-%d'),
+            'end': end_date.strftime('%Y-%m-%d'),
+            'days': days,
+            'encoding': encoding,
+            'units': units,
+        }
+
+    @classmethod
+    @transaction.atomic
+    def block(cls, property_id, unit_id, date_ranges):
+        """Mark the given ranges unavailable, overriding whatever was stored for those days."""
+        if not date_ranges:
+            return
+        start_date = min(date_range.start_date for date_range in date_ranges)
+        end_date = max(date_range.end_date for date_range in date_ranges)
+        slots, index = cls._lock(property_id, unit_id, start_date, end_date)
+        for date_range in date_ranges:
+            index.add(date_range)
+        cls._save(property_id, unit_id, slots, index)
+
+    @classmethod
+    @transaction.atomic
+    def free(cls, property_id, unit_id, start_date, end_date):
+        """Make the days from start_date to end_date available again, splitting ranges that cover them partially."""
+        slots, index = cls._lock(property_id, unit_id, start_date, end_date)
+        index.remove(start_date, end_date)
+        cls._save(property_id, unit_id, slots, index)
+
+    @staticmethod
+    def _lock(property_id, unit_id, start_date, end_date):
+        # ranges touching the window are loaded as well so adjacent ranges can be merged
+        slots = list(
+            CalendarSlot.objects.select_for_update().filter(
+                property=property_id, unit=unit_id, start_date__lte=end_date + ONE_DAY, end_date__gte=start_date - ONE_DAY
+            )
+        )
+        return slots, DateRangeIndex(slot.as_date_range() for slot in slots)
+
+    @staticmethod
+    def _save(property_id, unit_id, slots, index):
+        existing = {slot.id: slot for slot in slots}
+        kept_ids = set()
+        updated = []
+        created = []
+        for date_range in index:
+            slot = existing.get(date_range.slot_id)
+            if slot is None:
+                created.append(
+                    CalendarSlot(
+                        property_id=property_id,
+                        unit_id=unit_id,
+                        start_date=date_range.start_date,
+                        end_date=date_range.end_date,
+                        status=date_range.status,
+                        reason=date_range.reason,
+                    )
+                )
+                continue
+            kept_ids.add(slot.id)
+            if slot.as_date_range() != date_range:
+                slot.start_date, slot.end_date = date_range.start_date, date_range.end_date
+                slot.status, slot.reason = date_range.status, date_range.reason
+                updated.append(slot)
+
+        CalendarSlot.objects.filter(id__in=existing.keys() - kept_ids).delete()
+        CalendarSlot.objects.bulk_update(updated, ['start_date', 'end_date', 'status', 'reason'])
+        CalendarSlot.objects.bulk_create(created)
+        # bulk writes don't send signals, cached counts of properties filtered by their slots follow this version
+        transaction.on_commit(lambda: bump_model_version(CalendarSlot))
@@ -0,0 +1,106 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from apps.property_management.application.services.property_metrics_service import OCCUPIED_RENTS
+from apps.property_management.infrastructure.models import Property, RentDetail, Unit
+from apps.user_management.infrastructure.models import TenantInvitation, VendorInvitation
+
+EXPIRY_WINDOWS = (30, 60, 90)
+# short term rents are daily or weekly rates and semester billing is per semester, neither adds up to a monthly total
+MONTHLY_RENTAL_TYPES = ('long_term', 'monthly_billing')
+
+
+class DashboardService:
+    """
+    Portfolio totals of an owner, one aggregate query per table, cached per owner.
+
+    The cache key contains a version per owner, bumped after commit by the post_save/post_delete receivers connected
+    in the app config whenever one of the owner's properties, units, rents or invitations is written. The key contains
+    the date as well, the lease expiry windows move with it.
+
+    ``monthly_rent`` is the rent of the occupied units and properties with a monthly rental type, vacant ones count as
+    no income like in PropertyMetrics.rental_income.
+    """
+
+    TIMEOUT = 300
+
+    @staticmethod
+    def _version_key(owner_id):
+        return f'dashboard_version:{owner_id}'
+
+    @classmethod
+    def bump(cls, owner_id):
+        try:
+            cache.incr(cls._version_key(owner_id))
+        except ValueError:
+            cache.set(cls._version_key(owner_id), 2, timeout=None)
+
+    @classmethod
+    def model_changed(cls, sender, instance, **kwargs):
+        if isinstance(instance, Property):
+            owner_id = instance.property_owner_id
+        elif isinstance(instance, (TenantInvitation, VendorInvitation)):
+            owner_id = instance.sender_id
+        else:
+            owner_id = Property.objects.filter(pk=instance.property_id).values_list('property_owner_id', flat=True).first()
+        if owner_id:
+            transaction.on_commit(lambda: cls.bump(owner_id))
+
+    @classmethod
+    def get_dashboard(cls, owner_id):
+        today = timezone.localdate()
+        version = cache.get_or_set(cls._version_key(owner_id), 1, timeout=None)
+        key = f'dashboard:{owner_id}:{version}:{today.isoformat()}'
+        data = cache.get(key)
+        if data is None:
+            data = cls._build(owner_id, today)
+            cache.set(key, data, cls.TIMEOUT)
+        return data
+
+    @staticmethod
+    def _build(owner_id, today):
+        properties = Property.objects.filter(property_owner=owner_id).aggregate(
+            total_count=Count('id'),
+            published_count=Count('id', filter=Q(published=True)),
+            draft_count=Count('id', filter=Q(published=False)),
+        )
+        units = Unit.objects.filter(property__property_owner=owner_id).aggregate(
+            total_count=Count('id'),
+            vacant_count=Count('id', filter=Q(status='vacant')),
+            occupied_count=Count('id', filter=Q(status='occupied')),
+        )
+
+        now = timezone.now()
+        pending = Q(accepted=False, blocked=False) & (Q(expired_at__isnull=True) | Q(expired_at__gt=now))
+        leases = Q(accepted=True, blocked=False, lease_end_date__gte=today)
+        tenant_invitations = TenantInvitation.objects.filter(sender=owner_id).aggregate(
+            pending_count=Count('id', filter=pending),
+            accepted_count=Count('id', filter=Q(accepted=True)),
+            **{
+                f'expiring_{days}_count': Count('id', filter=leases & Q(lease_end_date__lte=today + timedelta(days=days)))
+                for days in EXPIRY_WINDOWS
+            },
+        )
+        vendor_invitations = VendorInvitation.objects.filter(sender=owner_id).aggregate(
+            pending_count=Count('id', filter=pending),
+            accepted_count=Count('id', filter=Q(accepted=True)),
+        )
+        monthly_rents = RentDetail.objects.filter(OCCUPIED_RENTS, property__property_owner=owner_id, rental_type__in=MONTHLY_RENTAL_TYPES)
+        monthly_rent = monthly_rents.aggregate(total=Sum('rent'))['total']
+
+        # aggregates can't be named after fields, hence the suffix
+        def counts(totals, *names):
+            return {name: totals[f'{name}_count'] for name in names}
+
+        return {
+            'properties': counts(properties, 'total', 'published', 'draft'),
+            'units': counts(units, 'total', 'vacant', 'occupied'),
+            'tenant_invitations': counts(tenant_invitations, 'pending', 'accepted'),
+            'vendor_invitations': counts(vendor_invitations, 'pending', 'accepted'),
+            'leases_expiring': {f'{days}_days': tenant_invitations[f'expiring_{days}_count'] for days in EXPIRY_WINDOWS},
+            'monthly_rent': monthly_rent or 0,
+        }
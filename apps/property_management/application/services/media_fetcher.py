@@ -0,0 +1,130 @@
+import logging
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from urllib.parse import urlparse
+from uuid import uuid4
+
+import requests
+from django.conf import settings
+from django.core.files import File
+from requests.adapters import HTTPAdapter
+
+from common.constants import Error
+
+logger = logging.getLogger('django')
+
+ALLOWED_EXTENSIONS = {'.pdf', '.jpg', '.jpeg', '.png', '.docx'}
+EXTENSION_BY_CONTENT_TYPE = {
+    'application/pdf': '.pdf',
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
+}
+# downloads up to this size stay in memory, larger ones spill to a temporary file
+SPOOL_SIZE = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class MediaFetchError(Exception):
+    pass
+
+
+class MediaFetcher:
+    """
+    Downloads the photos and documents of a bulk import concurrently.
+
+    The downloads run on a pool of MEDIA_FETCH_WORKERS threads sharing one keep-alive session, with at most
+    MEDIA_FETCH_PER_HOST of them talking to the same host. Every request has the MEDIA_FETCH_TIMEOUT, and files larger
+    than MEDIA_FETCH_MAX_SIZE are refused, by their Content-Length up front or while streaming. ``fetch_all`` hands out
+    the files as they finish, so the caller uploads them to the storage while the other downloads go on.
+    """
+
+    def __init__(self):
+        self.workers = settings.MEDIA_FETCH_WORKERS
+        self.per_host = settings.MEDIA_FETCH_PER_HOST
+        self.timeout = settings.MEDIA_FETCH_TIMEOUT
+        self.max_size = settings.MEDIA_FETCH_MAX_SIZE
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.workers, pool_maxsize=self.workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._host_slots = defaultdict(lambda: threading.BoundedSemaphore(self.per_host))
+        self._host_slots_lock = threading.Lock()
+
+    def close(self):
+        self.session.close()
+
+    def fetch_all(self, urls):
+        """
+        Yield ``(url, file, error)`` once per distinct url as the downloads finish, ``file`` is a Django File or None
+        and ``error`` the reason it is None. The caller closes the files. Downloads are submitted as results are
+        consumed, so at most twice as many files as workers are held at a time.
+        """
+        urls = iter(dict.fromkeys(urls))
+        window = self.workers * 2
+        executor = ThreadPoolExecutor(self.workers, thread_name_prefix='media-fetch')
+        futures = {}
+        try:
+            while True:
+                for url in islice(urls, window - len(futures)):
+                    futures[executor.submit(self.fetch, url)] = url
+                if not futures:
+                    return
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = futures.pop(future)
+                    try:
+                        file = future.result()
+                    except Exception as e:
+                        logger.warning('Fetching %s failed: %s', url, e)
+                        yield url, None, str(e)
+                    else:
+                        yield url, file, None
+        finally:
+            # the consumer stopped early, drop what is queued and close what was downloaded
+            executor.shutdown(wait=True, cancel_futures=True)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    future.result().close()
+
+    def fetch(self, url):
+        path = urlparse(url).path
+        filename = os.path.basename(path)
+        extension = os.path.splitext(filename)[1].lower()
+        if extension and extension not in ALLOWED_EXTENSIONS:
+            raise MediaFetchError(Error.MEDIA_EXTENSION_NOT_ALLOWED.format(extension))
+
+        with self._host_slot(urlparse(url).netloc), self.session.get(url, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            if not extension:
+                content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+                if content_type not in EXTENSION_BY_CONTENT_TYPE:
+                    raise MediaFetchError(Error.MEDIA_TYPE_NOT_ALLOWED.format(content_type))
+                filename = f"document_{uuid4().hex[:8]}{EXTENSION_BY_CONTENT_TYPE[content_type]}"
+            if int(response.headers.get('Content-Length') or 0) > self.max_size:
+                raise MediaFetchError(Error.MEDIA_TOO_LARGE.format(self.max_size // (1024 * 1024)))
+
+            content = tempfile.SpooledTemporaryFile(SPOOL_SIZE)
+            try:
+                size = 0
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_size:
+                        raise MediaFetchError(Error.MEDIA_TOO_LARGE.format(self.max_size // (1024 * 1024)))
+                    content.write(chunk)
+            except BaseException:
+                content.close()
+                raise
+
+        content.seek(0)
+        return File(content, name=filename)
+
+    def _host_slot(self, host):
+        with self._host_slots_lock:
+            return self._host_slots[host]
@@ -0,0 +1,59 @@
+import hashlib
+from urllib.parse import urlencode
+
+from django.core.cache import cache
+from django.db import transaction
+
+from apps.property_management.infrastructure.models import CostFee, CostFeeCategory, Property
+
+
+class PropertyCache:
+    """
+    Cache-aside for the read-heavy property endpoints, keyed by view, user, object id and query string.
+
+    Every key contains the version of the property the data belongs to. Writes to any row of the property bump the
+    version after commit through the post_save/post_delete receivers connected in the app config, so entries built
+    before the write are never read again and simply expire. The versions live in the cache shared by all processes
+    (see CACHES), so a write by any of them, the unit import worker included, reaches the others.
+    """
+
+    TIMEOUT = 300
+
+    @staticmethod
+    def _version_key(property_id):
+        return f'property_version:{property_id}'
+
+    @classmethod
+    def get_version(cls, property_id):
+        return cache.get_or_set(cls._version_key(property_id), 1, timeout=None)
+
+    @classmethod
+    def bump(cls, property_id):
+        try:
+            cache.incr(cls._version_key(property_id))
+        except ValueError:
+            cache.set(cls._version_key(property_id), 2, timeout=None)
+
+    @classmethod
+    def model_changed(cls, sender, instance, **kwargs):
+        if isinstance(instance, Property):
+            property_id = instance.pk
+        elif isinstance(instance, CostFee):
+            # a fee deleted along with its category is covered by the category's own signal
+            property_id = CostFeeCategory.objects.filter(pk=instance.category_id).values_list('property_id', flat=True).first()
+        else:
+            property_id = instance.property_id
+        if property_id:
+            transaction.on_commit(lambda: cls.bump(property_id))
+
+    @classmethod
+    def get_or_build(cls, view_name, request, object_id, version, build):
+        """The cached data for the request, or the result of ``build()`` which is cached for the next one."""
+        query = urlencode(sorted(request.query_params.lists()), doseq=True)
+        query_hash = hashlib.sha1(query.encode()).hexdigest()
+        key = f'response:{view_name}:{request.user.pk}:{object_id}:{version}:{query_hash}'
+        data = cache.get(key)
+        if data is None:
+            data = build()
+            cache.set(key, data, cls.TIMEOUT)
+        return data
@@ -0,0 +1,135 @@
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, OuterRef, Q, Subquery, Sum
+
+from apps.property_management.infrastructure.models import Property, PropertyMetrics, RentDetail, Unit
+from apps.user_management.infrastructure.models import TenantInvitation
+from common.model_version import bump_model_version
+
+DAYS_PER_MONTH = 365.25 / 12
+# rents of occupied units, and the property's own rent if the property itself is occupied
+OCCUPIED_RENTS = Q(unit__status='occupied') | Q(unit__isnull=True, property__status='occupied')
+
+
+class PropertyMetricsService:
+    """
+    Maintains the PropertyMetrics rollup of every property, so the metrics endpoint reads one row.
+
+    Writes to a rent, unit, lease or the property itself refresh the rollup of that one property after commit, through
+    the post_save/post_delete receivers connected in the app config. Bulk writes don't send signals, code doing them
+    calls ``refresh`` itself. ``rebuild`` recomputes all rollups in chunks for backfills.
+    """
+
+    CHUNK_SIZE = 500
+
+    @classmethod
+    def model_changed(cls, sender, instance, **kwargs):
+        property_id = cls._property_id(instance)
+        if property_id:
+            transaction.on_commit(lambda: cls.refresh([property_id]))
+
+    @staticmethod
+    def _property_id(instance):
+        if isinstance(instance, Property):
+            return instance.pk
+        if isinstance(instance, TenantInvitation):
+            if instance.assignment_type == 'property':
+                return instance.assignment_id
+            return Unit.objects.filter(pk=instance.assignment_id).values_list('property_id', flat=True).first()
+        return instance.property_id
+
+    @classmethod
+    def refresh(cls, property_ids):
+        """Recompute and store the rollups of the given properties, ids of deleted properties are skipped."""
+        rows = cls._compute(property_ids)
+        if rows:
+            PropertyMetrics.objects.bulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=['property'],
+                update_fields=['rental_income', 'unit_count', 'occupied_unit_count', 'lease_count', 'lease_days', 'updated_at'],
+            )
+            bump_model_version(PropertyMetrics)
+
+    @classmethod
+    def rebuild(cls):
+        """Recompute the rollups of all properties, returns the number of properties"""
+        property_ids = iter(Property.objects.order_by('pk').values_list('pk', flat=True))
+        count = 0
+        while chunk := list(islice(property_ids, cls.CHUNK_SIZE)):
+            with transaction.atomic():
+                cls.refresh(chunk)
+            count += len(chunk)
+        return count
+
+    @classmethod
+    def get_metrics(cls, property_id):
+        metrics = PropertyMetrics.objects.filter(property=property_id).first()
+        if metrics is None:
+            # properties that weren't written since the rollups were introduced and not backfilled yet
+            cls.refresh([property_id])
+            metrics = PropertyMetrics.objects.get(property=property_id)
+
+        return {
+            'rental_income': metrics.rental_income,
+            'occupancy_rate': round(metrics.occupied_unit_count * 100 / metrics.unit_count, 2) if metrics.unit_count else '-',
+            'avg_lease_term': round(metrics.lease_days / metrics.lease_count / DAYS_PER_MONTH, 1) if metrics.lease_count else '-',
+            # tenants can't be rated yet
+            'avg_tenant_rating': '-',
+        }
+
+    @staticmethod
+    def _compute(property_ids):
+        statuses = dict(Property.objects.filter(pk__in=property_ids).values_list('pk', 'status'))
+        if not statuses:
+            return []
+
+        income = dict(
+            RentDetail.objects.filter(property__in=statuses)
+            .filter(OCCUPIED_RENTS)
+            .values('property')
+            .annotate(total=Sum('rent'))
+            .values_list('property', 'total')
+        )
+        units = {
+            row['property']: row
+            for row in Unit.objects.filter(property__in=statuses)
+            .values('property')
+            .annotate(total=Count('id'), occupied=Count('id', filter=Q(status='occupied')))
+        }
+
+        leases = {}
+        accepted = TenantInvitation.objects.filter(accepted=True, blocked=False, lease_end_date__gte=F('lease_start_date'))
+        unit_property = Unit.objects.filter(pk=OuterRef('assignment_id')).values('property_id')
+        for queryset in [
+            accepted.filter(assignment_type='property', assignment_id__in=statuses).annotate(property_id=F('assignment_id')),
+            accepted.filter(assignment_type='unit', assignment_id__in=Unit.objects.filter(property__in=statuses).values('id')).annotate(
+                property_id=Subquery(unit_property)
+            ),
+        ]:
+            for row in queryset.values('property_id').annotate(
+                count=Count('id'),
+                duration=Sum(ExpressionWrapper(F('lease_end_date') - F('lease_start_date'), output_field=DurationField())),
+            ):
+                count, days = leases.get(row['property_id'], (0, 0))
+                leases[row['property_id']] = (count + row['count'], days + row['duration'].days)
+
+        rows = []
+        for property_id, status in statuses.items():
+            if property_id in units:
+                unit_count, occupied_unit_count = units[property_id]['total'], units[property_id]['occupied']
+            else:
+                unit_count, occupied_unit_count = 1, int(status == 'occupied')
+            lease_count, lease_days = leases.get(property_id, (0, 0))
+            rows.append(
+                PropertyMetrics(
+                    property_id=property_id,
+                    rental_income=income.get(property_id) or 0,
+                    unit_count=unit_count,
+                    occupied_unit_count=occupied_unit_count,
+                    lease_count=lease_count,
+                    lease_days=lease_days,
+                )
+            )
+        return rows
@@ -0,0 +1,54 @@
+from collections import defaultdict
+
+from apps.property_management.infrastructure.models import (
+    CostFee,
+    CostFeeCategory,
+    PropertyAssignedAmenity,
+    PropertyDocument,
+    PropertyPhoto,
+    RentDetail,
+)
+
+
+class PropertySummaryLoader:
+    """
+    Loads everything the summary endpoints show for a property with one query per table and groups the rows by unit id.
+    Property level rows are grouped under ``None``. Pass ``unit_ids`` to only load the rows of those units.
+    """
+
+    def __init__(self, property_id, unit_ids=None):
+        self.rental_details = self._group(RentDetail.objects.filter(property=property_id), unit_ids)
+        self.amenities = self._group(PropertyAssignedAmenity.objects.filter(property=property_id).select_related('sub_amenity'), unit_ids)
+        self.cost_fee_categories = self._group(CostFeeCategory.objects.filter(property=property_id), unit_ids)
+        self.documents = self._group(PropertyDocument.objects.filter(property=property_id), unit_ids)
+        self.photos = self._group(PropertyPhoto.objects.filter(property=property_id), unit_ids)
+
+        category_ids = [category.id for categories in self.cost_fee_categories.values() for category in categories]
+        self.cost_fees = defaultdict(list)
+        for fee in CostFee.objects.filter(category__in=category_ids).order_by('pk'):
+            self.cost_fees[fee.category_id].append(fee)
+
+    @staticmethod
+    def _group(queryset, unit_ids):
+        if unit_ids is not None:
+            queryset = queryset.filter(unit__in=unit_ids)
+        grouped = defaultdict(list)
+        for row in queryset.order_by('pk'):
+            grouped[row.unit_id].append(row)
+        return grouped
+
+    def get_rental_details(self, unit_id):
+        rental_details = self.rental_details.get(unit_id)
+        return rental_details[0] if rental_details else None
+
+    def get_amenities(self, unit_id):
+        return self.amenities.get(unit_id, [])
+
+    def get_cost_fees(self, unit_id):
+        return [(category, self.cost_fees.get(category.id, [])) for category in self.cost_fee_categories.get(unit_id, [])]
+
+    def get_documents(self, unit_id):
+        return self.documents.get(unit_id, [])
+
+    def get_photos(self, unit_id):
+        return self.photos.get(unit_id, [])
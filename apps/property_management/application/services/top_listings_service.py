@@ -0,0 +1,118 @@
+import logging
+import math
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.property_management.application.services.view_counter import ViewCounter
+from apps.property_management.infrastructure.models import Property
+from apps.property_management.interface.serializers import PropertySerializer
+
+logger = logging.getLogger('django')
+
+
+class TopListingsService:
+    """
+    Keeps a precomputed snapshot of the top published listings in the cache, so reading it costs one cache lookup.
+
+    Listings are ranked by a score blending how recently they were published with how often they were viewed in the
+    last VIEWS_WINDOW_DAYS days. A background thread recomputes the snapshot every TOP_LISTINGS_REFRESH_INTERVAL
+    seconds and right after a listing is published, unpublished or edited while in the snapshot. A missing snapshot is
+    recomputed on read.
+    """
+
+    SNAPSHOT_KEY = 'top_listings:snapshot'
+    SIZE = 8
+    CANDIDATES = 200
+    RECENCY_HALF_LIFE_DAYS = 14
+    RECENCY_WEIGHT = 0.6
+    VIEWS_WEIGHT = 0.4
+    VIEWS_WINDOW_DAYS = 30
+    # shorter than S3Service.URL_REISSUE_MARGIN, the snapshot holds presigned photo urls. With a longer refresh
+    # interval the snapshot expires in between and is recomputed on read.
+    SNAPSHOT_TIMEOUT = 600
+
+    _wake = threading.Event()
+    _thread = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_snapshot(cls):
+        cls.start_refresher()
+        snapshot = cache.get(cls.SNAPSHOT_KEY)
+        if snapshot is None:
+            snapshot = cls.refresh()
+        return snapshot['results']
+
+    @classmethod
+    def refresh(cls):
+        now = timezone.now()
+        candidates = list(
+            Property.objects.filter(published=True)
+            .order_by(F('published_at').desc(nulls_last=True), '-created_at')
+            .values('id', 'published_at', 'created_at')[: cls.CANDIDATES]
+        )
+        views = cls._view_counts([candidate['id'] for candidate in candidates])
+        most_views = max(views.values(), default=0)
+        candidates.sort(
+            key=lambda candidate: cls.score(candidate['published_at'] or candidate['created_at'], views[candidate['id']], most_views, now),
+            reverse=True,
+        )
+
+        ids = [candidate['id'] for candidate in candidates[: cls.SIZE]]
+        properties = Property.objects.filter(id__in=ids).with_list_details().in_bulk()
+        snapshot = {
+            'ids': ids,
+            'results': PropertySerializer([properties[pk] for pk in ids if pk in properties], many=True).data,
+        }
+        cache.set(cls.SNAPSHOT_KEY, snapshot, cls.SNAPSHOT_TIMEOUT)
+        return snapshot
+
+    @classmethod
+    def score(cls, published_at, views, most_views, now):
+        age_days = max((now - published_at).total_seconds(), 0) / 86400
+        recency = 0.5 ** (age_days / cls.RECENCY_HALF_LIFE_DAYS)
+        popularity = math.log1p(views) / math.log1p(most_views) if most_views else 0
+        return cls.RECENCY_WEIGHT * recency + cls.VIEWS_WEIGHT * popularity
+
+    @classmethod
+    def _view_counts(cls, property_ids):
+        return ViewCounter.get_totals(property_ids, timezone.localdate() - timedelta(days=cls.VIEWS_WINDOW_DAYS))
+
+    @classmethod
+    def property_changed(cls, sender, instance, **kwargs):
+        """post_save/post_delete receiver, schedules a refresh when the change can affect the snapshot."""
+        snapshot = cache.get(cls.SNAPSHOT_KEY)
+        if instance.published or (snapshot and instance.id in snapshot['ids']):
+            transaction.on_commit(cls._invalidate)
+
+    @classmethod
+    def _invalidate(cls):
+        cache.delete(cls.SNAPSHOT_KEY)
+        cls._wake.set()
+
+    @classmethod
+    def start_refresher(cls):
+        if not settings.TOP_LISTINGS_REFRESH_INTERVAL or (cls._thread and cls._thread.is_alive()):
+            return
+        with cls._lock:
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._thread = threading.Thread(target=cls._run_refresher, name='top-listings-refresher', daemon=True)
+                cls._thread.start()
+
+    @classmethod
+    def _run_refresher(cls):
+        while True:
+            cls._wake.wait(settings.TOP_LISTINGS_REFRESH_INTERVAL)
+            cls._wake.clear()
+            try:
+                cls.refresh()
+            except Exception:
+                logger.exception('Refreshing the top listings failed')
+            finally:
+                close_old_connections()
@@ -0,0 +1,370 @@
+import logging
+from collections import defaultdict
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as ModelValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Lower, Replace
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from apps.property_management.application.services.dashboard_service import DashboardService
+from apps.property_management.application.services.media_fetcher import MediaFetcher
+from apps.property_management.application.services.property_cache import PropertyCache
+from apps.property_management.application.services.property_metrics_service import PropertyMetricsService
+from apps.property_management.infrastructure.models import (
+    Amenity,
+    CostFee,
+    CostFeeCategory,
+    PropertyAssignedAmenity,
+    PropertyDocument,
+    PropertyPhoto,
+    RentDetail,
+    Unit,
+    UnitImportJob,
+)
+from apps.property_management.interface.serializers import CostFeeSerializer, RentDetailSerializer, UnitSerializer
+from common.constants import Error
+from common.model_version import bump_model_version
+from common.utils import custom_exception_handler, snake_case, unsnake_case
+
+logger = logging.getLogger('django')
+
+
+class UnitImportService:
+    """
+    Bulk unit imports as background jobs. The upload validates the workbook and queues an UnitImportJob with its rows,
+    the ``process_unit_import_jobs`` worker claims the oldest pending job and runs it in three stages:
+
+    - the rows of CHUNK_SIZE units are validated in memory and inserted with one bulk insert per table, inside a
+      savepoint per chunk. If the chunk fails in the database, its units are inserted again one by one so only the
+      failing ones are rolled back.
+    - the photos and documents of the created units are downloaded concurrently through MediaFetcher, stored as they
+      finish and inserted in bulk.
+    - the created units get their final page and are published with one update per chunk.
+
+    Bulk writes don't send signals, the caches and rollups the receivers keep are invalidated after every stage. The
+    progress and the errors of every unit are stored on the job as it goes, so the status endpoint can report them.
+    Saving the progress also marks the job as alive, jobs without progress for UNIT_IMPORT_JOB_LEASE seconds are failed.
+    """
+
+    CHUNK_SIZE = 200
+
+    @staticmethod
+    def unit_sheet(property_instance):
+        return 'room_details' if property_instance.property_type == 'university_housing' else 'unit_info'
+
+    @staticmethod
+    def check_unit_limit(property_instance, number_of_units_to_add):
+        total_units_allowed = int(property_instance.listing_info.number_of_units or 0)
+        existing_units_number = property_instance.unit_property.count()
+        if total_units_allowed < (number_of_units_to_add + existing_units_number):
+            raise ValidationError(Error.NUMBER_OF_UNITS_MISMATCH.format(total_units_allowed, existing_units_number, number_of_units_to_add))
+
+    @classmethod
+    def enqueue(cls, property_instance, data, user):
+        total_units = len(data[cls.unit_sheet(property_instance)])
+        cls.check_unit_limit(property_instance, total_units)
+        return UnitImportJob.objects.create(property=property_instance, created_by=user, data=data, total_units=total_units)
+
+    @classmethod
+    def claim_next(cls):
+        """Mark the oldest pending job as processing and return it, workers running side by side skip each other's job"""
+        cls.fail_stopped()
+        with transaction.atomic():
+            job = UnitImportJob.objects.select_for_update(skip_locked=True).filter(status='pending').order_by('created_at', 'id').first()
+            if job is not None:
+                job.status, job.started_at = 'processing', timezone.now()
+                job.save(update_fields=['status', 'started_at', 'updated_at'])
+        return job
+
+    @staticmethod
+    def fail_stopped():
+        """
+        Fail the processing jobs whose worker stopped, they would report their progress forever. They aren't run again,
+        the units they created are kept and importing them a second time would duplicate them.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            stopped = UnitImportJob.objects.select_for_update(skip_locked=True).filter(
+                status='processing', updated_at__lt=now - timedelta(seconds=settings.UNIT_IMPORT_JOB_LEASE)
+            )
+            for job in stopped:
+                logger.warning('Unit import %s stopped, last progress at %s', job.pk, job.updated_at)
+                job.status, job.error = 'failed', Error.UNIT_IMPORT_STOPPED.format(job.units_created)
+                job.data, job.finished_at = None, now
+                job.save()
+
+    @classmethod
+    def run(cls, job):
+        try:
+            cls._import_units(job)
+        except Exception as e:
+            logger.exception('Unit import %s failed', job.pk)
+            job.status, job.error = 'failed', cls._error_message(e)
+        else:
+            job.status = 'completed'
+        job.data, job.finished_at = None, timezone.now()
+        job.save()
+        return job
+
+    @classmethod
+    def _import_units(cls, job):
+        property_instance = job.property
+        # units may have been added since the upload, or by another import of the property
+        cls.check_unit_limit(property_instance, len(job.data[cls.unit_sheet(property_instance)]))
+
+        units = cls._create_units(job, property_instance)
+        cls._import_media(job, property_instance, units)
+
+        published_at = timezone.now()
+        unit_ids = iter([unit.pk for unit in units.values()])
+        while chunk := list(islice(unit_ids, cls.CHUNK_SIZE)):
+            Unit.objects.filter(pk__in=chunk).update(page_saved=5, published=True, published_at=published_at)
+        cls._bulk_written(property_instance, Unit)
+
+    @classmethod
+    def _create_units(cls, job, property_instance):
+        """Insert the units with their rent, amenities and cost fees chunk by chunk, returns the created units by key"""
+        data = job.data
+        amenity_ids = cls._amenity_ids(data['amenities'])
+        # building the fields of a serializer costs more than validating a row, each is built once per job
+        serializers = {
+            'unit': cls._field_validator(UnitSerializer, 'property'),
+            'rent': cls._field_validator(RentDetailSerializer, 'property', 'unit', 'page_saved'),
+            'cost_fee': cls._field_validator(CostFeeSerializer, 'category'),
+        }
+        created = {}
+        units = iter(data[cls.unit_sheet(property_instance)].items())
+        while chunk := list(islice(units, cls.CHUNK_SIZE)):
+            plans = [cls._plan_unit(property_instance, unit_key, rows[0], data, amenity_ids, serializers) for unit_key, rows in chunk]
+            valid = [plan for plan in plans if plan['unit'] is not None]
+            try:
+                with transaction.atomic():
+                    cls._insert(property_instance, valid)
+            except DatabaseError:
+                logger.warning('Unit import %s inserts a chunk unit by unit', job.pk, exc_info=True)
+                for plan in valid:
+                    try:
+                        with transaction.atomic():
+                            cls._insert(property_instance, [plan])
+                    except DatabaseError as e:
+                        plan['errors'].append(cls._error_message(e))
+                        plan['unit'] = None
+
+            for plan in plans:
+                if plan['errors']:
+                    job.unit_errors[unsnake_case(plan['key'])] = plan['errors']
+                if plan['unit'] is not None:
+                    created[plan['key']] = plan['unit']
+                    job.units_created += 1
+                else:
+                    job.units_failed += 1
+            job.processed_units += len(plans)
+            job.save(update_fields=['processed_units', 'units_created', 'units_failed', 'unit_errors', 'updated_at'])
+            cls._bulk_written(property_instance, Unit, RentDetail)
+        return created
+
+    @staticmethod
+    def _amenity_ids(amenities):
+        """The ids of the amenities by snake_case name, for all the names in the sheet with one query"""
+        names = {snake_case(name.strip()) for rows in amenities.values() for name in (rows[0].get('sub_amenities') or '').split(',')}
+        amenity_ids = defaultdict(list)
+        for item in (
+            Amenity.objects.annotate(normalized_sub=Lower(Replace(F("sub_amenity"), Value(" "), Value("_"))))
+            .filter(normalized_sub__in=names)
+            .values("id", "normalized_sub")
+        ):
+            amenity_ids[item['normalized_sub']].append(item['id'])
+        return amenity_ids
+
+    @classmethod
+    def _plan_unit(cls, property_instance, unit_key, obj, data, amenity_ids, serializers):
+        """
+        Validate the rows of one unit without touching the database: the unsaved unit, None if its row is invalid,
+        with the validated rent and cost fees, the amenity ids and the errors of the unit. The serializers only check
+        the fields and the rent terms, the relations are set when the rows are inserted. Their checks for existing rents
+        and fees can't fail for a unit that doesn't exist yet, duplicate fees within the unit are caught here instead.
+        """
+        plan = {'key': unit_key, 'unit': None, 'rent': None, 'fees': defaultdict(list), 'amenity_ids': [], 'errors': []}
+        errors = plan['errors']
+        try:
+            unit_instance = UnitSerializer.csv_build(property_instance, serializers['unit'].to_internal_value(obj))
+        except ValidationError as e:
+            errors.append(cls._error_message(e))
+            return plan
+        unit_instance.csv_upload = True
+
+        rent_details = data['rent_details'].get(unit_key)
+        if rent_details:
+            try:
+                rent = serializers['rent'].to_internal_value(rent_details[0])
+                RentDetailSerializer.validate_terms(rent)
+                plan['rent'] = rent
+            except ValidationError as e:
+                errors.append(cls._error_message(e))
+        else:
+            errors.append("Rent details were not found in the file. Edit the unit from Inactive units tab.")
+
+        amenities = data['amenities'].get(unit_key)
+        if amenities:
+            amenities_list = snake_case([amenity.strip() for amenity in (amenities[0].get('sub_amenities') or '').split(',')])
+            plan['amenity_ids'] = [amenity_id for name in dict.fromkeys(amenities_list) for amenity_id in amenity_ids.get(name, [])]
+            unit_instance.other_amenities = [amenity for amenity in amenities_list if amenity not in amenity_ids]
+        else:
+            errors.append("Amenities were not found in the file. Edit the unit from Inactive units tab.")
+
+        cost_fee_detail = data['cost_fee'].get(unit_key)
+        if cost_fee_detail:
+            for cost in cost_fee_detail:
+                try:
+                    if not cost.get('category_name'):
+                        raise ValidationError({'category_name': ['This field is required.']})
+                    fee = serializers['cost_fee'].to_internal_value(cost)
+                except ValidationError as e:
+                    errors.append(cls._error_message(e))
+                    continue
+                fees = plan['fees'][cost['category_name']]
+                if any(existing['fee_name'] == fee['fee_name'] for existing in fees):
+                    errors.append(Error.COST_FEE_EXISTS)
+                    continue
+                fees.append(fee)
+        else:
+            errors.append("Cost fee was not found in the file. Edit the unit from Inactive units tab.")
+
+        plan['unit'] = unit_instance
+        return plan
+
+    @staticmethod
+    def _field_validator(serializer_class, *relations):
+        """A serializer whose ``to_internal_value`` runs the field level validation, without the given relations"""
+        serializer = serializer_class()
+        for name in relations:
+            del serializer.fields[name]
+        return serializer
+
+    @staticmethod
+    def _insert(property_instance, plans):
+        units = [plan['unit'] for plan in plans]
+        for unit in units:
+            # a chunk that failed is inserted again unit by unit
+            unit.pk = None
+        Unit.objects.bulk_create(units)
+        RentDetail.objects.bulk_create(
+            RentDetail(property=property_instance, unit=plan['unit'], **plan['rent']) for plan in plans if plan['rent']
+        )
+
+        categories = {
+            (plan['key'], category_name): CostFeeCategory(property=property_instance, unit=plan['unit'], category_name=category_name)
+            for plan in plans
+            for category_name in plan['fees']
+        }
+        CostFeeCategory.objects.bulk_create(categories.values())
+        CostFee.objects.bulk_create(
+            CostFee(category=categories[plan['key'], category_name], **fee)
+            for plan in plans
+            for category_name, fees in plan['fees'].items()
+            for fee in fees
+        )
+        PropertyAssignedAmenity.objects.bulk_create(
+            PropertyAssignedAmenity(property=property_instance, unit=plan['unit'], sub_amenity_id=amenity_id)
+            for plan in plans
+            for amenity_id in plan['amenity_ids']
+        )
+
+    @classmethod
+    def _import_media(cls, job, property_instance, units):
+        """Download the photos and documents of the created units, each file is stored as soon as it is downloaded"""
+        data, by_url = job.data, defaultdict(list)
+        for unit_key, unit in units.items():
+            for photo in data['photos'].get(unit_key, []):
+                if cls._is_url(photo.get('photo')):
+                    by_url[photo['photo']].append((unit_key, PropertyPhoto(property=property_instance, unit=unit)))
+            for document in data['document'].get(unit_key, []):
+                if cls._is_url(document.get('documents')):
+                    try:
+                        by_url[document['documents']].append((unit_key, cls._document(property_instance, unit, document)))
+                    except ValidationError as e:
+                        job.unit_errors.setdefault(unsnake_case(unit_key), []).append(cls._error_message(e))
+        job.media_total = len(by_url)
+        job.save(update_fields=['media_total', 'unit_errors', 'updated_at'])
+
+        stored = []
+        fetcher = MediaFetcher()
+        try:
+            for url, file, download_error in fetcher.fetch_all(by_url):
+                for unit_key, media in by_url[url]:
+                    kind = 'photo' if isinstance(media, PropertyPhoto) else 'document'
+                    error = f"Error downloading {kind}: {download_error}" if download_error else cls._store(media, kind, file)
+                    if error:
+                        job.unit_errors.setdefault(unsnake_case(unit_key), []).append(error)
+                    else:
+                        stored.append(media)
+                if file:
+                    file.close()
+                if len(stored) >= cls.CHUNK_SIZE:
+                    cls._insert_media(property_instance, stored)
+                    stored = []
+                job.media_processed += 1
+                job.save(update_fields=['media_processed', 'unit_errors', 'updated_at'])
+        finally:
+            fetcher.close()
+            # the files of these rows are uploaded already
+            cls._insert_media(property_instance, stored)
+
+    @staticmethod
+    def _document(property_instance, unit, row):
+        document = PropertyDocument(
+            property=property_instance,
+            unit=unit,
+            **{field: row[field] for field in ('title', 'visibility', 'document_type') if row.get(field) is not None},
+        )
+        try:
+            document.clean_fields(exclude=['property', 'unit', 'document'])
+        except ModelValidationError as e:
+            raise ValidationError(e.message_dict)
+        return document
+
+    @staticmethod
+    def _store(media, kind, file):
+        """Upload a downloaded photo or document to the storage, returns the error if it failed"""
+        # units sharing a url share the download
+        file.seek(0)
+        try:
+            (media.photo if kind == 'photo' else media.document).save(file.name, file, save=False)
+        except Exception as e:
+            logger.exception('Storing the %s of unit %s failed', kind, media.unit_id)
+            return f"Error uploading {kind}: {str(e)}"
+        return None
+
+    @classmethod
+    def _insert_media(cls, property_instance, media):
+        if not media:
+            return
+        PropertyPhoto.objects.bulk_create(item for item in media if isinstance(item, PropertyPhoto))
+        PropertyDocument.objects.bulk_create(item for item in media if isinstance(item, PropertyDocument))
+        cls._bulk_written(property_instance, PropertyPhoto, PropertyDocument)
+
+    @staticmethod
+    def _bulk_written(property_instance, *models):
+        """Bulk writes don't send signals, do after commit what the receivers connected in the app config would do"""
+
+        def invalidate():
+            for model in models:
+                bump_model_version(model)
+            PropertyCache.bump(property_instance.pk)
+            DashboardService.bump(property_instance.property_owner_id)
+            PropertyMetricsService.refresh([property_instance.pk])
+
+        transaction.on_commit(invalidate)
+
+    @staticmethod
+    def _is_url(value):
+        return isinstance(value, str) and (value.startswith('http://') or value.startswith('https://'))
+
+    @staticmethod
+    def _error_message(exc):
+        return custom_exception_handler(exc, {}).data.get('error')
@@ -0,0 +1,131 @@
+from collections import defaultdict
+from itertools import zip_longest
+from operator import itemgetter
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from apps.property_management.utils import COLUMN_CONFIG, xlsx_sheet_names
+from common.constants import Error
+from common.exceptions import CustomValidationError
+from common.utils import snake_case, str_to_bool
+
+COLLAPSED_FIELDS = {target_field for config in COLUMN_CONFIG.values() for target_field, _ in config['fields'].values()}
+
+
+class UnitWorkbookReader:
+    """
+    Reads a bulk unit import workbook in one pass per sheet.
+
+    The workbook is opened in openpyxl's read-only mode straight from the upload, which Django spools to a temporary
+    file for large uploads, so rows are streamed from the file instead of loading every sheet into memory. Each sheet
+    is turned into ``{unit_key: [row, ...]}`` with the columns renamed as in ``xlsx_sheet_names``, keyed like
+    ``snake_case(sheet_name)``. Sheets with COLUMN_CONFIG transformations are collected into a frame first, so those run
+    once per column rather than once per cell, the other sheets go straight into row dicts.
+    """
+
+    def __init__(self, file, key):
+        self.file = file
+        self.key = key
+        self.sheets = xlsx_sheet_names[key]
+        if key == 'university_housing':
+            self.number_column, self.unit_sheet = 'Room Number', 'Room Details'
+        else:
+            self.number_column, self.unit_sheet = 'Unit Number', 'Unit Info'
+
+    def read(self):
+        path = self.file.temporary_file_path() if hasattr(self.file, 'temporary_file_path') else self.file
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            missing_sheets = set(self.sheets) - set(workbook.sheetnames)
+            if missing_sheets:
+                raise CustomValidationError(f"Missing sheets: {', '.join(missing_sheets)}")
+
+            all_data = {}
+            for sheet_name, expected_columns in self.sheets.items():
+                try:
+                    all_data[snake_case(sheet_name)] = self.read_sheet(workbook[sheet_name], expected_columns)
+                except Exception as e:
+                    raise CustomValidationError(f"Error in sheet {sheet_name}: {str(e)}")
+        finally:
+            workbook.close()
+
+        units_without_photos = set(all_data[snake_case(self.unit_sheet)]) - set(all_data['photos'])
+        if units_without_photos:
+            numbers = sorted(str(row['number']) for key in units_without_photos for row in all_data[snake_case(self.unit_sheet)][key])
+            raise CustomValidationError(f"Error in sheet {self.unit_sheet}: " + Error.PHOTO_REQUIRED_FOR_UNIT.format(', '.join(numbers)))
+        return all_data
+
+    def read_sheet(self, worksheet, expected_columns):
+        rows = worksheet.iter_rows(values_only=True)
+        header = [column.strip() if isinstance(column, str) else column for column in next(rows, ())]
+        return self.build_sheet(worksheet.title, header, rows, expected_columns)
+
+    def build_sheet(self, sheet_name, header, rows, expected_columns):
+        missing_cols = set(expected_columns) - set(header)
+        if missing_cols:
+            raise CustomValidationError(f"Missing columns in {sheet_name}: {', '.join(missing_cols)}")
+
+        section = snake_case(sheet_name)
+        columns = [(expected_columns[column], index) for index, column in enumerate(header) if column in expected_columns]
+        if section not in COLUMN_CONFIG:
+            # nothing to transform, the rows go straight into dicts
+            fields, values_of = [field for field, _ in columns], itemgetter(*(index for _, index in columns))
+            # read-only mode gives short rows when the sheet has no dimension, the missing cells are empty
+            width = max(index for _, index in columns) + 1
+            sheet_data = defaultdict(list)
+            for row in rows:
+                if len(row) < width:
+                    row = (*row, *(None,) * (width - len(row)))
+                values = values_of(row)
+                if values.count(None) < len(values):
+                    row = dict(zip(fields, values))
+                    sheet_data[snake_case(str(row['number']))].append(row)
+            return dict(sheet_data)
+
+        cells = list(zip_longest(*rows))
+        empty = (None,) * (len(cells[0]) if cells else 0)
+        # one object block keeps the cell values as they are, empty cells stay None instead of turning the column to NaN
+        matrix = np.array([cells[index] if index < len(cells) else empty for _, index in columns], dtype=object)
+        frame = pd.DataFrame(matrix.T, columns=[field for field, _ in columns])
+        frame = frame[frame.notna().to_numpy().any(axis=1)]
+        return self.to_units(self.normalize(section, frame))
+
+    @staticmethod
+    def normalize(section, frame):
+        """Collapse the one-hot boolean columns of COLUMN_CONFIG into their target columns, the last true column wins."""
+        fields = {field: target for field, target in COLUMN_CONFIG.get(section, {}).get('fields', {}).items() if field in frame}
+        if not fields:
+            return frame
+
+        conditions = defaultdict(list)
+        for field, (target_field, target_value) in fields.items():
+            # a column holds a handful of distinct values, str_to_bool only runs on those
+            column = frame[field]
+            is_true = column.isin([value for value in column.unique() if str_to_bool(value)]).to_numpy()
+            conditions[target_field].append((is_true, target_value))
+        # np.select takes the first match, so the columns are reversed for the last true one to win
+        targets = {
+            target_field: np.select([is_true for is_true, _ in reversed(pairs)], [value for _, value in reversed(pairs)], default=None)
+            for target_field, pairs in conditions.items()
+        }
+        return frame.drop(columns=list(fields)).assign(**targets)
+
+    @staticmethod
+    def to_units(frame):
+        """``{unit_key: [row, ...]}``, collapsed fields without a true column are left out of the row like before."""
+        keys = frame['number'].astype(str).str.lower().str.replace(' ', '_', regex=False)
+        missing = frame[[column for column in frame.columns if column in COLLAPSED_FIELDS]].isna()
+        frame = frame.drop(columns=missing.columns[missing.all()])
+        partially_missing = [column for column in missing.columns[missing.any() & ~missing.all()]]
+
+        columns = list(frame.columns)
+        sheet_data = defaultdict(list)
+        for key, values in zip(keys, frame.itertuples(index=False, name=None)):
+            row = dict(zip(columns, values))
+            for column in partially_missing:
+                if row[column] is None:
+                    del row[column]
+            sheet_data[key].append(row)
+        return dict(sheet_data)
@@ -0,0 +1,132 @@
+import atexit
+import logging
+import threading
+from collections import Counter
+from itertools import islice
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from apps.property_management.infrastructure.models import ListingViewCount, Property, Unit
+
+logger = logging.getLogger('django')
+
+_UPSERT = (
+    'INSERT INTO {table} (property_id, unit_id, date, views) VALUES {values} '
+    'ON CONFLICT ({conflict}) WHERE {predicate} DO UPDATE SET views = {table}.views + EXCLUDED.views'
+)
+
+
+class ViewCounter:
+    """
+    Buffers listing views in process and writes them behind into the daily ListingViewCount rows.
+
+    Views are summed per (property, unit, day) in memory. A background thread flushes them every
+    VIEW_COUNTER_FLUSH_INTERVAL seconds, or as soon as VIEW_COUNTER_MAX_PENDING rows are pending, with one batched
+    upsert per kind of row, so a popular listing costs one row update per flush instead of one per view. Pending
+    views are flushed on interpreter exit as well.
+    """
+
+    BATCH_SIZE = 1000
+
+    _pending = Counter()
+    _lock = threading.Lock()
+    _wake = threading.Event()
+    _thread = None
+
+    @classmethod
+    def record(cls, property_id, unit_id=None):
+        with cls._lock:
+            cls._pending[(property_id, unit_id, timezone.localdate())] += 1
+            size = len(cls._pending)
+        if size >= settings.VIEW_COUNTER_MAX_PENDING:
+            cls._wake.set()
+        cls.start_flusher()
+
+    @classmethod
+    def flush(cls):
+        with cls._lock:
+            pending, cls._pending = cls._pending, Counter()
+        if not pending:
+            return
+        try:
+            # listings deleted since they were viewed are dropped
+            property_ids = set(Property.objects.filter(id__in={key[0] for key in pending}).values_list('id', flat=True))
+            unit_ids = set(Unit.objects.filter(id__in={key[1] for key in pending if key[1]}).values_list('id', flat=True))
+            rows = [(key, views) for key, views in pending.items() if key[0] in property_ids and key[1] in unit_ids | {None}]
+            with transaction.atomic():
+                cls._upsert([row for row in rows if row[0][1] is None], 'property_id, date', 'unit_id IS NULL')
+                cls._upsert([row for row in rows if row[0][1] is not None], 'unit_id, date', 'unit_id IS NOT NULL')
+        except Exception:
+            # keep the views for the next flush instead of losing them
+            with cls._lock:
+                cls._pending.update(pending)
+            raise
+
+    @classmethod
+    def _upsert(cls, rows, conflict, predicate):
+        rows = iter(rows)
+        table = connection.ops.quote_name(ListingViewCount._meta.db_table)
+        with connection.cursor() as cursor:
+            while batch := list(islice(rows, cls.BATCH_SIZE)):
+                values = ', '.join(['(%s, %s, %s, %s)'] * len(batch))
+                params = [value for (property_id, unit_id, day), views in batch for value in (property_id, unit_id, day, views)]
+                cursor.execute(_UPSERT.format(table=table, values=values, conflict=conflict, predicate=predicate), params)
+
+    @staticmethod
+    def get_totals(property_ids, since):
+        """Views of each property since the given day, its units' views included."""
+        rows = (
+            ListingViewCount.objects.filter(property__in=property_ids, date__gte=since)
+            .values('property')
+            .annotate(total=Sum('views'))
+            .values_list('property', 'total')
+        )
+        return {**dict.fromkeys(property_ids, 0), **dict(rows)}
+
+    @staticmethod
+    def get_stats(property_id, since):
+        """Daily views of a property since the given day and the views of each of its units."""
+        counts = ListingViewCount.objects.filter(property=property_id, date__gte=since)
+        daily = list(counts.values('date').annotate(views=Sum('views')).order_by('date'))
+        units = counts.filter(unit__isnull=False).values('unit', 'unit__number').annotate(views=Sum('views')).order_by('-views', 'unit')
+        return {
+            'since': since.strftime('%Y-%m-%d'),
+            'total': sum(day['views'] for day in daily),
+            'property_views': sum(counts.filter(unit__isnull=True).values_list('views', flat=True)),
+            'daily': [{'date': day['date'].strftime('%Y-%m-%d'), 'views': day['views']} for day in daily],
+            'units': [{'id': unit['unit'], 'number': unit['unit__number'], 'views': unit['views']} for unit in units],
+        }
+
+    @classmethod
+    def start_flusher(cls):
+        if not settings.VIEW_COUNTER_FLUSH_INTERVAL or (cls._thread and cls._thread.is_alive()):
+            return
+        with cls._lock:
+            if cls._thread is None or not cls._thread.is_alive():
+                cls._thread = threading.Thread(target=cls._run_flusher, name='view-counter-flusher', daemon=True)
+                cls._thread.start()
+
+    @classmethod
+    def _run_flusher(cls):
+        while True:
+            cls._wake.wait(settings.VIEW_COUNTER_FLUSH_INTERVAL)
+            cls._wake.clear()
+            try:
+                cls.flush()
+            except Exception:
+                logger.exception('Flushing the listing view counters failed')
+            finally:
+                close_old_connections()
+
+    @classmethod
+    def flush_on_exit(cls):
+        try:
+            cls.flush()
+        except Exception:
+            logger.exception('Flushing the listing view counters on exit failed')
+
+
+atexit.register(ViewCounter.flush_on_exit)
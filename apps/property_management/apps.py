@@ -4,3 +4,72 @@ from django.apps import AppConfig
 class PropertyManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.property_management"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from apps.property_management.application.services.dashboard_service import DashboardService
+        from apps.property_management.application.services.property_cache import PropertyCache
+        from apps.property_management.application.services.property_metrics_service import PropertyMetricsService
+        from apps.property_management.application.services.top_listings_service import TopListingsService
+        from apps.property_management.infrastructure.models import (
+            Amenity,
+            CalendarSlot,
+            CostFee,
+            CostFeeCategory,
+            ListingInfo,
+            OwnerInfo,
+            Property,
+            PropertyAssignedAmenity,
+            PropertyDocument,
+            PropertyPhoto,
+            PropertyTypeAndAmenity,
+            RentDetail,
+            Unit,
+        )
+        from apps.user_management.infrastructure.models import TenantInvitation, VendorInvitation
+        from common.model_version import bump_model_version
+
+        # cached counts, responses and ETags are keyed on these versions
+        for model in (
+            Property,
+            Unit,
+            PropertyDocument,
+            ListingInfo,
+            PropertyPhoto,
+            PropertyTypeAndAmenity,
+            Amenity,
+            RentDetail,
+            CalendarSlot,
+        ):
+            post_save.connect(bump_model_version, sender=model)
+            post_delete.connect(bump_model_version, sender=model)
+
+        post_save.connect(TopListingsService.property_changed, sender=Property)
+        post_delete.connect(TopListingsService.property_changed, sender=Property)
+
+        # per property versions of the cached summary, amenity and cost fee responses
+        for model in (
+            Property,
+            Unit,
+            RentDetail,
+            CostFee,
+            CostFeeCategory,
+            PropertyAssignedAmenity,
+            PropertyDocument,
+            PropertyPhoto,
+            ListingInfo,
+            OwnerInfo,
+        ):
+            post_save.connect(PropertyCache.model_changed, sender=model)
+            post_delete.connect(PropertyCache.model_changed, sender=model)
+
+        # rollups behind the metrics endpoint
+        for model in (Property, Unit, RentDetail, TenantInvitation):
+            post_save.connect(PropertyMetricsService.model_changed, sender=model)
+            post_delete.connect(PropertyMetricsService.model_changed, sender=model)
+
+        # per owner versions of the cached dashboard
+        for model in (Property, Unit, RentDetail, TenantInvitation, VendorInvitation):
+            post_save.connect(DashboardService.model_changed, sender=model)
+            post_delete.connect(DashboardService.model_changed, sender=model)
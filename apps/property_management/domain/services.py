@@ -0,0 +1,67 @@
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+from .value_objects import ONE_DAY, DateRange
+
+_start = attrgetter('start_date')
+_end = attrgetter('end_date')
+
+
+class DateRangeIndex:
+    """
+    Sorted, non overlapping date ranges of one calendar.
+
+    Because the ranges never overlap their ends are sorted as well, so overlap lookups are two bisections. Adding a range
+    overrides whatever it covers and merges it with touching ranges of the same status and reason.
+    """
+
+    def __init__(self, ranges=()):
+        self._ranges = []
+        for date_range in sorted(ranges, key=_start):
+            self.add(date_range)
+
+    def __iter__(self):
+        return iter(self._ranges)
+
+    def __len__(self):
+        return len(self._ranges)
+
+    def _bounds(self, start_date, end_date):
+        return bisect_left(self._ranges, start_date, key=_end), bisect_right(self._ranges, end_date, key=_start)
+
+    def overlapping(self, start_date, end_date):
+        low, high = self._bounds(start_date, end_date)
+        return self._ranges[low:high]
+
+    def at(self, day):
+        ranges = self.overlapping(day, day)
+        return ranges[0] if ranges else None
+
+    def add(self, new_range: DateRange):
+        low, high = self._bounds(new_range.start_date - ONE_DAY, new_range.end_date + ONE_DAY)
+        kept = []
+        merged = new_range
+        for date_range in self._ranges[low:high]:
+            if date_range.same_kind(new_range):
+                merged = merged.union(date_range)
+            else:
+                kept.extend(date_range.without(new_range.start_date, new_range.end_date))
+        self._ranges[low:high] = sorted([*kept, merged], key=_start)
+
+    def remove(self, start_date, end_date):
+        low, high = self._bounds(start_date, end_date)
+        kept = []
+        for date_range in self._ranges[low:high]:
+            kept.extend(date_range.without(start_date, end_date))
+        self._ranges[low:high] = kept
+
+    def days(self, start_date, end_date):
+        """Yield every day from start_date to end_date with the range covering it, or None."""
+        ranges = iter(self.overlapping(start_date, end_date))
+        current = next(ranges, None)
+        day = start_date
+        while day <= end_date:
+            while current and current.end_date < day:
+                current = next(ranges, None)
+            yield day, current if current and current.start_date <= day else None
+            day += ONE_DAY
@@ -0,0 +1,40 @@
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+
+ONE_DAY = timedelta(days=1)
+
+
+@dataclass(frozen=True)
+class DateRange:
+    """An inclusive range of calendar days, ``slot_id`` links it to the CalendarSlot row it was loaded from."""
+
+    start_date: date
+    end_date: date
+    reason: str | None = None
+    status: str = 'unavailable'
+    slot_id: int | None = None
+
+    def touches(self, other):
+        """True if the ranges overlap or one starts the day after the other ends."""
+        return self.start_date <= other.end_date + ONE_DAY and other.start_date <= self.end_date + ONE_DAY
+
+    def same_kind(self, other):
+        return self.status == other.status and self.reason == other.reason
+
+    def union(self, other):
+        return replace(
+            self,
+            start_date=min(self.start_date, other.start_date),
+            end_date=max(self.end_date, other.end_date),
+            slot_id=self.slot_id or other.slot_id,
+        )
+
+    def without(self, start_date, end_date):
+        """The parts of the range that lie outside start_date..end_date, the first part keeps the slot id."""
+        parts = []
+        if self.start_date < start_date:
+            parts.append(replace(self, end_date=min(self.end_date, start_date - ONE_DAY)))
+        if self.end_date > end_date:
+            slot_id = None if parts else self.slot_id
+            parts.append(replace(self, start_date=max(self.start_date, end_date + ONE_DAY), slot_id=slot_id))
+        return parts
@@ -2,6 +2,7 @@ import django_filters
 from django.db.models import Q
 
 from apps.property_management.infrastructure.models import Unit
+from apps.property_management.infrastructure.search import keyword_search
 
 
 class DocumentFilter(django_filters.FilterSet):
@@ -12,6 +13,4 @@ class DocumentFilter(django_filters.FilterSet):
         fields = ['q']
 
     def filter_q(self, queryset, name, value):
-        return queryset.filter(
-            Q(title__icontains=value) | Q(document_type__icontains=value) | Q(visibility__icontains=value) | Q(created_at__icontains=value)
-        )
+        return keyword_search(queryset, value, extra=Q(created_at__icontains=value))
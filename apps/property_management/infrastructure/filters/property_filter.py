@@ -1,7 +1,8 @@
 import django_filters
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef
 
-from apps.property_management.infrastructure.models import Property
+from apps.property_management.infrastructure.models import CalendarSlot, Property
+from apps.property_management.infrastructure.search import keyword_search
 
 
 class PropertyFilter(django_filters.FilterSet):
@@ -10,7 +11,7 @@ class PropertyFilter(django_filters.FilterSet):
     status = django_filters.CharFilter(field_name='status', lookup_expr='exact')
     property_type = django_filters.CharFilter(field_name='property_type', lookup_expr='exact')
     rental_type = django_filters.CharFilter(field_name='property_rent_details__rental_type', lookup_expr='exact')
-    availability_date = django_filters.CharFilter(field_name='property_slots__date', lookup_expr='exact', method='filter_availability_date')
+    availability_date = django_filters.CharFilter(field_name='property_slots__start_date', method='filter_availability_date')
     number_of_units = django_filters.CharFilter(field_name='property_photos__unit', lookup_expr='exact', method='filter_availability_date')
     unit_count = django_filters.RangeFilter(method='filter_unit_count', label='Unit count range')
     q = django_filters.CharFilter(method='filter_q', label='Keyword search')
@@ -21,9 +22,10 @@ class PropertyFilter(django_filters.FilterSet):
 
     def filter_availability_date(self, queryset, name, value):
         """Because unavailable dates stored in table, so while filtering for an available date exclude those
-        properties which are having that date as unavailable in table."""
+        properties which are having a range covering that date in table."""
         if value:
-            return queryset.exclude(property_slots__date=value)
+            unavailable = CalendarSlot.objects.filter(property=OuterRef('pk'), start_date__lte=value, end_date__gte=value)
+            return queryset.exclude(Exists(unavailable))
         return queryset
 
     def filter_unit_count(self, queryset, name, value):
@@ -46,6 +48,4 @@ class PropertyFilter(django_filters.FilterSet):
         return qs
 
     def filter_q(self, queryset, name, value):
-        return queryset.filter(
-            Q(name__icontains=value) | Q(street_address__icontains=value) | Q(city__icontains=value) | Q(state__icontains=value)
-        )
+        return keyword_search(queryset, value)
@@ -1,7 +1,8 @@
 import django_filters
-from django.db.models import Q
+from django.db.models import Exists, OuterRef
 
-from apps.property_management.infrastructure.models import Unit
+from apps.property_management.infrastructure.models import RentDetail, Unit
+from apps.property_management.infrastructure.search import keyword_search
 
 
 class UnitFilter(django_filters.FilterSet):
@@ -13,10 +14,6 @@ class UnitFilter(django_filters.FilterSet):
         fields = ['published', 'q']
 
     def filter_q(self, queryset, name, value):
-        return queryset.filter(
-            Q(number__icontains=value)
-            | Q(type__icontains=value)
-            | Q(floor_number__icontains=value)
-            | Q(status__icontains=value)
-            | Q(unit_rent_details__assigned_tenant__icontains=value)
-        )
+        # a correlated EXISTS keeps one row per unit without joining rent details and de-duplicating
+        tenant_matches = RentDetail.objects.filter(unit=OuterRef('pk'), assigned_tenant__icontains=value)
+        return keyword_search(queryset, value, extra=Exists(tenant_matches))
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('property_management', '0035_rename_rentdetails_rentdetail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='calendarslot',
+            name='start_date',
+            field=models.DateField(null=True),
+        ),
+        migrations.AddField(
+            model_name='calendarslot',
+            name='end_date',
+            field=models.DateField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='calendarslot',
+            name='date',
+            field=models.DateField(null=True),
+        ),
+    ]
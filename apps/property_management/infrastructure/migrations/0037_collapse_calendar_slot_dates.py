@@ -0,0 +1,56 @@
+from datetime import timedelta
+
+from django.db import migrations
+
+
+def collapse_dates_into_ranges(apps, schema_editor):
+    """Turn runs of consecutive days with the same status and reason into one row per run."""
+    CalendarSlot = apps.get_model('property_management', 'CalendarSlot')
+
+    ranges = []
+    duplicate_ids = []
+    current = None
+    for slot in CalendarSlot.objects.order_by('property_id', 'unit_id', 'date', 'id').iterator():
+        if (
+            current
+            and (current.property_id, current.unit_id, current.status, current.reason) == (slot.property_id, slot.unit_id, slot.status, slot.reason)
+            and slot.date <= current.end_date + timedelta(days=1)
+        ):
+            current.end_date = max(current.end_date, slot.date)
+            duplicate_ids.append(slot.id)
+            continue
+        if current and (current.property_id, current.unit_id) == (slot.property_id, slot.unit_id) and slot.date <= current.end_date:
+            # a second row for a day that is already covered
+            duplicate_ids.append(slot.id)
+            continue
+        slot.start_date = slot.end_date = slot.date
+        ranges.append(slot)
+        current = slot
+
+    CalendarSlot.objects.bulk_update(ranges, ['start_date', 'end_date'], batch_size=1000)
+    for index in range(0, len(duplicate_ids), 1000):
+        CalendarSlot.objects.filter(id__in=duplicate_ids[index : index + 1000]).delete()
+
+
+def expand_ranges_into_dates(apps, schema_editor):
+    CalendarSlot = apps.get_model('property_management', 'CalendarSlot')
+
+    days = []
+    for slot in CalendarSlot.objects.iterator():
+        slot.date = slot.start_date
+        slot.save(update_fields=['date'])
+        day = slot.start_date + timedelta(days=1)
+        while day <= slot.end_date:
+            days.append(CalendarSlot(property_id=slot.property_id, unit_id=slot.unit_id, date=day, status=slot.status, reason=slot.reason))
+            day += timedelta(days=1)
+    CalendarSlot.objects.bulk_create(days, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('property_management', '0036_calendarslot_start_date_end_date'),
+    ]
+
+    operations = [
+        migrations.RunPython(collapse_dates_into_ranges, expand_ranges_into_dates),
+    ]
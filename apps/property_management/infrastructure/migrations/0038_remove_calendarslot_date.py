@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('property_management', '0037_collapse_calendar_slot_dates'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='calendarslot',
+            name='date',
+        ),
+        migrations.AlterField(
+            model_name='calendarslot',
+            name='start_date',
+            field=models.DateField(),
+        ),
+        migrations.AlterField(
+            model_name='calendarslot',
+            name='end_date',
+            field=models.DateField(),
+        ),
+        migrations.AddIndex(
+            model_name='calendarslot',
+            index=models.Index(fields=['property', 'unit', 'start_date', 'end_date'], name='calendar_slot_range_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='calendarslot',
+            constraint=models.CheckConstraint(check=models.Q(end_date__gte=models.F('start_date')), name='calendar_slot_end_after_start'),
+        ),
+    ]
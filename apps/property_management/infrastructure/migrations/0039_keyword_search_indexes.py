@@ -0,0 +1,76 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:12
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property_management', '0038_remove_calendarslot_date'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector('name', config='simple', weight='A'),
+                            '||',
+                            django.contrib.postgres.search.SearchVector('street_address', config='simple', weight='B'),
+                            django.contrib.postgres.search.SearchConfig('simple'),
+                        ),
+                        '||',
+                        django.contrib.postgres.search.SearchVector('city', config='simple', weight='C'),
+                        django.contrib.postgres.search.SearchConfig('simple'),
+                    ),
+                    '||',
+                    django.contrib.postgres.search.SearchVector('state', config='simple', weight='C'),
+                    django.contrib.postgres.search.SearchConfig('simple'),
+                ),
+                name='property_search_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='propertydocument',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.SearchVector('title', config='simple', weight='A'),
+                        '||',
+                        django.contrib.postgres.search.SearchVector('document_type', config='simple', weight='B'),
+                        django.contrib.postgres.search.SearchConfig('simple'),
+                    ),
+                    '||',
+                    django.contrib.postgres.search.SearchVector('visibility', config='simple', weight='D'),
+                    django.contrib.postgres.search.SearchConfig('simple'),
+                ),
+                name='property_document_search_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='unit',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.search.CombinedSearchVector(
+                    django.contrib.postgres.search.CombinedSearchVector(
+                        django.contrib.postgres.search.CombinedSearchVector(
+                            django.contrib.postgres.search.SearchVector('number', config='simple', weight='A'),
+                            '||',
+                            django.contrib.postgres.search.SearchVector('type', config='simple', weight='B'),
+                            django.contrib.postgres.search.SearchConfig('simple'),
+                        ),
+                        '||',
+                        django.contrib.postgres.search.SearchVector('floor_number', config='simple', weight='C'),
+                        django.contrib.postgres.search.SearchConfig('simple'),
+                    ),
+                    '||',
+                    django.contrib.postgres.search.SearchVector('status', config='simple', weight='D'),
+                    django.contrib.postgres.search.SearchConfig('simple'),
+                ),
+                name='unit_search_idx',
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property_management', '0039_keyword_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ListingViewCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                (
+                    'property',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name='property_view_counts', to='property_management.property'
+                    ),
+                ),
+                (
+                    'unit',
+                    models.ForeignKey(
+                        default=None,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='unit_view_counts',
+                        to='property_management.unit',
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='listingviewcount',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('unit__isnull', True)), fields=('property', 'date'), name='listing_view_property_day'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='listingviewcount',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('unit__isnull', False)), fields=('unit', 'date'), name='listing_view_unit_day'
+            ),
+        ),
+    ]
@@ -0,0 +1,79 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('property_management', '0040_listing_view_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='costfeecategory',
+            index=models.Index(fields=['property', 'unit', 'category_name'], name='cost_fee_category_unit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyassignedamenity',
+            index=models.Index(fields=['property', 'unit'], name='assigned_amenity_unit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertydocument',
+            index=models.Index(fields=['property', 'unit', 'document_type'], name='property_document_unit_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='propertyphoto',
+            index=models.Index(condition=models.Q(('unit__isnull', True)), fields=['property'], name='property_photo_property_idx'),
+        ),
+        migrations.AlterField(
+            model_name='calendarslot',
+            name='property',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='property_slots',
+                to='property_management.property',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='costfeecategory',
+            name='property',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='property_cost_fee_categories',
+                to='property_management.property',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='propertyassignedamenity',
+            name='property',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='property_amenities',
+                to='property_management.property',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='propertydocument',
+            name='property',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='property_documents',
+                to='property_management.property',
+            ),
+        ),
+        migrations.AlterField(
+            model_name='rentdetail',
+            name='property',
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name='property_rent_details',
+                to='property_management.property',
+            ),
+        ),
+    ]
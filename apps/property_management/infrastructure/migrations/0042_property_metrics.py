@@ -0,0 +1,34 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:33
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('property_management', '0041_property_unit_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyMetrics',
+            fields=[
+                (
+                    'property',
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name='metrics',
+                        serialize=False,
+                        to='property_management.property',
+                    ),
+                ),
+                ('rental_income', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('unit_count', models.PositiveIntegerField(default=0)),
+                ('occupied_unit_count', models.PositiveIntegerField(default=0)),
+                ('lease_count', models.PositiveIntegerField(default=0)),
+                ('lease_days', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
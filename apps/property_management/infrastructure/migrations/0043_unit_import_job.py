@@ -0,0 +1,62 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:53
+
+from django.conf import settings
+import django.core.serializers.json
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('property_management', '0042_property_metrics'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UnitImportJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[('pending', 'Pending'), ('processing', 'Processing'), ('completed', 'Completed'), ('failed', 'Failed')],
+                        default='pending',
+                        max_length=20,
+                    ),
+                ),
+                ('data', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('total_units', models.PositiveIntegerField(default=0)),
+                ('processed_units', models.PositiveIntegerField(default=0)),
+                ('units_created', models.PositiveIntegerField(default=0)),
+                ('units_failed', models.PositiveIntegerField(default=0)),
+                ('unit_errors', models.JSONField(default=dict)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(null=True)),
+                ('finished_at', models.DateTimeField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                (
+                    'created_by',
+                    models.ForeignKey(
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name='unit_import_jobs',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    'property',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name='unit_import_jobs', to='property_management.property'
+                    ),
+                ),
+            ],
+            options={
+                'indexes': [
+                    models.Index(condition=models.Q(('status', 'pending')), fields=['created_at'], name='unit_import_job_pending_idx')
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.20 on 2026-10-17 23:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property_management', '0043_unit_import_job'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='unitimportjob',
+            name='media_processed',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='unitimportjob',
+            name='media_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 4.2.20 on 2026-10-18 00:20
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property_management', '0044_unit_import_job_media'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RemoveIndex(
+            model_name='property',
+            name='property_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='propertydocument',
+            name='property_document_search_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='unit',
+            name='unit_search_idx',
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('street_address'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('city'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('state'), name='gin_trgm_ops'),
+                name='property_search_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='propertydocument',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('document_type'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('visibility'), name='gin_trgm_ops'),
+                name='property_document_search_idx',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='unit',
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('number'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('type'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('floor_number'), name='gin_trgm_ops'),
+                django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('status'), name='gin_trgm_ops'),
+                name='unit_search_idx',
+            ),
+        ),
+    ]
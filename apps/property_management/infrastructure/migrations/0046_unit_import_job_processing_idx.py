@@ -0,0 +1,17 @@
+# Generated by Django 4.2.20 on 2026-10-18 00:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('property_management', '0045_keyword_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='unitimportjob',
+            index=models.Index(condition=models.Q(('status', 'processing')), fields=['updated_at'], name='unit_import_job_processing_idx'),
+        ),
+    ]
@@ -4,11 +4,14 @@ from .cost_fee import *
 from .cost_fee_category import *
 from .invitation import *
 from .listing_info import *
+from .listing_view_count import *
 from .owner_info import *
 from .property import *
 from .property_assigned_amenity import *
 from .property_document import *
+from .property_metrics import *
 from .property_photo import *
 from .property_type_and_amenity import *
 from .rent_detail import *
 from .unit import *
+from .unit_import_job import *
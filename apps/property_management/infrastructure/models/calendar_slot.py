@@ -1,15 +1,25 @@
 from django.db import models
 
+from apps.property_management.domain.value_objects import DateRange
+
 from .property import Property
 from .unit import Unit
 
 
 class CalendarSlot(models.Model):
-    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_slots')
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_slots', db_index=False)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_slots', null=True, default=None)
-    date = models.DateField()
+    start_date = models.DateField()
+    end_date = models.DateField()
     status = models.CharField(max_length=50, choices=[('available', 'Available'), ('unavailable', 'Unavailable')])
     reason = models.TextField(blank=True, null=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['property', 'unit', 'start_date', 'end_date'], name='calendar_slot_range_idx')]
+        constraints = [models.CheckConstraint(check=models.Q(end_date__gte=models.F('start_date')), name='calendar_slot_end_after_start')]
+
     def __str__(self):
-        return f"{self.date} - {self.status}"
+        return f"{self.start_date} - {self.end_date} - {self.status}"
+
+    def as_date_range(self):
+        return DateRange(self.start_date, self.end_date, reason=self.reason, status=self.status, slot_id=self.id)
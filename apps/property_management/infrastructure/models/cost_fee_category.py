@@ -5,12 +5,16 @@ from .unit import Unit
 
 
 class CostFeeCategory(models.Model):
-    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_cost_fee_categories')
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_cost_fee_categories', db_index=False)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_cost_fee_categories', null=True, default=None)
     category_name = models.CharField(max_length=100)  # e.g., Parking, Utilities, Other Categories
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # the categories of a property or unit, and the lookup of an existing category by name
+        indexes = [models.Index(fields=['property', 'unit', 'category_name'], name='cost_fee_category_unit_idx')]
+
     def __str__(self):
         return f"{self.category_name} costs for {self.property.name}"
@@ -0,0 +1,22 @@
+from django.db import models
+
+from .property import Property
+from .unit import Unit
+
+
+class ListingViewCount(models.Model):
+    """Views of a property summary (unit is null) or of a unit summary on one day, written by ViewCounter.flush."""
+
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_view_counts')
+    unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_view_counts', null=True, default=None)
+    date = models.DateField()
+    views = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['property', 'date'], condition=models.Q(unit__isnull=True), name='listing_view_property_day'),
+            models.UniqueConstraint(fields=['unit', 'date'], condition=models.Q(unit__isnull=False), name='listing_view_unit_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.property_id} - {self.unit_id} - {self.date}: {self.views}"
@@ -1,9 +1,29 @@
 from django.contrib.auth import get_user_model
 from django.db import models
 
+from apps.property_management.infrastructure.search import search_index
+
 User = get_user_model()
 
 
+class PropertyQuerySet(models.QuerySet):
+    def with_list_details(self):
+        """Annotate and prefetch what PropertySerializer shows, so listing many properties costs a fixed number of queries."""
+        from .property_photo import PropertyPhoto
+        from .rent_detail import RentDetail
+
+        return self.annotate(
+            first_rent=models.Subquery(RentDetail.objects.filter(property=models.OuterRef('pk')).order_by('pk').values('rent')[:1]),
+            avg_rent=models.Subquery(
+                RentDetail.objects.filter(property=models.OuterRef('pk')).values('property').annotate(avg=models.Avg('rent')).values('avg'),
+                output_field=models.DecimalField(max_digits=10, decimal_places=2),
+            ),
+            listing_number_of_units=models.F('listing_info__number_of_units'),
+        ).prefetch_related(
+            models.Prefetch('property_photos', queryset=PropertyPhoto.objects.filter(unit__isnull=True), to_attr='property_level_photos')
+        )
+
+
 class Property(models.Model):
     property_owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='property_owner')
     property_type_by_choices = [
@@ -36,8 +56,11 @@ class Property(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PropertyQuerySet.as_manager()
+
     class Meta:
         app_label = 'property_management'
+        indexes = [search_index('property', 'property_search_idx')]
 
     def __str__(self):
         return self.name
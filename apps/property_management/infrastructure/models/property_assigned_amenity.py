@@ -6,12 +6,15 @@ from .unit import Unit
 
 
 class PropertyAssignedAmenity(models.Model):
-    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_amenities')
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_amenities', db_index=False)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_amenities', null=True, default=None)
     sub_amenity = models.ForeignKey(Amenity, on_delete=models.CASCADE, related_name='assigned_sub_amenity')
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [models.Index(fields=['property', 'unit'], name='assigned_amenity_unit_idx')]
+
     def __str__(self):
         return f"Amenities for {self.property.name}"
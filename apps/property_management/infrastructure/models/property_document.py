@@ -1,11 +1,13 @@
 from django.db import models
 
+from apps.property_management.infrastructure.search import search_index
+
 from .property import Property
 from .unit import Unit
 
 
 class PropertyDocument(models.Model):
-    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_documents')
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_documents', db_index=False)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_documents', null=True, default=None)
     document = models.FileField(upload_to='property_documents/')
     title = models.CharField(max_length=255)
@@ -64,5 +66,12 @@ class PropertyDocument(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            search_index('propertydocument', 'property_document_search_idx'),
+            # the documents of a property or unit, and the duplicate document type checks
+            models.Index(fields=['property', 'unit', 'document_type'], name='property_document_unit_idx'),
+        ]
+
     def __str__(self):
         return f"{self.title} for {self.property.name}"
@@ -0,0 +1,22 @@
+from django.db import models
+
+from .property import Property
+
+
+class PropertyMetrics(models.Model):
+    """
+    Rollup of a property's rents, occupancy and leases, kept up to date by PropertyMetricsService. A property without
+    units counts as a single unit with the property's own status.
+    """
+
+    property = models.OneToOneField(Property, on_delete=models.CASCADE, primary_key=True, related_name='metrics')
+    rental_income = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    unit_count = models.PositiveIntegerField(default=0)
+    occupied_unit_count = models.PositiveIntegerField(default=0)
+    lease_count = models.PositiveIntegerField(default=0)
+    lease_days = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Metrics of {self.property_id}"
@@ -12,5 +12,9 @@ class PropertyPhoto(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # the property level photos shown on property lists, summaries and listings
+        indexes = [models.Index(fields=['property'], condition=models.Q(unit__isnull=True), name='property_photo_property_idx')]
+
     def __str__(self):
         return f"Photo of {self.property.name}"
@@ -11,7 +11,7 @@ class RentDetail(models.Model):
         ('monthly_billing', "Monthly Billing"),  # university_housing
         ('semester_billing', "Semester Billing"),  # university_housing
     ]
-    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_rent_details')
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='property_rent_details', db_index=False)
     unit = models.ForeignKey(Unit, on_delete=models.CASCADE, related_name='unit_rent_details', null=True, default=None)
     # tenant FK needs to be here
     assigned_tenant = models.CharField(max_length=100, blank=True, null=True)
@@ -39,6 +39,7 @@ class RentDetail(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
+        # its index also serves the lookups by property alone
         unique_together = ('property', 'unit')
 
     def __str__(self):
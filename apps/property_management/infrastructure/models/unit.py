@@ -1,5 +1,7 @@
 from django.db import models
 
+from apps.property_management.infrastructure.search import search_index
+
 from .property import Property
 
 
@@ -29,5 +31,8 @@ class Unit(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [search_index('unit', 'unit_search_idx')]
+
     def __str__(self):
         return self.number
@@ -0,0 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from .property import Property
+
+User = get_user_model()
+
+
+class UnitImportJob(models.Model):
+    """
+    A bulk unit import, queued by the upload and run by the ``process_unit_import_jobs`` worker. ``data`` holds the
+    validated workbook rows until the job is finished. The worker saves the progress of a processing job with every
+    chunk and file, ``updated_at`` tells whether it is still running.
+    """
+
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+
+    property = models.ForeignKey(Property, on_delete=models.CASCADE, related_name='unit_import_jobs')
+    created_by = models.ForeignKey(User, on_delete=models.SET_NULL, related_name='unit_import_jobs', null=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    data = models.JSONField(encoder=DjangoJSONEncoder, null=True)
+
+    total_units = models.PositiveIntegerField(default=0)
+    processed_units = models.PositiveIntegerField(default=0)
+    units_created = models.PositiveIntegerField(default=0)
+    units_failed = models.PositiveIntegerField(default=0)
+    # distinct photo and document urls of the created units, downloaded after the units
+    media_total = models.PositiveIntegerField(default=0)
+    media_processed = models.PositiveIntegerField(default=0)
+    # errors by unit number, like the synchronous import used to return them
+    unit_errors = models.JSONField(default=dict)
+    error = models.TextField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # the worker claims the oldest pending job
+            models.Index(fields=['created_at'], condition=models.Q(status='pending'), name='unit_import_job_pending_idx'),
+            # and fails the processing ones whose worker stopped
+            models.Index(fields=['updated_at'], condition=models.Q(status='processing'), name='unit_import_job_processing_idx'),
+        ]
+
+    def __str__(self):
+        return f"Unit import {self.pk} of {self.property_id} ({self.status})"
@@ -0,0 +1 @@
+from .keyword_search import *
@@ -0,0 +1,35 @@
+from functools import reduce
+from operator import add, or_
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models import Case, FloatField, Q, Value, When
+from django.db.models.functions import Upper
+
+__all__ = ['SEARCH_FIELDS', 'keyword_search', 'search_index']
+
+# (field, weight) pairs of the keyword search, keyed by model name. The models keep a trigram GIN index on the fields.
+SEARCH_FIELDS = {
+    'property': (('name', 1.0), ('street_address', 0.4), ('city', 0.2), ('state', 0.2)),
+    'unit': (('number', 1.0), ('type', 0.4), ('floor_number', 0.2), ('status', 0.1)),
+    'propertydocument': (('title', 1.0), ('document_type', 0.4), ('visibility', 0.1)),
+}
+
+
+def search_index(model_name, name):
+    """
+    A pg_trgm GIN index on the searched fields, PostgreSQL uses it for ``icontains`` whatever the position of the match.
+    ``icontains`` compiles to ``UPPER(field) LIKE UPPER(value)``, the index is on the same expression.
+    """
+    return GinIndex(*(OpClass(Upper(field), name='gin_trgm_ops') for field, _ in SEARCH_FIELDS[model_name]), name=name)
+
+
+def keyword_search(queryset, value, extra=None):
+    """
+    Filter the queryset to rows with an indexed field containing ``value``, ranked in ``search_rank`` by the weights of
+    the fields that contain it. ``extra`` is OR-ed to the match.
+    """
+    fields = SEARCH_FIELDS[queryset.model._meta.model_name]
+    matches = [(Q(**{f'{field}__icontains': value}), weight) for field, weight in fields]
+    rank = reduce(add, (Case(When(match, then=Value(weight)), default=Value(0.0), output_field=FloatField()) for match, weight in matches))
+    condition = reduce(or_, (match for match, _ in matches))
+    return queryset.annotate(search_rank=rank).filter(condition | extra if extra is not None else condition)
@@ -1,3 +1,4 @@
+from .availability_matrix import *
 from .bulk_unit_import import *
 from .calendar_slot import *
 from .calendar_slot_list import *
@@ -20,6 +21,7 @@ from .property_summary_retrieve import *
 from .rent_detail import *
 from .rent_detail_retrieve import *
 from .unit import *
+from .unit_import_job import *
 from .unit_retrieve import *
 from .unit_update import *
 from .update_document_form import *
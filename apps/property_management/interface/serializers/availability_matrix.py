@@ -0,0 +1,7 @@
+from rest_framework import serializers
+
+from .calendar_slot_list import CalendarSlotListSerializer
+
+
+class AvailabilityMatrixSerializer(CalendarSlotListSerializer):
+    encoding = serializers.ChoiceField(choices=['bitmap', 'rle'], default='bitmap')
@@ -1,21 +1,29 @@
 from rest_framework import serializers
 
 from apps.property_management.infrastructure.models import CalendarSlot
+from common.constants import Error
 
 
 class CalendarSlotSerializer(serializers.ModelSerializer):
+    # the day of the range an update applies to
+    date = serializers.DateField(write_only=True, required=False)
+
     class Meta:
         model = CalendarSlot
-        fields = ['id', 'date', 'status', 'property', 'unit', 'reason']
+        fields = ['id', 'date', 'start_date', 'end_date', 'status', 'property', 'unit', 'reason']
+        # updates change a day unless the whole range is asked for
+        extra_kwargs = {'start_date': {'required': False}, 'end_date': {'required': False}}
 
     def validate(self, data):
-        unit = data.get('unit')
-        property_ = data.get('property')
-        date = data.get('date')
+        start_date = data.get('start_date', getattr(self.instance, 'start_date', None))
+        end_date = data.get('end_date', getattr(self.instance, 'end_date', None))
 
-        existing_slot = CalendarSlot.objects.filter(property=property_, unit=unit, date=date).first()
+        if self.instance is None:
+            missing = [field for field, value in (('start_date', start_date), ('end_date', end_date)) if not value]
+            if missing:
+                raise serializers.ValidationError({field: [serializers.Field.default_error_messages['required']] for field in missing})
 
-        if existing_slot:
-            existing_slot.delete()
+        if start_date and end_date and end_date < start_date:
+            raise serializers.ValidationError(Error.CALENDAR_RANGE_INVALID)
 
         return data
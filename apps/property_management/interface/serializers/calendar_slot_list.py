@@ -1,8 +1,38 @@
+import calendar
+from datetime import date
+
 from rest_framework import serializers
 
+from common.constants import Error
+
 
 class CalendarSlotListSerializer(serializers.Serializer):
+    MAX_RANGE_DAYS = 366
+
     property = serializers.IntegerField()
     unit = serializers.IntegerField(required=False)
-    month = serializers.IntegerField()
-    year = serializers.IntegerField()
+    month = serializers.IntegerField(required=False, min_value=1, max_value=12)
+    year = serializers.IntegerField(required=False, min_value=1, max_value=9999)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, data):
+        """
+        Resolve the requested range into start_date/end_date, either from start and end or from a month and year.
+        """
+        start, end = data.get('start'), data.get('end')
+        if start and end:
+            if end < start:
+                raise serializers.ValidationError(Error.CALENDAR_RANGE_INVALID)
+            if (end - start).days + 1 > self.MAX_RANGE_DAYS:
+                raise serializers.ValidationError(Error.CALENDAR_RANGE_TOO_LONG.format(self.MAX_RANGE_DAYS))
+        elif data.get('month') and data.get('year'):
+            month, year = data['month'], data['year']
+            start = date(year, month, 1)
+            end = date(year, month, calendar.monthrange(year, month)[1])
+        else:
+            raise serializers.ValidationError(Error.CALENDAR_RANGE_REQUIRED)
+
+        data['start_date'] = start
+        data['end_date'] = end
+        return data
@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.property_management.infrastructure.models import PropertyDocument
+from common.presigned_list_serializer import PresignedListSerializer
 from common.utils import get_presigned_url
 
 
@@ -8,6 +9,8 @@ class DocumentRetrieveSerializer(serializers.ModelSerializer):
     class Meta:
         model = PropertyDocument
         exclude = ['updated_at']
+        list_serializer_class = PresignedListSerializer
+        presigned_fields = {'document': {'download': True}}
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
@@ -61,7 +61,9 @@ class ListingInfoSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        photos = PropertyPhoto.objects.filter(property=instance.property)
+        photos = getattr(instance.property, 'listing_photos', None)
+        if photos is None:
+            photos = PropertyPhoto.objects.filter(property=instance.property)
         photos_data = PropertyPhotoSerializer(photos, many=True).data
         representation['photos'] = photos_data
         return representation
@@ -49,21 +49,32 @@ class PropertySerializer(serializers.ModelSerializer):
         return value
 
     def get_rent(self, obj):
+        # list responses come with the rents annotated by PropertyQuerySet.with_list_details
         if obj.property_type == 'single_family_home':
+            if hasattr(obj, 'first_rent'):
+                return obj.first_rent
             rental_details = RentDetail.objects.filter(property=obj.id).first()
             if rental_details:
                 return rental_details.rent
         else:
-            avg_rent = RentDetail.objects.filter(property=obj.id).aggregate(avg_rent=Avg('rent'))['avg_rent']
+            if hasattr(obj, 'avg_rent'):
+                avg_rent = obj.avg_rent
+            else:
+                avg_rent = RentDetail.objects.filter(property=obj.id).aggregate(avg_rent=Avg('rent'))['avg_rent']
             return round(avg_rent, 2) if avg_rent is not None else None
         return None
 
     def get_photos(self, obj):
-        photos = PropertyPhoto.objects.filter(property=obj.id, unit__isnull=True)
+        if hasattr(obj, 'property_level_photos'):
+            photos = obj.property_level_photos
+        else:
+            photos = PropertyPhoto.objects.filter(property=obj.id, unit__isnull=True)
         photos_data = PropertyPhotoSerializer(photos, many=True).data
         return photos_data
 
     def get_number_of_units(self, obj):
+        if hasattr(obj, 'listing_number_of_units'):
+            return obj.listing_number_of_units
         listing_info = ListingInfo.objects.filter(property=obj.id).first()
         if listing_info:
             return listing_info.number_of_units
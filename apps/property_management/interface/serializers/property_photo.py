@@ -1,6 +1,7 @@
 from rest_framework import serializers
 
 from apps.property_management.infrastructure.models import PropertyPhoto
+from common.presigned_list_serializer import PresignedListSerializer
 from common.utils import get_presigned_url
 
 
@@ -8,6 +9,8 @@ class PropertyPhotoSerializer(serializers.ModelSerializer):
     class Meta:
         model = PropertyPhoto
         fields = ['id', 'photo']
+        list_serializer_class = PresignedListSerializer
+        presigned_fields = {'photo': {}}
 
     def to_representation(self, instance):
         rep = super().to_representation(instance)
@@ -14,6 +14,9 @@ class PropertyRetrieveSerializer(serializers.ModelSerializer):
 
     def get_photos(self, obj):
         # Only get photos that don't belong to any unit (unit is null)
-        photos = PropertyPhoto.objects.filter(property=obj.id, unit__isnull=True)
+        if hasattr(obj, 'property_level_photos'):
+            photos = obj.property_level_photos
+        else:
+            photos = PropertyPhoto.objects.filter(property=obj.id, unit__isnull=True)
         photos_data = PropertyPhotoSerializer(photos, many=True).data
         return photos_data
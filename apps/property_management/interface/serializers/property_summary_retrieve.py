@@ -1,16 +1,6 @@
 from django.contrib.auth import get_user_model
 
-from apps.property_management.infrastructure.models import (
-    CostFee,
-    CostFeeCategory,
-    ListingInfo,
-    OwnerInfo,
-    Property,
-    PropertyAssignedAmenity,
-    PropertyDocument,
-    RentDetail,
-    Unit,
-)
+from apps.property_management.infrastructure.models import ListingInfo, OwnerInfo
 from apps.user_management.infrastructure.models import PropertyOwner  # why is a model from other app being used here
 from common.utils import get_presigned_url
 
@@ -24,27 +14,19 @@ from .rent_detail_retrieve import RentDetailRetrieveSerializer
 #  this doesnt look a a proper serializer, look into it
 class PropertySummaryRetrieveSerializer:
     @staticmethod
-    def get_amenities(property_id, unit_id):
-        sub_amenities = PropertyAssignedAmenity.objects.filter(property=property_id, unit=unit_id).select_related('sub_amenity')
-        model = Property
-        if unit_id:
-            model = Unit
-            instance_id = unit_id
-        else:
-            instance_id = property_id
-        other_amenities = model.objects.filter(id=instance_id).values_list('other_amenities', flat=True)
+    def get_amenities(summary, instance, unit_id):
         amenities_data = dict()
-        for amenity in sub_amenities:
+        for amenity in summary.get_amenities(unit_id):
             a_name = amenity.sub_amenity.amenity
             if a_name not in amenities_data:
                 amenities_data[a_name] = list()
             amenities_data[a_name].append({'id': amenity.sub_amenity.id, 'name': amenity.sub_amenity.sub_amenity})
-        amenities_data['other_amenities'] = list(other_amenities)
+        amenities_data['other_amenities'] = [instance.other_amenities]
         return amenities_data
 
     @staticmethod
-    def get_rental_details(property_id, unit_id):
-        rental_details_instance = RentDetail.objects.filter(property=property_id, unit=unit_id).first()
+    def get_rental_details(summary, unit_id):
+        rental_details_instance = summary.get_rental_details(unit_id)
         return RentDetailRetrieveSerializer(rental_details_instance).data if rental_details_instance else None
 
     @staticmethod
@@ -53,13 +35,12 @@ class PropertySummaryRetrieveSerializer:
         return ListingInfoRetrieveSerializer(listing_info_instance).data if listing_info_instance else None
 
     @staticmethod
-    def get_cost_fees(property_id, unit_id):
+    def get_cost_fees(summary, unit_id):
         cost_fee_data = []
-        cost_category_instances = CostFeeCategory.objects.filter(property=property_id, unit=unit_id)
-        for cost_fee in cost_category_instances:
+        for cost_fee, fees in summary.get_cost_fees(unit_id):
             cost_fee_obj = {
                 'category_name': cost_fee.category_name,
-                'fees': [CostFeeRetrieveSerializer(f).data for f in CostFee.objects.filter(category=cost_fee.id)],
+                'fees': CostFeeRetrieveSerializer(fees, many=True).data,
             }
             cost_fee_data.append(cost_fee_obj)
         return cost_fee_data
@@ -90,6 +71,5 @@ class PropertySummaryRetrieveSerializer:
         return owners
 
     @staticmethod
-    def get_documents(property_id, unit_id):
-        document_instances = PropertyDocument.objects.filter(property=property_id, unit=unit_id)
-        return [DocumentRetrieveSerializer(document).data for document in document_instances]
+    def get_documents(summary, unit_id):
+        return DocumentRetrieveSerializer(summary.get_documents(unit_id), many=True).data
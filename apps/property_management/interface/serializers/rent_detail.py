@@ -30,6 +30,12 @@ class RentDetailSerializer(serializers.ModelSerializer):
             if RentDetail.objects.filter(property=data['property'], unit=unit).exists():
                 raise serializers.ValidationError(Error.RENT_DETAILS_EXISTS)
 
+        self.validate_terms(data)
+        return data
+
+    @staticmethod
+    def validate_terms(data):
+        """The rules on the tenant and the special offer, shared with the bulk import which validates rows in memory"""
         if data.get('assigned_tenant'):
             if data.get('promote_special_offer'):
                 raise serializers.ValidationError(Error.OFFER_NOT_REQUIRED)
@@ -42,4 +48,3 @@ class RentDetailSerializer(serializers.ModelSerializer):
                     raise serializers.ValidationError(
                         Error.OFFER_REQUIRED.format("'offer_start_date', 'offer_end_date', 'offer_percentage'")
                     )
-        return data
@@ -97,9 +97,9 @@ class UnitSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError(Error.BATHROOMS_REQUIRED)
 
     @staticmethod
-    def csv_create(property_instance, validated_data):
+    def csv_build(property_instance, validated_data):
         """
-        Create a Unit instance after validating property existence and unit type.
+        An unsaved Unit of a bulk import row after validating the unit type, the import inserts units in bulk.
         """
         unit_type = snake_case(validated_data.get('type'))
         validated_data['type'] = unit_type
@@ -112,22 +112,27 @@ class UnitSerializer(serializers.ModelSerializer):
         model_fields = [field.name for field in Unit._meta.get_fields()]
         unit_data = {key: validated_data[key] for key in validated_data if key in model_fields}
         unit_data['property'] = property_instance
-        unit_instance = Unit.objects.create(**unit_data)
-        return unit_instance
+        return Unit(**unit_data)
+
+    def _get_rental_details(self, obj):
+        # list responses come with the rent details prefetched by UnitInfoViewSet.get_queryset
+        if hasattr(obj, 'unit_level_rent_details'):
+            return obj.unit_level_rent_details[0] if obj.unit_level_rent_details else None
+        return RentDetail.objects.filter(unit=obj.id).first()
 
     def get_rent(self, obj):
-        rental_details = RentDetail.objects.filter(unit=obj.id).first()
+        rental_details = self._get_rental_details(obj)
         if rental_details:
             return rental_details.rent
         return None
 
     def get_photos(self, obj):
-        photos = obj.unit_photos.all()
+        photos = obj.unit_level_photos if hasattr(obj, 'unit_level_photos') else obj.unit_photos.all()
         photos_data = PropertyPhotoSerializer(photos, many=True).data
         return photos_data
 
     def get_tenants(self, obj):
-        rental_details = RentDetail.objects.filter(unit=obj.id).first()
+        rental_details = self._get_rental_details(obj)
         if rental_details:
             return rental_details.assigned_tenant
         return None
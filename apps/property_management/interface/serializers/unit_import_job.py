@@ -0,0 +1,38 @@
+from rest_framework import serializers
+
+from apps.property_management.infrastructure.models import UnitImportJob
+
+
+class UnitImportJobSerializer(serializers.ModelSerializer):
+    """
+    Status of a bulk unit import. The counts and ``data``, the errors by unit number, keep the names of the response
+    the import returned when it ran in the request.
+    """
+
+    csv_units_count = serializers.IntegerField(source='total_units')
+    data = serializers.JSONField(source='unit_errors')
+    progress = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UnitImportJob
+        fields = [
+            'id',
+            'property',
+            'status',
+            'csv_units_count',
+            'processed_units',
+            'progress',
+            'units_created',
+            'units_failed',
+            'media_total',
+            'media_processed',
+            'data',
+            'error',
+            'created_at',
+            'started_at',
+            'finished_at',
+        ]
+
+    def get_progress(self, obj):
+        """Processed units in percent"""
+        return round(obj.processed_units * 100 / obj.total_units, 2) if obj.total_units else 100
@@ -15,7 +15,10 @@ class UnitRetrieveSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         representation = super().to_representation(instance)
-        photos = PropertyPhoto.objects.filter(unit=instance.id)
+        if hasattr(instance, 'unit_level_photos'):
+            photos = instance.unit_level_photos
+        else:
+            photos = PropertyPhoto.objects.filter(unit=instance.id)
         photos_data = PropertyPhotoSerializer(photos, many=True).data
         representation['photos'] = photos_data
         return representation
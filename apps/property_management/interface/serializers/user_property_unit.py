@@ -8,5 +8,5 @@ class UserPropertyUnitSerializer(serializers.Serializer):
     """
 
     id = serializers.IntegerField()
-    name = serializers.CharField()
-    type = serializers.CharField()
+    name = serializers.CharField(source='item_name')
+    type = serializers.CharField(source='item_type')
@@ -3,6 +3,7 @@ from .bulk_unit_import import *
 from .calendar_slot import *
 from .cost_fee import *
 from .cost_fee_types import *
+from .dashboard import *
 from .delete_all_properties import *
 from .general import *
 from .listing_info import *
@@ -3,9 +3,12 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
+from apps.property_management.application.services.property_cache import PropertyCache
+from apps.property_management.application.services.property_summary_loader import PropertySummaryLoader
 from apps.property_management.infrastructure.models import Amenity, Property, PropertyAssignedAmenity, PropertyTypeAndAmenity, Unit
 from apps.property_management.interface.serializers import PropertyAmenitySerializer, PropertySummaryRetrieveSerializer
 from common.constants import Success
+from common.model_version import get_model_version
 from common.utils import CustomResponse
 
 from .general import GeneralViewSet
@@ -17,6 +20,7 @@ class AmenityView(GeneralViewSet):
     serializer_class = PropertyAmenitySerializer
     filter_backends = [DjangoFilterBackend]
     filterset_fields = ['property_type']
+    etag_models = (Amenity,)
 
     def create(self, request, *args, **kwargs):
         serializer = self.serializer_class(data=request.data)
@@ -57,11 +61,18 @@ class AmenityView(GeneralViewSet):
         obj.page_saved = page_saved
         obj.save(update_fields=['other_amenities', 'page_saved'])
 
-        amenities_data = PropertySummaryRetrieveSerializer.get_amenities(property_id=property_obj.id, unit_id=unit_id)
+        summary = PropertySummaryLoader(property_obj.id, unit_ids=[unit_id] if unit_id else None)
+        amenities_data = PropertySummaryRetrieveSerializer.get_amenities(summary, obj, unit_id)
 
         return CustomResponse({'data': amenities_data, 'message': Success.AMENITIES_UPDATED}, status=status.HTTP_200_OK)
 
     def list(self, request, *args, **kwargs):
+        # the amenity catalogue is not tied to a property, its entries follow the versions of the catalogue tables
+        version = f'{get_model_version(PropertyTypeAndAmenity)}.{get_model_version(Amenity)}'
+        result = PropertyCache.get_or_build('amenities', request, None, version, lambda: self.get_amenities(request))
+        return CustomResponse({'data': result, 'message': Success.AMENITIES_AND_SUB_AMENITIES}, status=status.HTTP_200_OK)
+
+    def get_amenities(self, request):
         filtered_queryset = self.filter_queryset(self.get_queryset())
         amenity_ids = filtered_queryset.values_list('sub_amenities', flat=True)
         amenities = Amenity.objects.filter(id__in=amenity_ids)
@@ -72,6 +83,4 @@ class AmenityView(GeneralViewSet):
 
             amenities_dict[item.amenity].append({'id': item.id, 'sub_amenity': item.sub_amenity})
 
-        result = [{'amenity': key, 'sub_amenities': value} for key, value in amenities_dict.items()]
-
-        return CustomResponse({'data': result, 'message': Success.AMENITIES_AND_SUB_AMENITIES}, status=status.HTTP_200_OK)
+        return [{'amenity': key, 'sub_amenities': value} for key, value in amenities_dict.items()]
@@ -1,7 +1,12 @@
-from datetime import datetime, timedelta
+from django.db import transaction
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
 
+from apps.property_management.application.services.availability_service import AvailabilityService
+from apps.property_management.domain.value_objects import DateRange
 from apps.property_management.infrastructure.models import CalendarSlot
-from apps.property_management.interface.serializers import CalendarSlotListSerializer, CalendarSlotSerializer
+from apps.property_management.interface.serializers import AvailabilityMatrixSerializer, CalendarSlotListSerializer, CalendarSlotSerializer
 from common.constants import Error, Success
 from common.utils import CustomResponse
 
@@ -11,74 +16,119 @@ from .general import GeneralViewSet
 class CalendarSlotViewSet(GeneralViewSet):
     queryset = CalendarSlot.objects.all()
     serializer_class = CalendarSlotSerializer
+    etag_time_bucket = None
 
     def list(self, request, *args, **kwargs):
         """
-        Retrieve a list of all dates for a specific month and year.
+        Retrieve a list of all dates for a specific month and year, or for a start and end date of up to a year.
         """
         serializer = CalendarSlotListSerializer(data=self.request.query_params)
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
-        month = data.get('month')
-        year = data.get('year')
-        property = data.get('property')
-        unit = data.get('unit')
-
-        if not month or not year:
-            return CustomResponse({"error": "Month and Year are required"}, status=400)
-
-        # Generate the first and last day of the month
-        start_date = datetime(year=int(year), month=int(month), day=1)
-        end_date = datetime(year=int(year), month=int(month), day=28)  # To ensure we don't overflow on February
-        # Adjust end_date to the last day of the month
-        while True:
-            try:
-                end_date = end_date.replace(day=28) + timedelta(days=4)  # this will always get us to the next month
-                end_date = end_date - timedelta(days=end_date.day)
-                break
-            except ValueError:
-                pass
-
-        slots = CalendarSlot.objects.filter(date__gte=start_date, date__lte=end_date, property=property, unit=unit)
-
-        # Create a list of all dates of the month, defaulting to available
-        all_dates = []
-        current_date = start_date
-        while current_date <= end_date:
-            status = 'available'
-            # Check if the date is in the database and has a status of 'unavailable'
-            existing_slot = slots.filter(date=current_date).first()
-            if existing_slot:
-                status = existing_slot.status
-            all_dates.append(
-                {
-                    'id': existing_slot.id if existing_slot else None,
-                    'date': current_date.strftime('%Y-%m-%d'),
-                    'status': status,
-                    'reason': existing_slot.reason if existing_slot else None,
-                }
-            )
-            current_date += timedelta(days=1)
 
+        all_dates = AvailabilityService.get_days(data.get('property'), data.get('unit'), data['start_date'], data['end_date'])
         return CustomResponse({"data": all_dates})
 
+    @action(detail=False, methods=['get'], url_path='matrix', permission_classes=[IsAuthenticated])
+    def matrix(self, request, *args, **kwargs):
+        """
+        Availability of all units of one of the user's properties as a units x days matrix, for a month and year or a
+        start and end date.
+        """
+        serializer = AvailabilityMatrixSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        matrix = AvailabilityService.get_matrix(
+            data['property'], request.user.id, data['start_date'], data['end_date'], encoding=data['encoding']
+        )
+        return CustomResponse({"data": matrix})
+
     def create(self, request, *args, **kwargs):
         """
-        Create unavailable slots based on provided dates.
+        Create unavailable slots based on provided dates and/or date ranges.
         """
         property = request.data.get('property')
         unit = request.data.get('unit')
-        data_ = request.data.get('unavailable_dates')
+        unavailable_dates = request.data.get('unavailable_dates') or []
+        unavailable_ranges = request.data.get('unavailable_ranges') or []
 
-        if not data_:
+        if not unavailable_dates and not unavailable_ranges:
             return CustomResponse({"error": Error.UNAVAILABLE_DATES_REQUIRED}, status=400)
 
-        for data in data_:
-            data['status'] = 'unavailable'
-            data['property'] = property
-            data['unit'] = unit
+        # single dates are stored as one day ranges and merged with their neighbours
+        ranges_data = [
+            {'start_date': data.get('date'), 'end_date': data.get('date'), 'reason': data.get('reason')} for data in unavailable_dates
+        ]
+        date_ranges = []
+        for data in [*ranges_data, *unavailable_ranges]:
+            data = {**data, 'status': 'unavailable', 'property': property, 'unit': unit}
             serializer = self.serializer_class(data=data)
-            if serializer.is_valid(raise_exception=True):
-                CalendarSlot.objects.create(**serializer.validated_data)
+            serializer.is_valid(raise_exception=True)
+            date_ranges.append(
+                DateRange(
+                    serializer.validated_data['start_date'], serializer.validated_data['end_date'], serializer.validated_data.get('reason')
+                )
+            )
+
+        unit_instance = serializer.validated_data.get('unit')
+        AvailabilityService.block(serializer.validated_data['property'].id, unit_instance.id if unit_instance else None, date_ranges)
 
         return CustomResponse({"message": Success.UNAVAILABILITY_SET}, status=201)
+
+    def perform_update(self, serializer):
+        """
+        Change the day given as ``date``, splitting its range, or the whole range with ``?scope=range``. The date can
+        be left out for a range of one day.
+        """
+        slot = serializer.instance
+        data = serializer.validated_data
+        property_id = data.get('property', slot.property).id
+        unit = data.get('unit', slot.unit)
+        unit_id = unit.id if unit else None
+        if self._range_scope():
+            freed = (slot.start_date, slot.end_date)
+            start_date, end_date = data.get('start_date', slot.start_date), data.get('end_date', slot.end_date)
+        else:
+            if 'start_date' in data or 'end_date' in data:
+                raise serializers.ValidationError(Error.CALENDAR_RANGE_SCOPE_REQUIRED)
+            day = self._slot_day(slot, data.get('date'))
+            freed = start_date, end_date = day, day
+        date_range = DateRange(start_date, end_date, reason=data.get('reason', slot.reason), status=data.get('status', slot.status))
+
+        with transaction.atomic():
+            AvailabilityService.free(slot.property_id, slot.unit_id, *freed)
+            AvailabilityService.block(property_id, unit_id, [date_range])
+
+        # the range may have been merged into a neighbouring one
+        serializer.instance = CalendarSlot.objects.get(
+            property=property_id, unit=unit_id, start_date__lte=date_range.start_date, end_date__gte=date_range.start_date
+        )
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Make the day given as ``date`` available again, splitting its range, or delete the whole range with
+        ``?scope=range``. The date can be left out for a range of one day.
+        """
+        slot = self.get_object()
+        if self._range_scope():
+            self.perform_destroy(slot)
+        else:
+            day = request.query_params.get('date')
+            day = self._slot_day(slot, serializers.DateField().to_internal_value(day) if day else None)
+            AvailabilityService.free(slot.property_id, slot.unit_id, day, day)
+        return CustomResponse({'data': None}, status=status.HTTP_204_NO_CONTENT)
+
+    def _range_scope(self):
+        return self.request.query_params.get('scope') == 'range'
+
+    @staticmethod
+    def _slot_day(slot, day):
+        """The day of the slot a day level change applies to, slots are ranges and every day of the grid has their id"""
+        if day is None:
+            if slot.start_date != slot.end_date:
+                raise serializers.ValidationError(Error.CALENDAR_DATE_REQUIRED)
+            return slot.start_date
+        if not slot.start_date <= day <= slot.end_date:
+            raise serializers.ValidationError(Error.CALENDAR_DATE_OUTSIDE_SLOT)
+        return day
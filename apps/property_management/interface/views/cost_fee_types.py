@@ -3,14 +3,23 @@ from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
 
+from apps.property_management.application.services.property_cache import PropertyCache
 from apps.property_management.infrastructure.models import CostFee, CostFeeCategory, Property
 from apps.property_management.utils import cost_fee_options
+from common.conditional_get_mixin import ConditionalGetMixin, weak_etag
 from common.constants import Error, Success
 from common.utils import CustomResponse, NotFound
 
 
-class CostFeeTypesView(APIView):
+class CostFeeTypesView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated]
+    etag_time_bucket = None
+
+    def get_etag(self, request):
+        property_id = request.query_params.get('property')
+        if not property_id:
+            return None
+        return weak_etag(request.get_full_path(), request.user.pk, PropertyCache.get_version(property_id))
 
     def get(self, request, *args, **kwargs):
         property_id = request.query_params.get('property')
@@ -19,7 +28,13 @@ class CostFeeTypesView(APIView):
             raise ValidationError(Error.PROPERTY_ID_REQUIRED)
 
         try:
-            filtered_options = self.get_filtered_cost_fee_options(property_id, unit_id)
+            filtered_options = PropertyCache.get_or_build(
+                'cost_fee_types',
+                request,
+                property_id,
+                PropertyCache.get_version(property_id),
+                lambda: self.get_filtered_cost_fee_options(property_id, unit_id),
+            )
 
             return CustomResponse({"data": filtered_options, "message": Success.COST_FEE_TYPES}, status=status.HTTP_200_OK)
         except Exception as e:
@@ -0,0 +1,21 @@
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.views import APIView
+
+from apps.property_management.application.services.dashboard_service import DashboardService
+from common.constants import Success
+from common.utils import CustomResponse
+
+
+class DashboardView(APIView):
+    """
+    Portfolio totals of the authenticated owner: properties, units by status, listings by published state,
+    tenant and vendor invitations, leases expiring in the next 30, 60 and 90 days and the monthly rent of the
+    occupied units and properties.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        data = DashboardService.get_dashboard(request.user.pk)
+        return CustomResponse({'data': data, 'message': Success.DASHBOARD}, status=status.HTTP_200_OK)
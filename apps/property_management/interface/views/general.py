@@ -1,21 +1,62 @@
 from rest_framework import status, viewsets
 
+from common.conditional_get_mixin import ConditionalGetMixin, rows_etag_parts, weak_etag
+from common.model_version import get_model_version
 from common.utils import CustomResponse
 
 
-class GeneralViewSet(viewsets.ModelViewSet):
+class GeneralViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
+    # models shown next to the view's own rows, their versions are part of the ETag
+    etag_models = ()
+
+    def get_etag(self, request):
+        model = self.get_queryset().model
+        if self.action not in ('list', 'retrieve') or not any(field.name == 'updated_at' for field in model._meta.fields):
+            return None
+
+        if self.action == 'retrieve':
+            # the row as get_queryset scopes it to the user
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = self.get_queryset().filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+        else:
+            queryset = self.filter_queryset(self.get_queryset())
+        last_updated, count = rows_etag_parts(queryset)
+        if self.action == 'retrieve' and not count:
+            # not one of the user's rows, answered without an ETag
+            return None
+        versions = [get_model_version(etag_model) for etag_model in self.etag_models]
+        return weak_etag(request.get_full_path(), request.user.pk, last_updated, count, *versions)
+
+    # the actions below follow the DRF mixins but put the serialized data straight into a CustomResponse
+
     def create(self, request, *args, **kwargs):
-        response = super().create(request, *args, **kwargs)
-        return CustomResponse({'data': response.data}, status=status.HTTP_201_CREATED)
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.perform_create(serializer)
+        return CustomResponse({'data': serializer.data}, status=status.HTTP_201_CREATED)
 
     def update(self, request, *args, **kwargs):
-        response = super().update(request, *args, **kwargs)
-        return CustomResponse({'data': response.data}, status=status.HTTP_200_OK)
+        partial = kwargs.pop('partial', False)
+        instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+
+        if getattr(instance, '_prefetched_objects_cache', None):
+            # prefetched relations may have changed with the update
+            instance._prefetched_objects_cache = {}
+
+        return CustomResponse({'data': serializer.data}, status=status.HTTP_200_OK)
 
     def destroy(self, request, *args, **kwargs):
-        response = super().destroy(request, *args, **kwargs)
-        return CustomResponse({'data': response.data}, status=status.HTTP_204_NO_CONTENT)
+        self.perform_destroy(self.get_object())
+        return CustomResponse({'data': None}, status=status.HTTP_204_NO_CONTENT)
 
     def list(self, request, *args, **kwargs):
-        response = super().list(request, *args, **kwargs)
-        return CustomResponse({'data': response.data}, status=status.HTTP_200_OK)
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            data = CustomResponse.envelope(self.paginator.get_paginated_data(self.get_serializer(page, many=True).data))
+        else:
+            data = self.get_serializer(queryset, many=True).data
+        return CustomResponse({'data': data}, status=status.HTTP_200_OK)
@@ -15,6 +15,7 @@ class ListingInfoViewSet(GeneralViewSet):
     serializer_class = ListingInfoSerializer
     permission_classes = [IsAuthenticated]
     parser_classes = [MultiPartParser, FormParser]
+    etag_models = (PropertyPhoto,)
 
     def get_listing_object(self):
         try:
@@ -1,18 +1,20 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound
-from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAuthenticated
 
 from apps.property_management.application.pagination import PropertiesPagination
+from apps.property_management.application.services.view_counter import ViewCounter
 from apps.property_management.infrastructure.filters import PropertyFilter
-from apps.property_management.infrastructure.models import Property
+from apps.property_management.infrastructure.models import ListingInfo, Property, PropertyPhoto, RentDetail
 from apps.property_management.interface.serializers import PropertySerializer
 from apps.user_management.application.permissions import IsKYCApproved, IsPropertyOwner
 from common.constants import Error, Success
+from common.filters import RankedOrderingFilter
 from common.utils import CustomResponse
 
 from .general import GeneralViewSet
@@ -23,9 +25,10 @@ class PropertyViewSet(GeneralViewSet):
     serializer_class = PropertySerializer
     pagination_class = PropertiesPagination
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, RankedOrderingFilter]
     filterset_class = PropertyFilter
     ordering = ['-created_at']
+    etag_models = (ListingInfo, PropertyPhoto, RentDetail)
 
     @action(detail=True, methods=['patch'], url_path='publish', permission_classes=[IsAuthenticated, IsKYCApproved, IsPropertyOwner])
     def publish(self, request, pk=None):
@@ -46,6 +49,18 @@ class PropertyViewSet(GeneralViewSet):
 
         return CustomResponse({"message": Success.PROPERTY_PUBLISHED_STATUS, "data": serializer.data}, status=status.HTTP_200_OK)
 
+    @action(detail=True, methods=['get'], url_path='views', permission_classes=[IsAuthenticated, IsPropertyOwner])
+    def views(self, request, pk=None):
+        property = self.get_object()
+        days = request.query_params.get('days', '30')
+        if not days.isdigit() or not 1 <= int(days) <= 365:
+            return CustomResponse({"error": Error.VIEW_STATS_DAYS_INVALID}, status=status.HTTP_400_BAD_REQUEST)
+
+        since = timezone.localdate() - timedelta(days=int(days) - 1)
+        return CustomResponse(
+            {"message": Success.PROPERTY_VIEW_STATS, "data": ViewCounter.get_stats(property.id, since)}, status=status.HTTP_200_OK
+        )
+
     def get_queryset(self):
         # Skip during Swagger schema generation
         if getattr(self, 'swagger_fake_view', False):
@@ -55,7 +70,7 @@ class PropertyViewSet(GeneralViewSet):
         if not user.is_authenticated:
             return self.queryset.none()
 
-        return self.queryset.filter(property_owner=user)
+        return self.queryset.filter(property_owner=user).with_list_details()
 
     def get_object(self):
         try:
@@ -5,7 +5,6 @@ from django.shortcuts import get_object_or_404
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
-from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -18,19 +17,28 @@ from apps.property_management.interface.serializers import (
     DocumentRetrieveSerializer,
     UploadDocumentFormSerializer,
 )
+from common.conditional_get_mixin import ConditionalGetMixin, rows_etag_parts, weak_etag
 from common.constants import Error, Success
+from common.filters import RankedOrderingFilter
 from common.utils import CustomResponse
 
 
-class PropertyDocumentsViewSet(APIView):
+class PropertyDocumentsViewSet(ConditionalGetMixin, APIView):
     serializer_class = DocumentCreateSerializer
     pagination_class = DocumentsPagination
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, RankedOrderingFilter]
     filterset_class = DocumentFilter
     ordering = ['-created_at']
     parser_classes = [MultiPartParser, FormParser]
 
+    def get_etag(self, request):
+        property_id = request.query_params.get('property')
+        if not property_id:
+            return None
+        documents = PropertyDocument.objects.filter(property=property_id, unit=request.query_params.get('unit'))
+        return weak_etag(request.get_full_path(), request.user.pk, *rows_etag_parts(documents))
+
     @staticmethod
     def check_document_types(property_id, unit_id, data):
         document_types = [item['document_type'] for item in data]
@@ -166,6 +174,7 @@ class PropertyDocumentsViewSet(APIView):
         filterset = self.filterset_class(request.query_params, queryset=queryset)
         if filterset.is_valid():
             queryset = filterset.qs
+        queryset = RankedOrderingFilter().filter_queryset(request, queryset, self)
 
         paginator = self.pagination_class()
 
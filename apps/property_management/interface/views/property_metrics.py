@@ -1,6 +1,7 @@
 from rest_framework.permissions import IsAuthenticated
 
-from apps.property_management.infrastructure.models import Property
+from apps.property_management.application.services.property_metrics_service import PropertyMetricsService
+from apps.property_management.infrastructure.models import Property, PropertyMetrics
 from apps.property_management.interface.serializers import PropertySerializer
 from common.constants import Success
 from common.utils import CustomResponse
@@ -8,17 +9,19 @@ from common.utils import CustomResponse
 from .general import GeneralViewSet
 
 
-# this has dummy response
 class PropertyMetricsViewSet(GeneralViewSet):
     queryset = Property.objects.all()
     serializer_class = PropertySerializer
     permission_classes = [IsAuthenticated]
+    etag_models = (PropertyMetrics,)
+    etag_time_bucket = None
+
+    def get_queryset(self):
+        if getattr(self, 'swagger_fake_view', False) or not self.request.user.is_authenticated:
+            return self.queryset.none()
+        return self.queryset.filter(property_owner=self.request.user)
 
     def retrieve(self, request, *args, **kwargs):
-        # property_instance = self.get_object()
-        all_data = dict()
-        all_data['rental_income'] = '-'
-        all_data['occupancy_rate'] = '-'
-        all_data['avg_lease_term'] = '-'
-        all_data['avg_tenant_rating'] = '-'
-        return CustomResponse({'data': all_data, 'message': Success.PROPERTY_METRICS})
+        """Rental income, occupancy rate in percent and average lease term in months of the property"""
+        property_instance = self.get_object()
+        return CustomResponse({'data': PropertyMetricsService.get_metrics(property_instance.id), 'message': Success.PROPERTY_METRICS})
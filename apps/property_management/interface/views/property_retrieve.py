@@ -1,5 +1,8 @@
 from rest_framework.permissions import IsAuthenticated
 
+from apps.property_management.application.services.property_cache import PropertyCache
+from apps.property_management.application.services.property_summary_loader import PropertySummaryLoader
+from apps.property_management.application.services.view_counter import ViewCounter
 from apps.property_management.infrastructure.models import Property, Unit
 from apps.property_management.interface.serializers import (
     PropertyRetrieveSerializer,
@@ -7,6 +10,7 @@ from apps.property_management.interface.serializers import (
     PropertySummaryRetrieveSerializer,
     UnitRetrieveSerializer,
 )
+from common.conditional_get_mixin import weak_etag
 from common.utils import CustomResponse
 
 from .general import GeneralViewSet
@@ -17,29 +21,58 @@ class PropertyRetrieveViewSet(GeneralViewSet):
     serializer_class = PropertySerializer
     permission_classes = [IsAuthenticated]
 
+    def get_etag(self, request):
+        # the summary covers every table of the property, all of which bump its cache version
+        if self.action != 'retrieve':
+            return super().get_etag(request)
+        return weak_etag(request.get_full_path(), request.user.pk, PropertyCache.get_version(self.kwargs['pk']))
+
+    def not_modified(self, request):
+        # a revalidated summary is a view as well
+        if self.action == 'retrieve':
+            self.record_view(request, self.get_object())
+
+    def record_view(self, request, property_instance):
+        if request.user.id != property_instance.property_owner_id:
+            ViewCounter.record(property_instance.id)
+
     def retrieve(self, request, *args, **kwargs):
         property_instance = self.get_object()
-        all_data = self.get_combined_data(property_instance, property_instance.id, unit_instance=None, unit_id=None)
+        self.record_view(request, property_instance)
+        all_data = PropertyCache.get_or_build(
+            'property_summary',
+            request,
+            property_instance.id,
+            PropertyCache.get_version(property_instance.id),
+            lambda: self.get_summary_data(property_instance),
+        )
+        return CustomResponse({'data': all_data})
+
+    def get_summary_data(self, property_instance):
+        summary = PropertySummaryLoader(property_instance.id)
+        property_instance.property_level_photos = summary.get_photos(None)
+        all_data = self.get_combined_data(summary, property_instance, unit_instance=None)
         all_data['units'] = list()
         unit_instances = Unit.objects.filter(property=property_instance.id)
         for unit_instance in unit_instances:
-            unit_data = self.get_combined_data(property_instance, property_instance.id, unit_instance, unit_instance.id)
+            unit_instance.unit_level_photos = summary.get_photos(unit_instance.id)
+            unit_data = self.get_combined_data(summary, property_instance, unit_instance)
             all_data['units'].append(unit_data)
-        return CustomResponse({'data': all_data})
+        return all_data
 
-    def get_combined_data(self, property_instance, property_id, unit_instance, unit_id):
-        details_serializer = PropertyRetrieveSerializer(property_instance)
+    def get_combined_data(self, summary, property_instance, unit_instance):
+        unit_id = unit_instance.id if unit_instance else None
         unit_data = {
-            'rental_details': PropertySummaryRetrieveSerializer.get_rental_details(property_id, unit_id),
-            'amenities': PropertySummaryRetrieveSerializer.get_amenities(property_id, unit_id=unit_id),
-            'cost_fees': PropertySummaryRetrieveSerializer.get_cost_fees(property_id, unit_id),
-            'documents': PropertySummaryRetrieveSerializer.get_documents(property_id, unit_id),
+            'rental_details': PropertySummaryRetrieveSerializer.get_rental_details(summary, unit_id),
+            'amenities': PropertySummaryRetrieveSerializer.get_amenities(summary, unit_instance or property_instance, unit_id),
+            'cost_fees': PropertySummaryRetrieveSerializer.get_cost_fees(summary, unit_id),
+            'documents': PropertySummaryRetrieveSerializer.get_documents(summary, unit_id),
         }
         if not unit_id:
             property_data = {
-                'detail': details_serializer.data,
-                'listing_info': PropertySummaryRetrieveSerializer.get_listing_info(property_id),
-                'owners': PropertySummaryRetrieveSerializer.get_owners(property_id),
+                'detail': PropertyRetrieveSerializer(property_instance).data,
+                'listing_info': PropertySummaryRetrieveSerializer.get_listing_info(property_instance.id),
+                'owners': PropertySummaryRetrieveSerializer.get_owners(property_instance.id),
             }
             unit_data.update(property_data)
         else:
@@ -1,15 +1,70 @@
-from rest_framework.response import Response
+import hashlib
+import json
+from itertools import islice
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.views import APIView
 
-from apps.property_management.infrastructure.models.listing_info import ListingInfo
+from apps.property_management.application.pagination import PublicListingsPagination
+from apps.property_management.infrastructure.models import ListingInfo, Property, PropertyPhoto
 from apps.property_management.interface.serializers.listing_info import ListingInfoSerializer
+from common.constants import Success
+from common.model_version import get_model_version
+from common.utils import CustomResponse, get_presigned_urls
+
+PUBLIC_LISTINGS_CACHE_TIMEOUT = 300
+STREAM_CHUNK_SIZE = 200
 
 
 class PublicListingAPIView(APIView):
+    """
+    Published listings, newest first, a cursor paginated page per request. Pages are cached for all visitors until a
+    property, listing or photo is written. ``?stream=true`` streams the whole catalogue as one JSON document instead.
+    """
+
     authentication_classes = []
     permission_classes = []
 
+    def get_queryset(self):
+        return (
+            ListingInfo.objects.filter(property__published=True)
+            .select_related('property')
+            .prefetch_related('property__property_photos')
+            .order_by('-created_at', '-id')
+        )
+
     def get(self, request):
-        listings = ListingInfo.objects.all()
-        serializer = ListingInfoSerializer(listings, many=True)
-        return Response(serializer.data)
+        if request.query_params.get('stream') == 'true':
+            return StreamingHttpResponse(self._stream(), content_type='application/json')
+
+        # pages are keyed on the parameters they depend on only, other parameters don't add entries
+        paginator = PublicListingsPagination()
+        page_params = (paginator.get_page_size(request), paginator.decode_cursor(request.query_params.get(paginator.cursor_query_param)))
+        versions = ':'.join(str(get_model_version(model)) for model in (Property, ListingInfo, PropertyPhoto))
+        key = f'public_listings:{versions}:{hashlib.sha1(repr(page_params).encode()).hexdigest()}'
+        data = cache.get(key)
+        if data is None:
+            page = paginator.paginate_queryset(self.get_queryset(), request)
+            data = paginator.get_paginated_data(self._serialize(page))
+            cache.set(key, data, PUBLIC_LISTINGS_CACHE_TIMEOUT)
+        return CustomResponse(data)
+
+    @staticmethod
+    def _serialize(listings):
+        # sign the photos of all listings in one batch, the serializer then reads the urls from the cache
+        for listing in listings:
+            listing.property.listing_photos = sorted(listing.property.property_photos.all(), key=lambda photo: photo.pk)
+        get_presigned_urls([photo.photo.name for listing in listings for photo in listing.property.listing_photos])
+        return ListingInfoSerializer(listings, many=True).data
+
+    def _stream(self):
+        listings = self.get_queryset().iterator(chunk_size=STREAM_CHUNK_SIZE)
+        separator = ''
+        yield '{"data": ['
+        while chunk := list(islice(listings, STREAM_CHUNK_SIZE)):
+            for data in self._serialize(chunk):
+                yield separator + json.dumps(data, cls=JSONEncoder)
+                separator = ', '
+        yield f'], "error": null, "success": true, "message": {json.dumps(Success.PUBLIC_LISTINGS_LIST)}}}'
@@ -1,7 +1,10 @@
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 
+from apps.property_management.application.services.top_listings_service import TopListingsService
 from apps.property_management.infrastructure.models import Property
 from apps.property_management.interface.serializers import PropertySerializer
+from common.utils import CustomResponse
 
 from .general import GeneralViewSet
 
@@ -13,3 +16,10 @@ class TopListingsViewSet(GeneralViewSet):
 
     def get_queryset(self):
         return self.queryset.order_by('-created_at')[:8]
+
+    def get_etag(self, request):
+        # the snapshot changes with view counts too, which no row of the queryset reflects
+        return None
+
+    def list(self, request, *args, **kwargs):
+        return CustomResponse({'data': TopListingsService.get_snapshot()}, status=status.HTTP_200_OK)
@@ -1,19 +1,20 @@
 from datetime import datetime
 
+from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
-from rest_framework.filters import OrderingFilter
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 
 from apps.property_management.application.pagination import UnitsPagination
 from apps.property_management.infrastructure.filters import UnitFilter
-from apps.property_management.infrastructure.models import Property, PropertyPhoto, Unit
+from apps.property_management.infrastructure.models import Property, PropertyPhoto, RentDetail, Unit
 from apps.property_management.interface.serializers import UnitSerializer, UnitUpdateSerializer
 from apps.user_management.application.permissions import IsKYCApproved, IsUnitOwner
 from common.constants import Error, Success
+from common.filters import RankedOrderingFilter
 from common.utils import CustomResponse
 
 from .general import GeneralViewSet
@@ -24,10 +25,11 @@ class UnitInfoViewSet(GeneralViewSet):
     serializer_class = UnitSerializer
     pagination_class = UnitsPagination
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, OrderingFilter]
+    filter_backends = [DjangoFilterBackend, RankedOrderingFilter]
     filterset_class = UnitFilter
     ordering = ['-created_at']
     parser_classes = [MultiPartParser, FormParser, JSONParser]
+    etag_models = (PropertyPhoto, RentDetail)
 
     # This update is with 'put' method and property id in url
     def update(self, request, *args, **kwargs):
@@ -79,7 +81,10 @@ class UnitInfoViewSet(GeneralViewSet):
         property_id = self.request.query_params.get('property')
         if not property_id:
             raise ValidationError(Error.PROPERTY_ID_REQUIRED)
-        return self.queryset.filter(property=property_id)
+        return self.queryset.filter(property=property_id).prefetch_related(
+            Prefetch('unit_rent_details', queryset=RentDetail.objects.order_by('pk'), to_attr='unit_level_rent_details'),
+            Prefetch('unit_photos', queryset=PropertyPhoto.objects.order_by('pk'), to_attr='unit_level_photos'),
+        )
 
     def get_object(self):
         try:
@@ -1,30 +1,61 @@
 from rest_framework.permissions import IsAuthenticated
 
+from apps.property_management.application.services.property_cache import PropertyCache
+from apps.property_management.application.services.property_summary_loader import PropertySummaryLoader
+from apps.property_management.application.services.view_counter import ViewCounter
 from apps.property_management.infrastructure.models import Unit
 from apps.property_management.interface.serializers import PropertySummaryRetrieveSerializer, UnitRetrieveSerializer, UnitSerializer
+from common.conditional_get_mixin import weak_etag
 from common.utils import CustomResponse
 
 from .general import GeneralViewSet
 
 
 class UnitSummaryViewSet(GeneralViewSet):
-    queryset = Unit.objects.all()
+    queryset = Unit.objects.select_related('property')
     serializer_class = UnitSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_etag(self, request):
+        # the summary covers every table of the unit's property, all of which bump its cache version
+        if self.action != 'retrieve':
+            return super().get_etag(request)
+        property_id = Unit.objects.filter(pk=self.kwargs['pk']).values_list('property_id', flat=True).first()
+        return weak_etag(request.get_full_path(), request.user.pk, PropertyCache.get_version(property_id)) if property_id else None
+
+    def not_modified(self, request):
+        # a revalidated summary is a view as well
+        if self.action == 'retrieve':
+            self.record_view(request, self.get_object())
+
+    def record_view(self, request, unit_instance):
+        if request.user.id != unit_instance.property.property_owner_id:
+            ViewCounter.record(unit_instance.property_id, unit_instance.id)
+
     def retrieve(self, request, *args, **kwargs):
         unit_instance = self.get_object()
-        property_instance = unit_instance.property
-        all_data = self.get_combined_data(property_instance, property_instance.id, unit_instance, unit_instance.id)
+        self.record_view(request, unit_instance)
+        all_data = PropertyCache.get_or_build(
+            'unit_summary',
+            request,
+            unit_instance.id,
+            PropertyCache.get_version(unit_instance.property_id),
+            lambda: self.get_summary_data(unit_instance),
+        )
         return CustomResponse({'data': all_data})
 
-    def get_combined_data(self, property_instance, property_id, unit_instance, unit_id):
+    def get_summary_data(self, unit_instance):
+        summary = PropertySummaryLoader(unit_instance.property_id, unit_ids=[unit_instance.id])
+        unit_instance.unit_level_photos = summary.get_photos(unit_instance.id)
+        return self.get_combined_data(summary, unit_instance)
+
+    def get_combined_data(self, summary, unit_instance):
         details_serializer = UnitRetrieveSerializer(unit_instance)
         unit_data = {
             'detail': details_serializer.data,
-            'rental_details': PropertySummaryRetrieveSerializer.get_rental_details(property_id, unit_id),
-            'amenities': PropertySummaryRetrieveSerializer.get_amenities(property_id, unit_id=unit_id),
-            'cost_fees': PropertySummaryRetrieveSerializer.get_cost_fees(property_id, unit_id),
-            'documents': PropertySummaryRetrieveSerializer.get_documents(property_id, unit_id),
+            'rental_details': PropertySummaryRetrieveSerializer.get_rental_details(summary, unit_instance.id),
+            'amenities': PropertySummaryRetrieveSerializer.get_amenities(summary, unit_instance, unit_instance.id),
+            'cost_fees': PropertySummaryRetrieveSerializer.get_cost_fees(summary, unit_instance.id),
+            'documents': PropertySummaryRetrieveSerializer.get_documents(summary, unit_instance.id),
         }
         return unit_data
@@ -1,3 +1,5 @@
+from django.db.models import CharField, Count, F, Max, Q, Value
+from django.db.models.functions import Concat
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -5,62 +7,62 @@ from rest_framework.views import APIView
 from apps.property_management.application.pagination import UserPropertiesAndUnitsPagination
 from apps.property_management.infrastructure.models import Property, Unit
 from apps.property_management.interface.serializers import UserPropertyUnitSerializer
+from common.conditional_get_mixin import ConditionalGetMixin, rows_etag_parts, weak_etag
 from common.constants import Success
-from common.filters import CustomSearchFilter
 from common.utils import CustomResponse
 
 
-class UserPropertiesAndUnitsView(APIView):
+class UserPropertiesAndUnitsView(ConditionalGetMixin, APIView):
     """
     API view to get vacant properties and units for the authenticated user.
     For single family homes: returns vacant properties only
     For other property types: returns vacant units only
     Supports search functionality for property name, unit number, and type.
+    Both are read, searched and paginated in one query.
     """
 
     permission_classes = [IsAuthenticated]
-    filter_backends = [CustomSearchFilter]
-    search_fields = ['name', 'number', 'type']
+    etag_time_bucket = None
+
+    def get_etag(self, request):
+        properties = Property.objects.filter(property_owner=request.user)
+        parts = rows_etag_parts(properties, Max('unit_property__updated_at'), Count('unit_property'))
+        return weak_etag(request.get_full_path(), request.user.pk, *parts)
 
     def get_queryset(self):
-        """Get the base queryset of properties and units for the authenticated user"""
+        """
+        Vacant single family homes and vacant units of the user's other properties as one UNION ALL query, so the
+        search and the page's LIMIT/OFFSET run in the database
+        """
         user = self.request.user
-        result_data = []
-
-        properties = Property.objects.filter(property_owner=user)
-
-        for property_instance in properties:
-            if property_instance.property_type == 'single_family_home':
-                if property_instance.status == 'vacant':
-                    result_data.append({'id': property_instance.id, 'name': property_instance.name, 'type': 'property'})
-            else:
-                units = Unit.objects.filter(property=property_instance, status='vacant')
-                for unit in units:
-                    result_data.append({'id': unit.id, 'name': f"{unit.number} - {property_instance.name}", 'type': 'unit'})
-
-        return result_data
-
-    def filter_queryset(self, queryset):
-        """Apply filters to queryset using filter_backends"""
+        columns = ('id', 'item_name', 'item_type')
+
+        properties = (
+            Property.objects.filter(property_owner=user, property_type='single_family_home', status='vacant')
+            .annotate(item_name=F('name'), item_type=Value('property', output_field=CharField()))
+            .values(*columns)
+        )
+        units = (
+            Unit.objects.filter(property__property_owner=user, status='vacant')
+            .exclude(property__property_type='single_family_home')
+            .annotate(
+                item_name=Concat('number', Value(' - '), 'property__name', output_field=CharField()),
+                item_type=Value('unit', output_field=CharField()),
+            )
+            .values(*columns)
+        )
+        return self.search(properties).union(self.search(units), all=True).order_by('item_type', 'id')
+
+    def search(self, queryset):
+        """Search in name and type, a union can't be filtered so this runs on both of its sides"""
         search_query = self.request.query_params.get('q', '').strip()
-
         if search_query:
-            filtered_data = []
-            search_lower = search_query.lower()
-
-            for item in queryset:
-                # Search in name and type fields (following search_fields pattern)
-                if search_lower in item['name'].lower() or search_lower in item['type'].lower():
-                    filtered_data.append(item)
-
-            return filtered_data
-
+            queryset = queryset.filter(Q(item_name__icontains=search_query) | Q(item_type__icontains=search_query))
         return queryset
 
     def get(self, request):
         """Get list of user properties and units with pagination and search"""
-        queryset = self.get_queryset()
-        filtered_queryset = self.filter_queryset(queryset)
+        filtered_queryset = self.get_queryset()
 
         # Apply pagination
         paginator = UserPropertiesAndUnitsPagination()
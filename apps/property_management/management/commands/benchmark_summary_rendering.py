@@ -0,0 +1,81 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from apps.property_management.infrastructure.models import (
+    Amenity,
+    CostFee,
+    CostFeeCategory,
+    Property,
+    PropertyAssignedAmenity,
+    PropertyDocument,
+    PropertyPhoto,
+    RentDetail,
+    Unit,
+)
+from apps.property_management.interface.views import PropertyRetrieveViewSet
+from common.renderers import ORJSONRenderer
+from common.utils import CustomResponse
+
+
+class Command(BaseCommand):
+    help = 'Compare the throughput of the JSON renderers on a property summary payload. Test data is rolled back.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--units', type=int, default=500)
+        parser.add_argument('--repeat', type=int, default=50)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            property_instance = self.create_property(options['units'])
+            payload = CustomResponse.envelope({'data': PropertyRetrieveViewSet().get_summary_data(property_instance)})
+            transaction.set_rollback(True)
+
+        for renderer in (JSONRenderer(), ORJSONRenderer()):
+            started = time.perf_counter()
+            for _ in range(options['repeat']):
+                body = renderer.render(payload, 'application/json')
+            elapsed = time.perf_counter() - started
+            self.stdout.write(
+                f'{type(renderer).__name__:<16} {len(body):>10} bytes  '
+                f'{elapsed / options["repeat"] * 1000:8.2f} ms/render  '
+                f'{len(body) * options["repeat"] / elapsed / 1024 / 1024:8.1f} MiB/s'
+            )
+
+    @staticmethod
+    def create_property(unit_count):
+        owner = get_user_model().objects.create(email='benchmark@example.com', username='benchmark')
+        property_instance = Property.objects.create(
+            property_owner=owner,
+            name='Benchmark',
+            property_type='multi_family',
+            state='State',
+            city='City',
+            street_address='1 Benchmark Road',
+        )
+        amenity = Amenity.objects.create(amenity='Kitchen', sub_amenity='Oven')
+        units = Unit.objects.bulk_create(Unit(property=property_instance, number=str(index), type='unit_a') for index in range(unit_count))
+        categories = CostFeeCategory.objects.bulk_create(
+            CostFeeCategory(property=property_instance, unit=unit, category_name='Parking') for unit in units
+        )
+        RentDetail.objects.bulk_create(
+            RentDetail(property=property_instance, unit=unit, rental_type='long_term', rent=900) for unit in units
+        )
+        PropertyAssignedAmenity.objects.bulk_create(
+            PropertyAssignedAmenity(property=property_instance, unit=unit, sub_amenity=amenity) for unit in units
+        )
+        CostFee.objects.bulk_create(
+            CostFee(category=category, fee_name='Garage', payment_frequency='monthly', fee_type='flat_fee', is_required='optional')
+            for category in categories
+        )
+        PropertyDocument.objects.bulk_create(
+            PropertyDocument(property=property_instance, unit=unit, document=f'property_documents/{unit.id}.pdf', title='Lease')
+            for unit in units
+        )
+        PropertyPhoto.objects.bulk_create(
+            PropertyPhoto(property=property_instance, unit=unit, photo=f'property_photos/{unit.id}.jpg') for unit in units
+        )
+        return property_instance
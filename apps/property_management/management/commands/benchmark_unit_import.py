@@ -0,0 +1,116 @@
+import gc
+import time
+from collections import defaultdict
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from openpyxl import Workbook, load_workbook
+
+from apps.property_management.application.services.unit_workbook_reader import UnitWorkbookReader
+from apps.property_management.utils import COLUMN_CONFIG, xlsx_sheet_names
+from common.utils import snake_case, str_to_bool
+
+SAMPLE_ROW = {
+    'Unit Type': 'studio',
+    'Total Bedrooms': 1,
+    'Total Bathrooms': 1,
+    'Photo Link': 'https://example.com/unit.jpg',
+    'Long Term': True,
+    'Short Term': False,
+    'Rent': 900,
+    'Amenities (comma-separated)': 'Oven, Sauna',
+    'Category': 'parking',
+    'Fee Name': 'garage',
+    'Payment Frequency is Monthly': 'yes',
+    'Fee Amount': 50,
+    'Flat Fee': 1,
+    'Fee Optional': 'true',
+    'Fee Refundable': True,
+    'Upload Document': 'https://example.com/lease.pdf',
+    'Document Title': 'Lease',
+    'Document Type': 'lease_agreement',
+    'Private': True,
+}
+
+
+class Command(BaseCommand):
+    help = 'Time reading a generated bulk unit import workbook, and its row transformations row by row and column-wise.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--units', type=int, default=5000)
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        sheets = xlsx_sheet_names['others']
+        content = self.build_workbook(sheets, options['units'])
+
+        started = time.perf_counter()
+        workbook = load_workbook(BytesIO(content), read_only=True, data_only=True)
+        raw = {}
+        for sheet_name in sheets:
+            rows = workbook[sheet_name].iter_rows(values_only=True)
+            raw[sheet_name] = ([column.strip() for column in next(rows)], list(rows))
+        workbook.close()
+        self.report('parse sheets', time.perf_counter() - started)
+
+        reader = UnitWorkbookReader(None, 'others')
+        totals = defaultdict(float)
+        for sheet_name, (header, rows) in raw.items():
+            for label, transform in [('row by row', self.row_by_row), ('column-wise', reader.build_sheet)]:
+                elapsed = self.best(transform, options['repeat'], sheet_name, header, rows, sheets[sheet_name])
+                totals[label] += elapsed
+                self.report(f'{sheet_name}, {label}', elapsed)
+        for label, elapsed in totals.items():
+            self.report(f'total, {label}', elapsed)
+
+    @staticmethod
+    def best(transform, repeat, *args):
+        # the best run with the collector off like timeit, the others mostly measure the garbage collector
+        timings = []
+        gc.disable()
+        try:
+            for _ in range(repeat):
+                started = time.perf_counter()
+                transform(*args)
+                timings.append(time.perf_counter() - started)
+        finally:
+            gc.enable()
+        return min(timings)
+
+    def report(self, label, elapsed):
+        self.stdout.write(f'{label:<28} {elapsed * 1000:9.1f} ms')
+
+    @staticmethod
+    def build_workbook(sheets, unit_count):
+        workbook = Workbook()
+        workbook.remove(workbook.active)
+        for sheet_name, columns in sheets.items():
+            worksheet = workbook.create_sheet(sheet_name)
+            worksheet.append(list(columns))
+            for index in range(unit_count):
+                worksheet.append([f'A {index}' if column == 'Unit Number' else SAMPLE_ROW.get(column) for column in columns])
+        content = BytesIO()
+        workbook.save(content)
+        return content.getvalue()
+
+    @staticmethod
+    def row_by_row(sheet_name, header, rows, expected_columns):
+        """The transformation as it was done before, a dict per row and str_to_bool per cell, for comparison."""
+        sheet_data = defaultdict(list)
+        number_index = header.index('Unit Number')
+        for row in rows:
+            sheet_data[snake_case(str(row[number_index]))].append(
+                {expected_columns[column]: row[index] for index, column in enumerate(header) if column in expected_columns}
+            )
+
+        config = COLUMN_CONFIG.get(snake_case(sheet_name), {'fields': {}})['fields']
+        for items in sheet_data.values():
+            for item in items:
+                updates = {}
+                for field, (target_field, target_value) in config.items():
+                    if field in item and str_to_bool(item[field]):
+                        updates[target_field] = target_value
+                item.update(updates)
+                for field in config:
+                    item.pop(field, None)
+        return dict(sheet_data)
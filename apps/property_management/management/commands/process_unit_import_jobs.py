@@ -0,0 +1,34 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.property_management.application.services.unit_import_service import UnitImportService
+
+
+class Command(BaseCommand):
+    help = 'Run the queued bulk unit imports, oldest first. Several workers can run side by side.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Exit once no job is pending instead of waiting for new ones.')
+        parser.add_argument('--interval', type=float, default=5, help='Seconds to wait between polls when no job is pending.')
+
+    def handle(self, *args, **options):
+        if settings.CACHES['default']['BACKEND'].endswith('LocMemCache'):
+            self.stderr.write(
+                'The cache is local to this process, the API keeps serving data cached before the imports until it '
+                'expires. Set REDIS_URL to share the cache.'
+            )
+        while True:
+            job = UnitImportService.claim_next()
+            if job is None:
+                if options['once']:
+                    return
+                time.sleep(options['interval'])
+                continue
+
+            job = UnitImportService.run(job)
+            self.stdout.write(
+                f'Unit import {job.pk}: {job.status}, {job.units_created} of {job.total_units} units created'
+                + (f' ({job.error})' if job.error else '')
+            )
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from apps.property_management.application.services.property_metrics_service import PropertyMetricsService
+
+
+class Command(BaseCommand):
+    help = 'Recompute the metrics rollups of all properties from their rents, units and leases.'
+
+    def handle(self, *args, **options):
+        count = PropertyMetricsService.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt the metrics of {count} properties.'))
@@ -1 +1,1658 @@
-# Create your tests here.
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from io import BytesIO, StringIO
+from types import SimpleNamespace
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import boto3
+import pandas as pd
+from botocore.config import Config
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from openpyxl import Workbook, load_workbook
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.property_management.application.services.availability_service import AvailabilityService
+from apps.property_management.application.services.media_fetcher import MediaFetcher, MediaFetchError
+from apps.property_management.application.services.property_cache import PropertyCache
+from apps.property_management.application.services.top_listings_service import TopListingsService
+from apps.property_management.application.services.unit_import_service import UnitImportService
+from apps.property_management.application.services.unit_workbook_reader import UnitWorkbookReader
+from apps.property_management.application.services.view_counter import ViewCounter
+from apps.property_management.domain.value_objects import DateRange
+from apps.property_management.infrastructure.models import (
+    Amenity,
+    CalendarSlot,
+    CostFee,
+    CostFeeCategory,
+    ListingInfo,
+    ListingViewCount,
+    Property,
+    PropertyAssignedAmenity,
+    PropertyDocument,
+    PropertyMetrics,
+    PropertyPhoto,
+    RentDetail,
+    Unit,
+    UnitImportJob,
+)
+from apps.property_management.infrastructure.search import keyword_search
+from apps.property_management.interface.serializers import BulkUnitImportSerializer
+from apps.property_management.interface.views.public_listing import PUBLIC_LISTINGS_CACHE_TIMEOUT
+from apps.property_management.utils import xlsx_sheet_names
+from apps.shared.infrastructure.services.s3_service import S3Service
+from apps.user_management.infrastructure.models import TenantInvitation
+from common.conditional_get_mixin import ConditionalGetMixin
+from common.pagination import CountStrategyPaginator, EstimatedCount
+from common.renderers import ORJSONRenderer
+
+
+class PropertyListQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        for index in range(12):
+            property_type = 'single_family_home' if index % 2 else 'multi_family'
+            property = Property.objects.create(
+                property_owner=cls.owner,
+                name=f'Property {index}',
+                property_type=property_type,
+                state='State',
+                city='City',
+                street_address=f'{index} Main Street',
+            )
+            ListingInfo.objects.create(
+                property=property, listed_by='agent_broker', number_of_units=2, description='', showing_availability={}
+            )
+            PropertyPhoto.objects.create(property=property, photo=f'property_photos/{index}.jpg')
+            for unit_index in range(2):
+                unit = Unit.objects.create(property=property, number=f'{index}-{unit_index}', type='studio')
+                RentDetail.objects.create(property=property, unit=unit, rental_type='long_term', rent=1000 + unit_index * 500)
+                PropertyPhoto.objects.create(property=property, unit=unit, photo=f'property_photos/{index}-{unit_index}.jpg')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _list(self, page_size):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('detail-list'), {'page_size': page_size})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']['data']['results'], len(queries)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self._list(1)  # the count is cached from the first page on
+        small_page, small_page_queries = self._list(2)
+        large_page, large_page_queries = self._list(12)
+
+        self.assertEqual(len(small_page), 2)
+        self.assertEqual(len(large_page), 12)
+        self.assertEqual(small_page_queries, large_page_queries)
+
+    def test_list_reads_annotated_values(self):
+        results, _ = self._list(12)
+        by_name = {result['name']: result for result in results}
+
+        self.assertEqual(by_name['Property 0']['rent'], 1250.0)
+        self.assertEqual(by_name['Property 1']['rent'], 1000.0)
+        self.assertEqual(by_name['Property 0']['number_of_units'], 2)
+        self.assertEqual(len(by_name['Property 0']['photos']), 1)
+
+    def test_cursor_pages_walk_both_ways(self):
+        pages = []
+        url, params = reverse('detail-list'), {'cursor': '', 'page_size': 5}
+        while url:
+            page = self.client.get(url, params).json()['data']['data']
+            pages.append(page)
+            url, params = page['next'], None
+
+        names = [[result['name'] for result in page['results']] for page in pages]
+        self.assertEqual([len(page) for page in names], [5, 5, 2])
+        self.assertEqual(names[0][0], 'Property 11')
+        self.assertIsNone(pages[0]['previous'])
+        self.assertIsNone(pages[0]['count'])
+
+        previous = self.client.get(pages[2]['previous']).json()['data']['data']
+        self.assertEqual([result['name'] for result in previous['results']], names[1])
+
+        response = self.client.get(reverse('detail-list'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 404)
+
+    def test_count_is_cached_until_a_property_is_written(self):
+        _, first_queries = self._list(2)
+        _, cached_queries = self._list(2)
+        self.assertEqual(cached_queries, first_queries - 1)
+
+        Property.objects.create(
+            property_owner=self.owner, name='New', property_type='multi_family', state='S', city='C', street_address='1'
+        )
+        response = self.client.get(reverse('detail-list'), {'page_size': 2})
+        self.assertEqual(response.json()['data']['data']['count'], 13)
+        self.assertFalse(response.json()['data']['data']['count_is_approximate'])
+
+    def test_planner_estimate_is_flagged_as_approximate(self):
+        self.assertEqual(EstimatedCount().count(Property.objects.all(), None), (12, False))
+
+        estimate, approximate = EstimatedCount(threshold=0).count(Property.objects.all(), None)
+        self.assertTrue(approximate)
+        self.assertIsInstance(estimate, int)
+
+    def test_pages_past_a_low_estimate_are_found(self):
+        def page(number, estimate):
+            paginator = CountStrategyPaginator(Property.objects.order_by('pk'), 5, EstimatedCount(), None)
+            with mock.patch.object(EstimatedCount, 'count', return_value=(estimate, True)):
+                return paginator.page(number)
+
+        last = page(3, 4)
+        self.assertEqual(len(last), 2)
+        self.assertEqual((last.paginator.count, last.paginator.count_is_approximate), (12, False))
+        self.assertTrue(page(1, 5).has_next())
+        self.assertEqual(page(1, 30).paginator.count, 30)
+
+    def test_filtered_counts_follow_the_filtered_tables(self):
+        day = date(2030, 1, 1)
+
+        def count():
+            response = self.client.get(reverse('detail-list'), {'page_size': 2, 'availability_date': day})
+            return response.json()['data']['data']['count']
+
+        self.assertEqual(count(), 12)
+        with self.captureOnCommitCallbacks(execute=True):
+            AvailabilityService.block(Property.objects.get(name='Property 0').id, None, [DateRange(day, day)])
+        self.assertEqual(count(), 11)
+
+
+@override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0)
+class PropertySummaryQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.properties = {}
+        for unit_count in (1, 6):
+            property = Property.objects.create(
+                property_owner=cls.owner,
+                name=f'Building {unit_count}',
+                property_type='multi_family',
+                state='State',
+                city='City',
+                street_address=f'{unit_count} Summary Street',
+            )
+            amenity = Amenity.objects.create(amenity='Kitchen', sub_amenity='Oven')
+            for unit_index in range(unit_count):
+                unit = Unit.objects.create(property=property, number=str(unit_index), type='unit_a')
+                RentDetail.objects.create(property=property, unit=unit, rental_type='long_term', rent=900)
+                PropertyAssignedAmenity.objects.create(property=property, unit=unit, sub_amenity=amenity)
+                category = CostFeeCategory.objects.create(property=property, unit=unit, category_name='Parking')
+                CostFee.objects.create(
+                    category=category, fee_name='Garage', payment_frequency='monthly', fee_type='flat_fee', is_required='optional'
+                )
+                PropertyDocument.objects.create(
+                    property=property,
+                    unit=unit,
+                    document=f'property_documents/{unit_index}.pdf',
+                    title='Lease',
+                    document_type='lease_agreement',
+                )
+                PropertyPhoto.objects.create(property=property, unit=unit, photo=f'property_photos/{unit_index}.jpg')
+            cls.properties[unit_count] = property
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _summary(self, property):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('property_details-detail', args=[property.id]))
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_query_count_does_not_depend_on_unit_count(self):
+        small_summary, small_summary_queries = self._summary(self.properties[1])
+        large_summary, large_summary_queries = self._summary(self.properties[6])
+
+        self.assertEqual(len(small_summary['units']), 1)
+        self.assertEqual(len(large_summary['units']), 6)
+        self.assertEqual(small_summary_queries, large_summary_queries)
+
+    def test_units_keep_their_own_rows(self):
+        summary, _ = self._summary(self.properties[6])
+        unit = summary['units'][0]
+
+        self.assertEqual(unit['rental_details']['rent'], '900.00')
+        self.assertEqual(unit['amenities']['Kitchen'][0]['name'], 'Oven')
+        self.assertEqual(unit['cost_fees'][0]['fees'][0]['fee_name'], 'Garage')
+        self.assertEqual(len(unit['documents']), 1)
+        self.assertEqual(len(unit['detail']['photos']), 1)
+        self.assertIsNone(summary['rental_details'])
+        self.assertEqual(summary['documents'], [])
+
+    def test_summary_is_cached_until_the_property_is_written(self):
+        property = self.properties[6]
+        self._summary(property)
+        _, cached_queries = self._summary(property)
+        self.assertEqual(cached_queries, 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RentDetail.objects.filter(unit__property=property).first().delete()
+        summary, _ = self._summary(property)
+        self.assertEqual(len([unit for unit in summary['units'] if unit['rental_details'] is None]), 1)
+
+        other_user = get_user_model().objects.create(email='other@example.com', username='other')
+        self.client.force_authenticate(other_user)
+        _, other_user_queries = self._summary(property)
+        self.assertGreater(other_user_queries, 1)
+
+    def test_saving_amenities_returns_the_saved_amenities(self):
+        property = self.properties[6]
+        unit = Unit.objects.filter(property=property).order_by('pk').first()
+        fridge = Amenity.objects.create(amenity='Kitchen', sub_amenity='Fridge')
+        data = {'property_id': property.id, 'sub_amenities': [fridge.id], 'other_amenities': ['Garden'], 'page_saved': 3}
+
+        response = self.client.post(reverse('amenities-list'), {**data, 'unit_id': unit.id}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data'], {'Kitchen': [{'id': fridge.id, 'name': 'Fridge'}], 'other_amenities': [['Garden']]})
+
+        response = self.client.post(reverse('amenities-list'), data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['data'], {'Kitchen': [{'id': fridge.id, 'name': 'Fridge'}], 'other_amenities': [['Garden']]})
+        self.assertEqual(PropertyAssignedAmenity.objects.filter(property=property).count(), 7)
+
+
+class UnitListQueryCountTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner,
+            name='Building',
+            property_type='multi_family',
+            state='State',
+            city='City',
+            street_address='1 Unit Street',
+        )
+        for unit_index in range(10):
+            unit = Unit.objects.create(property=cls.property, number=str(unit_index), type='unit_a')
+            RentDetail.objects.create(
+                property=cls.property, unit=unit, rental_type='long_term', rent=700, assigned_tenant=f'Tenant {unit_index}'
+            )
+            PropertyPhoto.objects.create(property=cls.property, unit=unit, photo=f'property_photos/{unit_index}.jpg')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _list(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('unit-list'), {'property': self.property.id, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']['data']['results'], len(queries)
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        self._list(page_size=1)  # the count is cached from the first page on
+        small_page, small_page_queries = self._list(page_size=2)
+        large_page, large_page_queries = self._list(page_size=10)
+
+        self.assertEqual(len(small_page), 2)
+        self.assertEqual(len(large_page), 10)
+        self.assertEqual(small_page_queries, large_page_queries)
+        self.assertTrue(all(unit['rent'] == 700.0 and len(unit['photos']) == 1 for unit in large_page))
+
+    def test_tenant_search_returns_each_unit_once(self):
+        results, _ = self._list(q='Tenant', page_size=20)
+
+        self.assertEqual(len(results), 10)
+        self.assertEqual(len({unit['id'] for unit in results}), 10)
+        self.assertEqual(self._list(q='Tenant 3')[0][0]['tenants'], 'Tenant 3')
+
+
+class CalendarSlotListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=owner,
+            name='Cottage',
+            property_type='single_family_home',
+            state='State',
+            city='City',
+            street_address='1 Calendar Street',
+        )
+        CalendarSlot.objects.create(
+            property=cls.property, start_date=date(2025, 2, 3), end_date=date(2025, 2, 4), status='unavailable', reason='Repairs'
+        )
+        CalendarSlot.objects.create(
+            property=cls.property, start_date=date(2025, 2, 20), end_date=date(2025, 2, 20), status='unavailable', reason='Repairs'
+        )
+
+    def _list(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().get(reverse('availability-list'), {'property': self.property.id, **params})
+        return response, len(queries)
+
+    def test_month_and_year_range_cost_the_same_queries(self):
+        month, month_queries = self._list(month=2, year=2025)
+        year, year_queries = self._list(start='2025-01-01', end='2025-12-31')
+
+        self.assertEqual(len(month.json()['data']), 28)
+        self.assertEqual(len(year.json()['data']), 365)
+        self.assertEqual(month_queries, year_queries)
+        unavailable = [day['date'] for day in year.json()['data'] if day['status'] == 'unavailable']
+        self.assertEqual(unavailable, ['2025-02-03', '2025-02-04', '2025-02-20'])
+
+    def test_range_is_limited_to_a_year(self):
+        response, _ = self._list(start='2025-01-01', end='2026-01-05')
+        self.assertEqual(response.status_code, 400)
+
+
+class CalendarSlotRangeTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner,
+            name='Cottage',
+            property_type='single_family_home',
+            state='State',
+            city='City',
+            street_address='2 Calendar Street',
+        )
+
+    def _block(self, **payload):
+        response = APIClient().post(reverse('availability-list'), {'property': self.property.id, **payload}, format='json')
+        self.assertEqual(response.status_code, 201)
+
+    def _ranges(self):
+        return list(CalendarSlot.objects.order_by('start_date').values_list('start_date', 'end_date', 'reason'))
+
+    def test_adjacent_dates_are_stored_as_one_range(self):
+        self._block(unavailable_dates=[{'date': '2025-03-01', 'reason': 'Trip'}, {'date': '2025-03-02', 'reason': 'Trip'}])
+        self._block(unavailable_dates=[{'date': '2025-03-03', 'reason': 'Trip'}, {'date': '2025-03-05', 'reason': 'Repairs'}])
+
+        self.assertEqual(self._ranges(), [(date(2025, 3, 1), date(2025, 3, 3), 'Trip'), (date(2025, 3, 5), date(2025, 3, 5), 'Repairs')])
+
+    def test_new_range_overrides_the_days_it_covers(self):
+        self._block(unavailable_ranges=[{'start_date': '2025-01-01', 'end_date': '2025-12-31', 'reason': 'Renovation'}])
+        self._block(unavailable_ranges=[{'start_date': '2025-06-01', 'end_date': '2025-06-10', 'reason': 'Booked'}])
+
+        self.assertEqual(
+            self._ranges(),
+            [
+                (date(2025, 1, 1), date(2025, 5, 31), 'Renovation'),
+                (date(2025, 6, 1), date(2025, 6, 10), 'Booked'),
+                (date(2025, 6, 11), date(2025, 12, 31), 'Renovation'),
+            ],
+        )
+
+    def test_deleting_a_day_splits_the_range(self):
+        self._block(unavailable_ranges=[{'start_date': '2025-04-01', 'end_date': '2025-04-10', 'reason': 'Trip'}])
+        slot = CalendarSlot.objects.get()
+
+        response = APIClient().delete(reverse('availability-detail', args=[slot.id]) + '?date=2025-04-05')
+
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self._ranges(), [(date(2025, 4, 1), date(2025, 4, 4), 'Trip'), (date(2025, 4, 6), date(2025, 4, 10), 'Trip')])
+
+    def test_deleting_by_id_frees_one_day_unless_the_range_is_asked_for(self):
+        self._block(unavailable_ranges=[{'start_date': '2025-04-01', 'end_date': '2025-04-10', 'reason': 'Trip'}])
+        self._block(unavailable_dates=[{'date': '2025-04-20', 'reason': 'Repairs'}])
+        trip, repairs = CalendarSlot.objects.order_by('start_date')
+        client = APIClient()
+
+        response = client.delete(reverse('availability-detail', args=[trip.id]))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.json()['error'], 'Date is required to change one day of a range, pass scope=range to change the whole range.'
+        )
+        # a range of one day is its only day, as the day slots were
+        self.assertEqual(client.delete(reverse('availability-detail', args=[repairs.id])).status_code, 204)
+        self.assertEqual(self._ranges(), [(date(2025, 4, 1), date(2025, 4, 10), 'Trip')])
+
+        self.assertEqual(client.delete(reverse('availability-detail', args=[trip.id]) + '?scope=range').status_code, 204)
+        self.assertEqual(self._ranges(), [])
+
+    def test_updating_by_id_changes_one_day_unless_the_range_is_asked_for(self):
+        self._block(unavailable_ranges=[{'start_date': '2025-04-01', 'end_date': '2025-04-10', 'reason': 'Trip'}])
+        slot = CalendarSlot.objects.get()
+        url = reverse('availability-detail', args=[slot.id])
+        client = APIClient()
+
+        self.assertEqual(
+            client.patch(url, {'reason': 'Guests'}, format='json').json()['error'],
+            'Date is required to change one day of a range, pass scope=range to change the whole range.',
+        )
+        self.assertEqual(
+            client.patch(url, {'end_date': '2025-04-12'}, format='json').json()['error'],
+            'Start and end dates can only be changed with scope=range.',
+        )
+        response = client.patch(url, {'date': '2025-04-05', 'reason': 'Guests'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.json()['data']['start_date'], response.json()['data']['end_date'], response.json()['data']['reason']),
+            ('2025-04-05', '2025-04-05', 'Guests'),
+        )
+        response = client.put(url, {'date': '2025-04-02', 'property': self.property.id, 'status': 'unavailable', 'reason': 'Guests'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            self._ranges(),
+            [
+                (date(2025, 4, 1), date(2025, 4, 1), 'Trip'),
+                (date(2025, 4, 2), date(2025, 4, 2), 'Guests'),
+                (date(2025, 4, 3), date(2025, 4, 4), 'Trip'),
+                (date(2025, 4, 5), date(2025, 4, 5), 'Guests'),
+                (date(2025, 4, 6), date(2025, 4, 10), 'Trip'),
+            ],
+        )
+
+        trip = CalendarSlot.objects.get(start_date=date(2025, 4, 6))
+        response = client.patch(reverse('availability-detail', args=[trip.id]) + '?scope=range', {'end_date': '2025-04-12'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._ranges()[-1], (date(2025, 4, 6), date(2025, 4, 12), 'Trip'))
+
+    def test_availability_date_filter_uses_the_ranges(self):
+        self._block(unavailable_ranges=[{'start_date': '2025-04-01', 'end_date': '2025-04-10', 'reason': 'Trip'}])
+        client = APIClient()
+        client.force_authenticate(self.owner)
+
+        inside = client.get(reverse('detail-list'), {'availability_date': '2025-04-05'}).json()['data']['data']['results']
+        outside = client.get(reverse('detail-list'), {'availability_date': '2025-04-11'}).json()['data']['data']['results']
+
+        self.assertEqual(inside, [])
+        self.assertEqual([result['id'] for result in outside], [self.property.id])
+
+
+class AvailabilityMatrixTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner,
+            name='Building',
+            property_type='multi_family',
+            state='State',
+            city='City',
+            street_address='3 Calendar Street',
+        )
+        cls.units = [Unit.objects.create(property=cls.property, number=str(index), type='unit_a') for index in range(3)]
+        CalendarSlot.objects.create(
+            property=cls.property, unit=cls.units[0], start_date=date(2025, 1, 30), end_date=date(2025, 2, 2), status='unavailable'
+        )
+        CalendarSlot.objects.create(
+            property=cls.property, unit=cls.units[0], start_date=date(2025, 2, 10), end_date=date(2025, 2, 10), status='unavailable'
+        )
+        CalendarSlot.objects.create(
+            property=cls.property, unit=cls.units[1], start_date=date(2025, 2, 27), end_date=date(2025, 3, 5), status='unavailable'
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _matrix(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('availability-matrix'), {'property': self.property.id, 'month': 2, 'year': 2025, **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_bitmap_from_one_query(self):
+        matrix, queries = self._matrix()
+
+        self.assertEqual(queries, 1)
+        self.assertEqual(matrix['days'], 28)
+        bitmaps = [unit['availability'] for unit in matrix['units']]
+        self.assertEqual(bitmaps[0], '11' + '0' * 7 + '1' + '0' * 18)
+        self.assertEqual(bitmaps[1], '0' * 26 + '11')
+        self.assertEqual(bitmaps[2], '0' * 28)
+
+    def test_run_length_encoding(self):
+        matrix, _ = self._matrix(encoding='rle')
+
+        self.assertEqual(matrix['units'][0]['availability'], [[1, 2], [0, 7], [1, 1], [0, 18]])
+        self.assertEqual(matrix['units'][2]['availability'], [[0, 28]])
+
+    def test_only_the_owner_sees_the_units(self):
+        self.client.force_authenticate(get_user_model().objects.create(email='other@example.com', username='other'))
+        matrix, _ = self._matrix()
+        self.assertEqual(matrix['units'], [])
+
+        self.client.force_authenticate(None)
+        response = self.client.get(reverse('availability-matrix'), {'property': self.property.id, 'month': 2, 'year': 2025})
+        self.assertEqual(response.status_code, 401)
+
+
+class KeywordSearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        for name, street_address, city in [
+            ('Maple Court', '12 Oak Street', 'Springfield'),
+            ('Oakwood Residences', '4 Elm Road', 'Shelbyville'),
+            ('Harbor View', '9 Maple Avenue', 'Oakland'),
+        ]:
+            Property.objects.create(
+                property_owner=cls.owner,
+                name=name,
+                property_type='multi_family',
+                state='State',
+                city=city,
+                street_address=street_address,
+            )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _search(self, value):
+        response = self.client.get(reverse('detail-list'), {'q': value})
+        self.assertEqual(response.status_code, 200)
+        return [result['name'] for result in response.json()['data']['data']['results']]
+
+    def test_results_are_ranked_by_field_weight(self):
+        self.assertEqual(self._search('oak'), ['Oakwood Residences', 'Maple Court', 'Harbor View'])
+        self.assertEqual(self._search('maple'), ['Maple Court', 'Harbor View'])
+
+    def test_every_word_has_to_match(self):
+        self.assertEqual(self._search('maple aven'), ['Harbor View'])
+        self.assertEqual(self._search('maple elm'), [])
+
+    def test_search_uses_the_trigram_index(self):
+        queryset = keyword_search(Property.objects.all(), 'ain')
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            plan = queryset.explain()
+            cursor.execute('SET enable_seqscan = on')
+
+        self.assertIn('property_search_idx', plan)
+
+    def test_migration_creates_the_trigram_indexes(self):
+        out = StringIO()
+        call_command('sqlmigrate', 'property_management', '0045', stdout=out)
+        sql = out.getvalue()
+
+        self.assertIn('CREATE EXTENSION IF NOT EXISTS "pg_trgm"', sql)
+        self.assertIn('CREATE INDEX "property_search_idx" ON "property_management_property" USING gin ((UPPER("name")) gin_trgm_ops', sql)
+        self.assertEqual(sql.count(' gin_trgm_ops'), 11)
+
+    def test_infix_matches_are_found(self):
+        self.assertEqual(self._search('ple'), ['Maple Court', 'Harbor View'])
+        self.assertEqual(self._search('rbor vi'), ['Harbor View'])
+
+    def test_hyphenated_and_infix_unit_numbers_are_found(self):
+        property_instance = Property.objects.get(name='Maple Court')
+        for number in ('A-101', 'B-2101', 'C-7'):
+            Unit.objects.create(property=property_instance, number=number, type='apartment')
+
+        def numbers(value):
+            return set(keyword_search(Unit.objects.all(), value).values_list('number', flat=True))
+
+        self.assertEqual(numbers('A-101'), {'A-101'})
+        self.assertEqual(numbers('101'), {'A-101', 'B-2101'})
+        self.assertEqual(numbers('-7'), {'C-7'})
+
+
+class PublicListingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.properties = []
+        for index in range(5):
+            property = Property.objects.create(
+                property_owner=owner,
+                name=f'Listing {index}',
+                property_type='multi_family',
+                state='State',
+                city='City',
+                street_address=f'{index} Public Street',
+                published=index != 4,
+            )
+            ListingInfo.objects.create(property=property, listed_by='agent_broker', description='', showing_availability={})
+            for photo_index in range(index + 1):
+                PropertyPhoto.objects.create(property=property, photo=f'property_photos/{index}-{photo_index}.jpg')
+            cls.properties.append(property)
+
+    def setUp(self):
+        cache.clear()
+
+    def _page(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().get(reverse('public_listings'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_only_published_listings_with_their_photos(self):
+        page, queries = self._page(page_size=2)
+        self.assertEqual([len(listing['photos']) for listing in page['results']], [4, 3])
+        self.assertIsNotNone(page['next'])
+
+        _, all_queries = self._page(page_size=10)
+        self.assertEqual(queries, all_queries)
+
+    def test_page_is_cached_until_a_property_is_published(self):
+        self._page(page_size=10)
+        page, queries = self._page(page_size=10)
+        self.assertEqual(len(page['results']), 4)
+        self.assertEqual(queries, 0)
+
+        self.properties[4].published = True
+        self.properties[4].save()
+        page, _ = self._page(page_size=10)
+        self.assertEqual(len(page['results']), 5)
+
+    def test_other_parameters_and_hosts_share_the_cached_page(self):
+        self._page(page_size=2, utm_source='mail')
+        with CaptureQueriesContext(connection) as queries:
+            response = APIClient().get(reverse('public_listings'), {'page_size': 2, 'junk': 1}, HTTP_HOST='other.example.com')
+        self.assertEqual(len(queries), 0)
+
+        next_url = urlsplit(response.json()['data']['next'])
+        self.assertEqual(set(parse_qs(next_url.query)), {'page_size', 'cursor'})
+        next_page, _ = self._page(**{key: value[0] for key, value in parse_qs(next_url.query).items()})
+        self.assertEqual([len(listing['photos']) for listing in next_page['results']], [2, 1])
+
+    def test_stream_returns_the_whole_catalogue(self):
+        response = APIClient().get(reverse('public_listings'), {'stream': 'true'})
+        body = json.loads(b''.join(response.streaming_content))
+
+        self.assertEqual(len(body['data']), 4)
+        self.assertEqual(body['message'], 'Public listings list.')
+
+
+@override_settings(TOP_LISTINGS_REFRESH_INTERVAL=0)
+class TopListingsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        now = timezone.now()
+        cls.properties = [
+            Property.objects.create(
+                property_owner=cls.owner,
+                name=f'Top {index}',
+                property_type='multi_family',
+                state='State',
+                city='City',
+                street_address=f'{index} Top Street',
+                published=index < 10,
+                published_at=now - timedelta(days=index),
+            )
+            for index in range(11)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _top(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('top_listings-list'))
+        self.assertEqual(response.status_code, 200)
+        return [listing['name'] for listing in response.json()['data']], len(queries)
+
+    def test_snapshot_is_served_from_the_cache(self):
+        names, _ = self._top()
+        self.assertEqual(names, [f'Top {index}' for index in range(8)])
+
+        _, queries = self._top()
+        self.assertEqual(queries, 0)
+
+    def test_publishing_refreshes_the_snapshot(self):
+        self._top()
+        self.properties[10].published_at = timezone.now()
+        self.properties[10].published = True
+        with self.captureOnCommitCallbacks(execute=True):
+            self.properties[10].save()
+
+        names, _ = self._top()
+        self.assertEqual(names[0], 'Top 10')
+
+    def test_views_outweigh_a_few_days_of_age(self):
+        now = timezone.now()
+        fresh = TopListingsService.score(now, 0, 100, now)
+        viewed = TopListingsService.score(now - timedelta(days=3), 100, 100, now)
+
+        self.assertGreater(viewed, fresh)
+
+    def test_cached_presigned_urls_are_still_valid_when_served(self):
+        # a url is reused while it has more than the margin left, every cache holding urls has to expire before that
+        margin = min(S3Service.URL_REISSUE_MARGIN, 3600 // 2)
+        self.assertLess(TopListingsService.SNAPSHOT_TIMEOUT, margin)
+        self.assertLess(PUBLIC_LISTINGS_CACHE_TIMEOUT, margin)
+        # cached summaries are revalidated by clients for another ETag time bucket
+        self.assertLess(PropertyCache.TIMEOUT + ConditionalGetMixin.etag_time_bucket, margin)
+
+
+@override_settings(VIEW_COUNTER_FLUSH_INTERVAL=0, VIEW_COUNTER_MAX_PENDING=100)
+class ViewCounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.visitor = get_user_model().objects.create(email='visitor@example.com', username='visitor')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner,
+            name='Viewed',
+            property_type='multi_family',
+            state='State',
+            city='City',
+            street_address='1 View Street',
+        )
+        cls.units = [Unit.objects.create(property=cls.property, number=str(index), type='studio') for index in range(2)]
+
+    def setUp(self):
+        ViewCounter._pending.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.visitor)
+
+    def _visit(self, property_views, unit_views):
+        for _ in range(property_views):
+            self.client.get(reverse('property_details-detail', args=[self.property.id]))
+        for _ in range(unit_views):
+            self.client.get(reverse('unit_details-detail', args=[self.units[0].id]))
+
+    def test_views_are_buffered_and_added_up_on_flush(self):
+        self._visit(3, 2)
+        self.assertFalse(ListingViewCount.objects.exists())
+
+        ViewCounter.flush()
+        self._visit(1, 0)
+        with CaptureQueriesContext(connection) as queries:
+            ViewCounter.flush()
+
+        rows = {row.unit_id: row.views for row in ListingViewCount.objects.all()}
+        self.assertEqual(rows, {None: 4, self.units[0].id: 2})
+        self.assertEqual(len([query for query in queries if query['sql'].startswith('INSERT')]), 1)
+
+    def test_owner_views_are_not_counted(self):
+        self.client.force_authenticate(self.owner)
+        self._visit(2, 1)
+        self.assertEqual(len(ViewCounter._pending), 0)
+
+    def test_size_threshold_wakes_the_flusher(self):
+        ViewCounter._wake.clear()
+        with self.settings(VIEW_COUNTER_MAX_PENDING=2):
+            ViewCounter.record(self.property.id)
+            self.assertFalse(ViewCounter._wake.is_set())
+            ViewCounter.record(self.property.id, self.units[1].id)
+            self.assertTrue(ViewCounter._wake.is_set())
+        ViewCounter._wake.clear()
+
+    def test_revalidated_views_are_counted(self):
+        for url in (reverse('property_details-detail', args=[self.property.id]), reverse('unit_details-detail', args=[self.units[0].id])):
+            etag = self.client.get(url)['ETag']
+            self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        self.assertEqual(sum(ViewCounter._pending.values()), 4)
+
+    def test_owner_sees_view_stats(self):
+        self._visit(2, 3)
+        ViewCounter.flush()
+
+        self.client.force_authenticate(self.owner)
+        stats = self.client.get(reverse('detail-views', args=[self.property.id]), {'days': 7}).json()['data']
+        self.assertEqual(stats['total'], 5)
+        self.assertEqual(stats['property_views'], 2)
+        self.assertEqual(stats['units'], [{'id': self.units[0].id, 'number': '0', 'views': 3}])
+
+        self.client.force_authenticate(self.visitor)
+        response = self.client.get(reverse('detail-views', args=[self.property.id]))
+        self.assertEqual(response.status_code, 403)
+
+
+class ConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner, name='Tagged', property_type='multi_family', state='State', city='City', street_address='1 Tag Street'
+        )
+        cls.unit = Unit.objects.create(property=cls.property, number='1', type='studio')
+        PropertyDocument.objects.create(property=cls.property, document='property_documents/a.pdf', title='Deed', document_type='other')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _get(self, url, params=None, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params, **headers)
+        return response, len(queries)
+
+    def test_matching_etag_returns_304_from_one_query(self):
+        for url, params in [
+            (reverse('detail-list'), None),
+            (reverse('unit-list'), {'property': self.property.id}),
+            (reverse('upload_document'), {'property': self.property.id}),
+            (reverse('user_properties_units'), None),
+        ]:
+            response, _ = self._get(url, params)
+            etag = response['ETag']
+            self.assertTrue(etag.startswith('W/"'))
+
+            response, queries = self._get(url, params, etag=etag)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.content, b'')
+            self.assertEqual(queries, 1)
+
+    def test_writes_change_the_etag(self):
+        url = reverse('property_details-detail', args=[self.property.id])
+        etag = self._get(url)[0]['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            RentDetail.objects.create(property=self.property, unit=self.unit, rental_type='long_term', rent=700)
+        response, _ = self._get(url, etag=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+        list_etag = self._get(reverse('detail-list'))[0]['ETag']
+        self.property.name = 'Renamed'
+        self.property.save()
+        self.assertEqual(self._get(reverse('detail-list'), etag=list_etag)[0].status_code, 200)
+
+    def test_retrieve_etags_cover_the_rows_of_the_user(self):
+        url = reverse('detail-detail', args=[self.property.id])
+        response, _ = self._get(url)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+
+        self.client.force_authenticate(get_user_model().objects.create(email='other@example.com', username='other'))
+        response, _ = self._get(url, etag='*')
+        self.assertNotEqual(response.status_code, 304)
+        self.assertFalse(response.has_header('ETag'))
+
+    def test_etags_of_presigned_urls_change_with_time(self):
+        now = time.time()
+        for url, params, changes in [
+            (reverse('property_details-detail', args=[self.property.id]), None, True),
+            (reverse('upload_document'), {'property': self.property.id}, True),
+            (reverse('user_properties_units'), None, False),
+        ]:
+            with mock.patch('common.conditional_get_mixin.time.time', return_value=now):
+                etag = self._get(url, params)[0]['ETag']
+            with mock.patch('common.conditional_get_mixin.time.time', return_value=now + ConditionalGetMixin.etag_time_bucket):
+                response, _ = self._get(url, params, etag=etag)
+            self.assertEqual(response.status_code, 200 if changes else 304, url)
+
+
+class UserPropertiesAndUnitsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        other = get_user_model().objects.create(email='other@example.com', username='other')
+        for index in range(6):
+            Property.objects.create(
+                property_owner=cls.owner if index < 5 else other,
+                name=f'House {index}',
+                property_type='single_family_home',
+                status='occupied' if index == 0 else 'vacant',
+                state='State',
+                city='City',
+                street_address=f'{index} Oak Street',
+            )
+        tower = Property.objects.create(
+            property_owner=cls.owner, name='Tower', property_type='multi_family', state='State', city='City', street_address='1 High Street'
+        )
+        for index in range(8):
+            Unit.objects.create(property=tower, number=f'A{index}', type='studio', status='occupied' if index == 0 else 'vacant')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _get(self, params=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('user_properties_units'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_lists_vacant_homes_and_units_in_one_query_per_page(self):
+        data, queries = self._get({'page_size': 5})
+        self.assertEqual(data['count'], 11)
+        self.assertEqual([item['name'] for item in data['results']], ['House 1', 'House 2', 'House 3', 'House 4', 'A1 - Tower'])
+        self.assertEqual([item['type'] for item in data['results']], ['property'] * 4 + ['unit'])
+        # the ETag aggregate, one COUNT and one page of the union, whatever the number of properties
+        self.assertEqual(queries, 3)
+
+        data, _ = self._get({'page_size': 5, 'page': 3})
+        self.assertEqual([item['name'] for item in data['results']], ['A7 - Tower'])
+
+    def test_search_matches_name_and_type(self):
+        data, _ = self._get({'q': 'tower'})
+        self.assertEqual(data['count'], 7)
+        data, _ = self._get({'q': 'house 3'})
+        self.assertEqual([item['name'] for item in data['results']], ['House 3'])
+        data, _ = self._get({'q': 'PROPERTY'})
+        self.assertEqual({item['type'] for item in data['results']}, {'property'})
+        self.assertEqual(data['count'], 4)
+
+
+class PropertyUnitIndexTests(TestCase):
+    """The queries of the property and unit views each have to be answered from their index, not the FK index."""
+
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        amenity = Amenity.objects.create(amenity='Kitchen', sub_amenity='Oven')
+        properties = Property.objects.bulk_create(
+            Property(
+                property_owner=owner,
+                name=f'Tower {index}',
+                property_type='multi_family',
+                state='State',
+                city='City',
+                street_address='1 High Street',
+            )
+            for index in range(300)
+        )
+        units = Unit.objects.bulk_create(
+            Unit(property=property, number=str(number), type='studio') for property in properties for number in range(3)
+        )
+        # every property has property level rows and rows of each of its units, enough of them for the planner to
+        # prefer the narrowest index
+        rows = [(property, None) for property in properties] + [(unit.property, unit) for unit in units]
+        RentDetail.objects.bulk_create(
+            RentDetail(property=property, unit=unit, rental_type='long_term', rent=900) for property, unit in rows
+        )
+        PropertyPhoto.objects.bulk_create(
+            PropertyPhoto(property=property, unit=unit, photo='property_photos/photo.jpg') for property, unit in rows for _ in range(3)
+        )
+        PropertyDocument.objects.bulk_create(
+            PropertyDocument(property=property, unit=unit, document='property_documents/lease.pdf', title='Lease')
+            for property, unit in rows
+        )
+        CostFeeCategory.objects.bulk_create(
+            CostFeeCategory(property=property, unit=unit, category_name='Parking') for property, unit in rows
+        )
+        PropertyAssignedAmenity.objects.bulk_create(
+            PropertyAssignedAmenity(property=property, unit=unit, sub_amenity=amenity) for property, unit in rows
+        )
+        CalendarSlot.objects.bulk_create(
+            CalendarSlot(property=property, unit=unit, start_date=date(2024, 5, 1), end_date=date(2024, 5, 3), status='unavailable')
+            for property, unit in rows
+        )
+        cls.property, cls.unit = properties[-1], units[-1]
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def _plan(self, queryset):
+        with connection.cursor() as cursor:
+            # the tables are small enough to be read whole, that isn't what's being checked
+            cursor.execute('SET enable_seqscan = off')
+            plan = queryset.explain()
+            cursor.execute('SET enable_seqscan = on')
+        return plan
+
+    def test_property_level_photos_use_the_partial_index(self):
+        plan = self._plan(PropertyPhoto.objects.filter(property=self.property, unit__isnull=True))
+        self.assertIn('property_photo_property_idx', plan)
+        # unit photos can't be read from it
+        self.assertNotIn('property_photo_property_idx', self._plan(PropertyPhoto.objects.filter(property=self.property, unit=self.unit)))
+
+    def test_document_queries_use_the_unit_index(self):
+        for queryset in [
+            PropertyDocument.objects.filter(property=self.property, unit=None),
+            PropertyDocument.objects.filter(property=self.property, unit=self.unit, document_type='floor_plan'),
+        ]:
+            self.assertIn('property_document_unit_idx', self._plan(queryset))
+
+    def test_cost_fee_category_queries_use_the_unit_index(self):
+        for queryset in [
+            CostFeeCategory.objects.filter(property=self.property, unit=None),
+            CostFeeCategory.objects.filter(property=self.property, unit=self.unit, category_name='Parking'),
+        ]:
+            self.assertIn('cost_fee_category_unit_idx', self._plan(queryset))
+
+    def test_assigned_amenities_use_the_unit_index(self):
+        self.assertIn(
+            'assigned_amenity_unit_idx', self._plan(PropertyAssignedAmenity.objects.filter(property=self.property, unit=self.unit))
+        )
+
+    def test_rent_details_and_calendar_slots_use_their_existing_indexes(self):
+        self.assertIn('rent_property_id_unit_id', self._plan(RentDetail.objects.filter(property=self.property, unit=None)))
+        plan = self._plan(
+            CalendarSlot.objects.filter(
+                property=self.property, unit=self.unit, start_date__lte=date(2024, 5, 31), end_date__gte=date(2024, 5, 1)
+            )
+        )
+        self.assertIn('calendar_slot_range_idx', plan)
+
+
+class PropertyMetricsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.property = Property.objects.create(
+                property_owner=self.owner,
+                name='Tower',
+                property_type='multi_family',
+                state='State',
+                city='City',
+                street_address='1 High Street',
+            )
+            self.units = [
+                Unit.objects.create(property=self.property, number=str(index), type='studio', status='occupied' if index < 2 else 'vacant')
+                for index in range(4)
+            ]
+            for index, unit in enumerate(self.units):
+                RentDetail.objects.create(property=self.property, unit=unit, rental_type='long_term', rent=1000 + index * 100)
+            for unit, months in [(self.units[0], 12), (self.units[1], 6)]:
+                self._invite(unit, months)
+
+    def _invite(self, unit, months, **kwargs):
+        return TenantInvitation.objects.create(
+            sender=self.owner,
+            first_name='Tenant',
+            last_name=str(unit.id),
+            email=f'tenant{unit.id}@example.com',
+            assignment_type='unit',
+            assignment_id=unit.id,
+            tenant_type='individual',
+            lease_amount=1000,
+            lease_start_date=date(2024, 1, 1),
+            lease_end_date=date(2024, 1, 1) + timedelta(days=round(months * 365.25 / 12)),
+            accepted=True,
+            **kwargs,
+        )
+
+    def _metrics(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('property_metrics-detail', args=[self.property.id]))
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_metrics_are_read_from_the_rollup(self):
+        metrics, queries = self._metrics()
+        self.assertEqual(metrics, {'rental_income': 2100.0, 'occupancy_rate': 50.0, 'avg_lease_term': 9.0, 'avg_tenant_rating': '-'})
+        # the ETag, the property and the rollup row
+        self.assertEqual(queries, 3)
+
+    def test_writes_update_the_rollup(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            unit = self.units[2]
+            unit.status = 'occupied'
+            unit.save()
+            self._invite(unit, 3)
+            RentDetail.objects.filter(unit=self.units[0]).get().delete()
+
+        metrics, _ = self._metrics()
+        self.assertEqual(metrics['rental_income'], 2300.0)
+        self.assertEqual(metrics['occupancy_rate'], 75.0)
+        self.assertEqual(metrics['avg_lease_term'], 7.0)
+
+    def test_rebuild_recomputes_missing_and_stale_rollups(self):
+        PropertyMetrics.objects.all().delete()
+        Unit.objects.filter(pk=self.units[3].pk).update(status='occupied')
+
+        call_command('rebuild_property_metrics', stdout=StringIO())
+        self.assertEqual(PropertyMetrics.objects.get(property=self.property).occupied_unit_count, 3)
+
+    def test_single_family_homes_count_as_one_unit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.property = Property.objects.create(
+                property_owner=self.owner,
+                name='House',
+                property_type='single_family_home',
+                status='occupied',
+                state='State',
+                city='City',
+                street_address='2 High Street',
+            )
+            RentDetail.objects.create(property=self.property, rental_type='long_term', rent=1500)
+
+        metrics, _ = self._metrics()
+        self.assertEqual(metrics['rental_income'], 1500.0)
+        self.assertEqual(metrics['occupancy_rate'], 100.0)
+        self.assertEqual(metrics['avg_lease_term'], '-')
+
+
+class DashboardTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+        for index in range(3):
+            property = Property.objects.create(
+                property_owner=self.owner,
+                name=f'Tower {index}',
+                property_type='multi_family',
+                published=index == 0,
+                state='State',
+                city='City',
+                street_address='1 High Street',
+            )
+            for number in range(2):
+                unit = Unit.objects.create(property=property, number=str(number), type='studio', status='occupied' if number else 'vacant')
+                RentDetail.objects.create(property=property, unit=unit, rental_type='long_term', rent=1000)
+        today = timezone.localdate()
+        for index, (accepted, days_left) in enumerate([(True, 10), (True, 45), (True, 200), (False, 80)]):
+            TenantInvitation.objects.create(
+                sender=self.owner,
+                first_name='Tenant',
+                last_name=str(index),
+                email=f'tenant{index}@example.com',
+                assignment_type='unit',
+                assignment_id=unit.id,
+                tenant_type='individual',
+                lease_amount=1000,
+                lease_start_date=today - timedelta(days=100),
+                lease_end_date=today + timedelta(days=days_left),
+                accepted=accepted,
+            )
+        other = get_user_model().objects.create(email='other@example.com', username='other')
+        Property.objects.create(
+            property_owner=other, name='Other', property_type='multi_family', state='State', city='City', street_address='2 High Street'
+        )
+
+    def _dashboard(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('dashboard'))
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data'], len(queries)
+
+    def test_totals_take_one_query_per_table(self):
+        data, queries = self._dashboard()
+        self.assertEqual(
+            data,
+            {
+                'properties': {'total': 3, 'published': 1, 'draft': 2},
+                'units': {'total': 6, 'vacant': 3, 'occupied': 3},
+                'tenant_invitations': {'pending': 1, 'accepted': 3},
+                'vendor_invitations': {'pending': 0, 'accepted': 0},
+                'leases_expiring': {'30_days': 1, '60_days': 2, '90_days': 2},
+                # the rent of the occupied units
+                'monthly_rent': 3000.0,
+            },
+        )
+        self.assertEqual(queries, 5)
+
+        # served from the cache until the owner writes
+        self.assertEqual(self._dashboard()[1], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            Unit.objects.filter(status='vacant').first().delete()
+        data, queries = self._dashboard()
+        self.assertEqual(queries, 5)
+        self.assertEqual(data['units']['vacant'], 2)
+        self.assertEqual(data['monthly_rent'], 3000.0)
+
+    def test_monthly_rent_counts_monthly_rental_types_only(self):
+        for index, (rental_type, rent) in enumerate([('monthly_billing', 400), ('semester_billing', 2400), ('short_term', 90)]):
+            property = Property.objects.create(
+                property_owner=self.owner,
+                name=f'Hall {index}',
+                property_type='university_housing',
+                status='occupied',
+                state='State',
+                city='City',
+                street_address='3 High Street',
+            )
+            RentDetail.objects.create(property=property, rental_type=rental_type, rent=rent)
+
+        self.assertEqual(self._dashboard()[0]['monthly_rent'], 3400.0)
+
+
+def build_unit_workbook(unit_count, photos=True):
+    """A bulk import workbook with the sheets and columns of ``xlsx_sheet_names['others']``, as an uploaded file."""
+    workbook = Workbook()
+    workbook.remove(workbook.active)
+    for sheet_name, columns in xlsx_sheet_names['others'].items():
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(list(columns))
+        for index in range(unit_count):
+            if sheet_name == 'Photos' and not photos:
+                continue
+            values = {
+                'Unit Number': f'A {index}',
+                'Unit Type': 'studio',
+                'Total Bedrooms': 1,
+                'Total Bathrooms': 1,
+                'Photo Link': f'https://example.com/{index}.jpg',
+                'Long Term': True,
+                'Short Term': False,
+                'Rent': 900,
+                'Amenities (comma-separated)': 'Oven, Sauna',
+                'Category': 'parking',
+                'Fee Name': 'garage',
+                'Payment Frequency is Monthly': 'yes',
+                'Fee Amount': 50,
+                'Flat Fee': 1,
+                'Fee Optional': 'true',
+                'Fee Refundable': True,
+                'Upload Document': f'https://example.com/{index}.pdf',
+                'Document Title': 'Lease',
+                'Document Type': 'lease_agreement',
+                'Private': True,
+            }
+            worksheet.append([values.get(column) for column in columns])
+    content = BytesIO()
+    workbook.save(content)
+    return SimpleUploadedFile('units.xlsx', content.getvalue())
+
+
+class UnitWorkbookReaderTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=owner, name='Tower', property_type='multi_family', state='State', city='City', street_address='1 High Street'
+        )
+
+    def test_sheets_are_read_into_rows_per_unit(self):
+        serializer = BulkUnitImportSerializer(data={'property': self.property.id, 'file': build_unit_workbook(3)})
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        data = serializer.validated_data
+
+        self.assertEqual(list(data['unit_info']), ['a_0', 'a_1', 'a_2'])
+        self.assertEqual(
+            data['unit_info']['a_1'],
+            [{'number': 'A 1', 'type': 'studio', 'floor_number': None, 'size': None, 'bedrooms': 1, 'bathrooms': 1}],
+        )
+        self.assertEqual(data['photos']['a_2'], [{'number': 'A 2', 'photo': 'https://example.com/2.jpg'}])
+        self.assertEqual(data['rent_details']['a_0'][0]['rental_type'], 'long_term')
+        fee = data['cost_fee']['a_0'][0]
+        self.assertEqual(
+            (fee['payment_frequency'], fee['fee_type'], fee['is_required'], fee['refundable_status']),
+            ('monthly', 'flat_fee', 'optional', 'refundable'),
+        )
+
+    def test_every_unit_needs_a_photo(self):
+        serializer = BulkUnitImportSerializer(data={'property': self.property.id, 'file': build_unit_workbook(2, photos=False)})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('Photo required for unit(s): A 0, A 1', str(serializer.errors))
+
+    def test_short_rows_are_read_as_empty_cells(self):
+        # read-only mode gives rows as long as their last value when the sheet has no dimension
+        reader = UnitWorkbookReader(None, 'others')
+        columns = xlsx_sheet_names['others']['Unit Info']
+        data = reader.build_sheet('Unit Info', list(columns), iter([('A 1', 'studio'), ('A 2',)]), columns)
+
+        self.assertEqual(
+            data,
+            {
+                'a_1': [{'number': 'A 1', 'type': 'studio', 'floor_number': None, 'size': None, 'bedrooms': None, 'bathrooms': None}],
+                'a_2': [{'number': 'A 2', 'type': None, 'floor_number': None, 'size': None, 'bedrooms': None, 'bathrooms': None}],
+            },
+        )
+
+    def test_one_hot_columns_are_collapsed(self):
+        reader = UnitWorkbookReader(None, 'others')
+        columns = xlsx_sheet_names['others']['Rent Details']
+        rows = [('A 1', None, 'yes', 900), ('A 2', 'true', 'no', 700, 100), ('A 3',), ('A 4', True, True)]
+        data = reader.build_sheet('Rent Details', list(columns), iter(rows), columns)
+
+        self.assertEqual(
+            data,
+            {
+                'a_1': [{'number': 'A 1', 'rent': 900, 'security_deposit': None, 'rental_type': 'long_term'}],
+                'a_2': [{'number': 'A 2', 'rent': 700, 'security_deposit': 100, 'rental_type': 'short_term'}],
+                # without a true column the field is left out, the last true column wins
+                'a_3': [{'number': 'A 3', 'rent': None, 'security_deposit': None}],
+                'a_4': [{'number': 'A 4', 'rent': None, 'security_deposit': None, 'rental_type': 'long_term'}],
+            },
+        )
+
+    def test_collapsed_fields_missing_in_every_row_are_left_out(self):
+        frame = pd.DataFrame([['A 1', None, None], ['A 2', 'no', None]], columns=['number', 'private', 'shared'], dtype=object)
+
+        normalized = UnitWorkbookReader.normalize('document', frame)
+
+        self.assertEqual(list(normalized.columns), ['number', 'visibility'])
+        self.assertEqual(UnitWorkbookReader.to_units(normalized), {'a_1': [{'number': 'A 1'}], 'a_2': [{'number': 'A 2'}]})
+
+    def test_large_uploads_are_read_from_the_temporary_file(self):
+        content = build_unit_workbook(2).read()
+        upload = TemporaryUploadedFile('units.xlsx', 'application/octet-stream', len(content), None)
+        upload.write(content)
+        upload.seek(0)
+        with mock.patch('apps.property_management.application.services.unit_workbook_reader.load_workbook', wraps=load_workbook) as load:
+            serializer = BulkUnitImportSerializer(data={'property': self.property.id, 'file': upload})
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        load.assert_called_once_with(upload.temporary_file_path(), read_only=True, data_only=True)
+
+
+class UnitImportJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = get_user_model().objects.create(email='owner@example.com', username='owner')
+        cls.property = Property.objects.create(
+            property_owner=cls.owner,
+            name='Tower',
+            property_type='apartment_unit',
+            state='State',
+            city='City',
+            street_address='1 High Street',
+        )
+        ListingInfo.objects.create(property=cls.property, listed_by='owner', number_of_units=5, description='', showing_availability={})
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def _upload(self, unit_count):
+        return self.client.post(reverse('units_bulk_import'), {'property': self.property.id, 'file': build_unit_workbook(unit_count)})
+
+    def test_upload_queues_a_job(self):
+        response = self._upload(3)
+
+        self.assertEqual(response.status_code, 202)
+        job = response.json()['data']
+        self.assertEqual((job['status'], job['csv_units_count'], job['processed_units']), ('pending', 3, 0))
+        self.assertFalse(Unit.objects.filter(property=self.property).exists())
+
+    def test_worker_imports_the_units_and_reports_the_errors(self):
+        job_id = self._upload(2).json()['data']['id']
+
+        with (
+            mock.patch.object(MediaFetcher, 'fetch', side_effect=MediaFetchError('Download failed.')),
+            self.assertLogs('django', 'WARNING'),
+        ):
+            call_command('process_unit_import_jobs', once=True, stdout=StringIO(), stderr=StringIO())
+
+        units = Unit.objects.filter(property=self.property).order_by('number')
+        self.assertEqual(
+            [(unit.number, unit.published, unit.other_amenities) for unit in units], [('A 0', True, ['sauna']), ('A 1', True, ['sauna'])]
+        )
+        # Oven comes with the seeded amenities
+        self.assertEqual(
+            set(PropertyAssignedAmenity.objects.filter(unit__in=units).values_list('unit__number', 'sub_amenity__sub_amenity')),
+            {('A 0', 'Oven'), ('A 1', 'Oven')},
+        )
+        self.assertEqual(RentDetail.objects.filter(unit__in=units).count(), 2)
+        self.assertEqual(CostFee.objects.filter(category__unit__in=units).count(), 2)
+
+        response = self.client.get(reverse('units_bulk_import_job', args=[job_id]))
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        job = body['data']
+        self.assertEqual((job['status'], job['progress'], job['units_created'], job['units_failed']), ('completed', 100, 2, 0))
+        self.assertEqual((job['media_total'], job['media_processed']), (4, 4))
+        # in the order the downloads finish
+        self.assertCountEqual(
+            job['data']['A 0'], ['Error downloading photo: Download failed.', 'Error downloading document: Download failed.']
+        )
+        self.assertEqual(body['message'], 'All units created successfully.')
+        self.assertIsNone(UnitImportJob.objects.get(id=job_id).data)
+
+    def test_jobs_of_stopped_workers_are_failed(self):
+        stopped, running = (UnitImportJob.objects.get(id=self._upload(1).json()['data']['id']) for _ in range(2))
+        UnitImportJob.objects.filter(id__in=[stopped.id, running.id]).update(status='processing', units_created=1)
+        UnitImportJob.objects.filter(id=stopped.id).update(
+            updated_at=timezone.now() - timedelta(seconds=settings.UNIT_IMPORT_JOB_LEASE + 1)
+        )
+
+        with self.assertLogs('django', 'WARNING'):
+            call_command('process_unit_import_jobs', once=True, stdout=StringIO(), stderr=StringIO())
+
+        stopped.refresh_from_db()
+        self.assertEqual(
+            (stopped.status, stopped.error, stopped.data), ('failed', 'The import stopped before it finished. Units created: 1.', None)
+        )
+        self.assertEqual(UnitImportJob.objects.get(id=running.id).status, 'processing')
+
+    def test_worker_warns_when_the_cache_is_not_shared(self):
+        stderr = StringIO()
+        call_command('process_unit_import_jobs', once=True, stdout=StringIO(), stderr=stderr)
+        self.assertIn('Set REDIS_URL to share the cache.', stderr.getvalue())
+
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://cache'}}):
+            stderr = StringIO()
+            call_command('process_unit_import_jobs', once=True, stdout=StringIO(), stderr=stderr)
+        self.assertEqual(stderr.getvalue(), '')
+
+    def test_upload_beyond_the_unit_limit_is_rejected(self):
+        response = self._upload(6)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(UnitImportJob.objects.exists())
+
+    def test_jobs_of_other_users_are_not_found(self):
+        job_id = self._upload(1).json()['data']['id']
+        self.client.force_authenticate(get_user_model().objects.create(email='other@example.com', username='other'))
+
+        response = self.client.get(reverse('units_bulk_import_job', args=[job_id]))
+
+        self.assertEqual(response.status_code, 404)
+
+    def _run(self, job_id):
+        # the downloads are covered by the worker test
+        with mock.patch.object(UnitImportService, '_import_media'):
+            return UnitImportService.run(UnitImportJob.objects.get(id=job_id))
+
+    def test_units_are_inserted_with_a_constant_number_of_queries(self):
+        queries = []
+        for unit_count in (2, 3):
+            job_id = self._upload(unit_count).json()['data']['id']
+            Unit.objects.all().delete()
+            with CaptureQueriesContext(connection) as captured:
+                job = self._run(job_id)
+            self.assertEqual((job.status, job.units_created), ('completed', unit_count))
+            queries.append(len(captured))
+        self.assertEqual(queries[0], queries[1])
+
+    def test_a_unit_failing_in_the_database_is_rolled_back_alone(self):
+        job_id = self._upload(3).json()['data']['id']
+        bulk_create = RentDetail.objects.bulk_create
+
+        def reject_unit_a_1(objs, *args, **kwargs):
+            objs = list(objs)
+            if any(rent.unit.number == 'A 1' for rent in objs):
+                raise IntegrityError('rent rejected')
+            return bulk_create(objs, *args, **kwargs)
+
+        with mock.patch.object(RentDetail.objects, 'bulk_create', side_effect=reject_unit_a_1), self.assertLogs('django', 'WARNING'):
+            job = self._run(job_id)
+
+        self.assertEqual((job.units_created, job.units_failed), (2, 1))
+        self.assertEqual(job.unit_errors, {'A 1': ['rent rejected']})
+        self.assertEqual(sorted(Unit.objects.values_list('number', flat=True)), ['A 0', 'A 2'])
+        self.assertEqual(CostFeeCategory.objects.filter(property=self.property).count(), 2)
+        self.assertEqual(set(Unit.objects.values_list('page_saved', 'published')), {(5, True)})
+
+    def test_duplicate_fees_of_a_unit_are_reported(self):
+        job = UnitImportJob.objects.get(id=self._upload(1).json()['data']['id'])
+        job.data['cost_fee']['a_0'].append(dict(job.data['cost_fee']['a_0'][0]))
+        job.save()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            job = self._run(job.id)
+
+        self.assertEqual(job.unit_errors, {'A 0': ['Cost fee with this name already exists for the specified category.']})
+        self.assertEqual(CostFee.objects.filter(category__property=self.property).count(), 1)
+        # bulk inserts send no signals, the import refreshes the rollups itself
+        self.assertEqual(PropertyMetrics.objects.get(property=self.property).unit_count, 1)
+
+    def test_rent_rows_are_checked_against_the_offer_rules(self):
+        job = UnitImportJob.objects.get(id=self._upload(2).json()['data']['id'])
+        job.data['rent_details']['a_0'][0]['promote_special_offer'] = True
+        job.save()
+
+        job = self._run(job.id)
+
+        self.assertEqual(job.unit_errors, {'A 0': ["Offer fields 'offer_start_date', 'offer_end_date', 'offer_percentage' are required."]})
+        self.assertEqual(list(RentDetail.objects.filter(property=self.property).values_list('unit__number', flat=True)), ['A 1'])
+
+
+class FakeMediaResponse:
+    def __init__(self, content, headers):
+        self.content, self.headers = content, headers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+@override_settings(MEDIA_FETCH_WORKERS=6, MEDIA_FETCH_PER_HOST=2, MEDIA_FETCH_MAX_SIZE=1000)
+class MediaFetcherTests(TestCase):
+    def _fetch_all(self, urls, get):
+        fetcher = MediaFetcher()
+        with mock.patch.object(fetcher.session, 'get', side_effect=get) as session_get:
+            results = {url: (file.read() if file else None, error) for url, file, error in fetcher.fetch_all(urls)}
+        fetcher.close()
+        return results, session_get
+
+    def test_each_url_is_downloaded_once_within_the_limits(self):
+        def get(url, **kwargs):
+            if url.endswith('big.pdf'):
+                return FakeMediaResponse(b'x' * 1001, {})
+            if url.endswith('/scan'):
+                return FakeMediaResponse(b'scan', {'Content-Type': 'application/pdf; charset=binary'})
+            return FakeMediaResponse(b'photo', {'Content-Length': '5'})
+
+        urls = [
+            'https://a.example/1.jpg',
+            'https://a.example/1.jpg',
+            'https://a.example/run.exe',
+            'https://a.example/big.pdf',
+            'https://a.example/scan',
+        ]
+        with self.assertLogs('django', 'WARNING') as logs:
+            results, session_get = self._fetch_all(urls, get)
+
+        self.assertEqual(
+            results,
+            {
+                'https://a.example/1.jpg': (b'photo', None),
+                'https://a.example/run.exe': (None, "File extension '.exe' is not allowed. Only PDF, JPG, PNG, and DOCX are permitted."),
+                'https://a.example/big.pdf': (None, 'File is larger than 0 MB.'),
+                'https://a.example/scan': (b'scan', None),
+            },
+        )
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(session_get.call_count, 3)
+        self.assertEqual(session_get.call_args.kwargs, {'stream': True, 'timeout': settings.MEDIA_FETCH_TIMEOUT})
+
+    def test_downloads_run_concurrently_within_the_per_host_limit(self):
+        lock, active, peak = threading.Lock(), Counter(), Counter()
+
+        def get(url, **kwargs):
+            host = url.split('/')[2]
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            return FakeMediaResponse(b'photo', {})
+
+        urls = [f'https://{host}/{index}.jpg' for host in ('a.example', 'b.example') for index in range(8)]
+        results, _ = self._fetch_all(urls, get)
+
+        self.assertEqual(len(results), 16)
+        self.assertEqual(peak, {'a.example': 2, 'b.example': 2})
+
+
+class FrozenDatetime(datetime):
+    signed_at = datetime(2026, 3, 1, 12, 30, tzinfo=dt_timezone.utc)
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls.signed_at.astimezone(tz)
+
+    @classmethod
+    def utcnow(cls):
+        return cls.signed_at.replace(tzinfo=None)
+
+
+@override_settings(AWS_S3_BUCKET_NAME='bucket', AWS_DEFAULT_REGION='eu-west-1', AWS_S3_BASE_URL='https://bucket.s3.eu-west-1.amazonaws.com')
+class S3ServiceTests(TestCase):
+    credentials = {
+        'aws_access_key_id': 'AKIDEXAMPLE',
+        'aws_secret_access_key': 'wJalrXUtnFEMI/K7MDENG+bPxRfiCYEXAMPLEKEY',
+        'aws_session_token': 'session-token',
+    }
+
+    def setUp(self):
+        # a fresh instance signing with fixed credentials, the shared singleton is left alone
+        environ = {name.upper(): value for name, value in self.credentials.items()}
+        with mock.patch.dict(os.environ, {**environ, 'AWS_DEFAULT_REGION': 'eu-west-1'}):
+            self.service = object.__new__(S3Service)
+            self.service._init_client()
+
+    def test_urls_match_the_botocore_presigner(self):
+        boto_client = boto3.session.Session(**self.credentials).client(
+            's3', region_name='eu-west-1', config=Config(signature_version='s3v4', s3={'addressing_style': 'virtual'})
+        )
+        keys = ['property_photos/1/front door.jpg', 'documents/lease+ü (1).pdf']
+        with (
+            mock.patch('apps.shared.infrastructure.services.s3_service.datetime', FrozenDatetime),
+            mock.patch('botocore.auth.datetime', SimpleNamespace(datetime=FrozenDatetime)),
+        ):
+            for download, filename in ((False, None), (True, None), (True, 'Lease.pdf')):
+                urls = self.service._sign_urls(keys, 3600, download, filename)
+                self.service.client = boto_client
+                for key in keys:
+                    expected = urlsplit(self.service._boto_presigned_url(key, 3600, download, filename))
+                    url = urlsplit(urls[key])
+                    self.assertEqual((url.scheme, url.netloc, url.path), (expected.scheme, expected.netloc, expected.path))
+                    self.assertEqual(parse_qs(url.query), parse_qs(expected.query))
+
+    def test_urls_are_reused_until_the_reissue_margin(self):
+        now = time.time()
+        expiration = 3600
+        reissue_at = now + expiration - S3Service.URL_REISSUE_MARGIN
+        with mock.patch.object(self.service, '_sign_urls', wraps=self.service._sign_urls) as sign_urls:
+            with mock.patch('apps.shared.infrastructure.services.s3_service.time.time', return_value=now):
+                url = self.service.generate_presigned_url('photo.jpg', expiration)
+            with mock.patch('apps.shared.infrastructure.services.s3_service.time.time', return_value=reissue_at - 1):
+                self.assertEqual(self.service.generate_presigned_url('photo.jpg', expiration), url)
+                self.service.generate_presigned_url('photo.jpg', expiration, download=True)
+            self.assertEqual(sign_urls.call_count, 2)
+
+            with mock.patch('apps.shared.infrastructure.services.s3_service.time.time', return_value=reissue_at):
+                self.service.generate_presigned_url('photo.jpg', expiration)
+            self.assertEqual(sign_urls.call_count, 3)
+            self.assertEqual(self.service._url_cache[('photo.jpg', expiration, False, None)][1], reissue_at + expiration)
+
+
+class ORJSONRendererTests(TestCase):
+    def test_output_matches_the_json_renderer(self):
+        data = {
+            'rent': Decimal('900.50'),
+            'created_at': datetime(2024, 5, 1, 12, 30, tzinfo=dt_timezone.utc),
+            'day': date(2024, 5, 1),
+            'message': gettext_lazy('Success'),
+            'nested': [{'id': 1, 'photos': []}],
+        }
+        rendered = ORJSONRenderer().render(data, 'application/json')
+        self.assertEqual(json.loads(rendered), json.loads(JSONRenderer().render(data, 'application/json')))
+        self.assertIn(b'"2024-05-01T12:30:00Z"', rendered)
+
+    def test_api_responses_are_rendered_with_orjson(self):
+        user = get_user_model().objects.create(email='renderer@example.com', username='renderer')
+        client = APIClient()
+        client.force_authenticate(user)
+        response = client.get(reverse('detail-list'))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertTrue(response.json()['success'])
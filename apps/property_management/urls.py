@@ -7,6 +7,7 @@ from apps.property_management.interface.views import (
     CalendarSlotViewSet,
     CostFeeTypesView,
     CostFeeViewSet,
+    DashboardView,
     DeleteAllPropertiesView,
     ListingInfoViewSet,
     PropertyDocumentsViewSet,
@@ -19,6 +20,7 @@ from apps.property_management.interface.views import (
     PublicListingAPIView,
     RentalDetailViewSet,
     TopListingsViewSet,
+    UnitImportJobView,
     UnitInfoViewSet,
     UnitSummaryViewSet,
     UserPropertiesAndUnitsView,
@@ -45,6 +47,7 @@ urlpatterns = [
     path(r'document-types/', PropertyDocumentTypesView.as_view(), name='document_types'),
     path(r'cost-fee-types/', CostFeeTypesView.as_view(), name='cost_fee_types'),
     path(r'units-bulk-import/', BulkUnitImportAPIView.as_view(), name='units_bulk_import'),
+    path('units-bulk-import/<int:id>/', UnitImportJobView.as_view(), name='units_bulk_import_job'),
     path('cost-fee/', CostFeeViewSet.as_view(), name='cost_fee'),
     path('owner-info/', PropertyOwnerViewSet.as_view(), name='owner_info'),
     # only for testing
@@ -52,4 +55,5 @@ urlpatterns = [
     # User properties and units list
     path('user-properties-units/', UserPropertiesAndUnitsView.as_view(), name='user_properties_units'),
     path('public-listings/', PublicListingAPIView.as_view(), name='public_listings'),
+    path('dashboard/', DashboardView.as_view(), name='dashboard'),
 ]
@@ -1,4 +1,10 @@
+import hashlib
+import hmac
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from threading import Lock
+from urllib.parse import quote, urlparse
 
 import boto3
 from django.conf import settings
@@ -8,6 +14,11 @@ class S3Service:
     _instance = None
     _lock = Lock()  # making it thread safe, one instance for every thread
 
+    # Signed urls are handed out again until this many seconds before they expire. Responses holding them are cached
+    # and revalidated by ETag for less than that, so the urls they hand out are still valid.
+    URL_REISSUE_MARGIN = 1200
+    URL_CACHE_MAX_SIZE = 4096
+
     def __new__(cls):
         # Thread-safe singleton initialization
         if not cls._instance:
@@ -18,8 +29,15 @@ class S3Service:
         return cls._instance
 
     def _init_client(self):
-        self.client = boto3.client("s3")
+        session = boto3.session.Session()
+        self.client = session.client("s3")
         self.bucket_name = settings.AWS_S3_BUCKET_NAME
+        self.region = settings.AWS_DEFAULT_REGION or self.client.meta.region_name
+        self.host = urlparse(settings.AWS_S3_BASE_URL).netloc
+        self._credentials = session.get_credentials()
+        self._signing_keys = {}
+        self._url_cache = OrderedDict()
+        self._cache_lock = Lock()
 
     def upload_file(self, file_path: str, key: str, content_type: str | None = None) -> str:
         extra_args = {"ContentType": content_type} if content_type else {}
@@ -30,10 +48,95 @@ class S3Service:
         return f"{settings.AWS_S3_BASE_URL}/{key}"
 
     def generate_presigned_url(self, key: str, expiration: int = 3600, download: bool = False, filename: str | None = None) -> str:
+        return self.generate_presigned_urls([key], expiration=expiration, download=download, filename=filename)[key]
+
+    def generate_presigned_urls(self, keys, expiration: int = 3600, download: bool = False, filename: str | None = None) -> dict[str, str]:
+        """
+        Sign a batch of object keys and return a {key: url} mapping.
+
+        Urls that were signed earlier with the same options are reused until shortly before they expire, the rest
+        are signed locally with one SigV4 signing key per day instead of a boto3 call per key.
+        """
+        now = time.time()
+        reissue_margin = min(self.URL_REISSUE_MARGIN, expiration // 2)
+        urls = {}
+        missing = []
+        with self._cache_lock:
+            for key in keys:
+                cached = self._url_cache.get((key, expiration, download, filename))
+                if cached and cached[1] - reissue_margin > now:
+                    self._url_cache.move_to_end((key, expiration, download, filename))
+                    urls[key] = cached[0]
+                else:
+                    missing.append(key)
+
+        if not missing:
+            return urls
+
+        signed = self._sign_urls(dict.fromkeys(missing), expiration, download, filename)
+        expires_at = now + expiration
+        with self._cache_lock:
+            for key, url in signed.items():
+                self._url_cache[(key, expiration, download, filename)] = (url, expires_at)
+                self._url_cache.move_to_end((key, expiration, download, filename))
+            while len(self._url_cache) > self.URL_CACHE_MAX_SIZE:
+                self._url_cache.popitem(last=False)
+
+        urls.update(signed)
+        return urls
+
+    def _sign_urls(self, keys, expiration: int, download: bool, filename: str | None) -> dict[str, str]:
+        credentials = self._credentials.get_frozen_credentials() if self._credentials else None
+        if not credentials or not self.host:
+            return {key: self._boto_presigned_url(key, expiration, download, filename) for key in keys}
+
+        signed_at = datetime.now(timezone.utc)
+        date_stamp = signed_at.strftime('%Y%m%d')
+        amz_date = signed_at.strftime('%Y%m%dT%H%M%SZ')
+        scope = f'{date_stamp}/{self.region}/s3/aws4_request'
+        signing_key = self._get_signing_key(credentials.secret_key, date_stamp)
+
+        base_params = {
+            'X-Amz-Algorithm': 'AWS4-HMAC-SHA256',
+            'X-Amz-Credential': f'{credentials.access_key}/{scope}',
+            'X-Amz-Date': amz_date,
+            'X-Amz-Expires': str(expiration),
+            'X-Amz-SignedHeaders': 'host',
+        }
+        if credentials.token:
+            base_params['X-Amz-Security-Token'] = credentials.token
+
+        urls = {}
+        for key in keys:
+            params = dict(base_params)
+            if download:
+                download_filename = filename or key.split('/')[-1]
+                params['response-content-disposition'] = f'attachment; filename="{download_filename}"'
+
+            canonical_uri = '/' + quote(key, safe='/-_.~')
+            canonical_query = '&'.join(f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in sorted(params.items()))
+            canonical_request = '\n'.join(['GET', canonical_uri, canonical_query, f'host:{self.host}', '', 'host', 'UNSIGNED-PAYLOAD'])
+            string_to_sign = '\n'.join(['AWS4-HMAC-SHA256', amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()])
+            signature = hmac.new(signing_key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+            urls[key] = f'https://{self.host}{canonical_uri}?{canonical_query}&X-Amz-Signature={signature}'
+        return urls
+
+    def _get_signing_key(self, secret_key: str, date_stamp: str) -> bytes:
+        """The SigV4 signing key only depends on the secret, the day and the region, so it is derived once per day."""
+        cache_key = (secret_key, date_stamp)
+        signing_key = self._signing_keys.get(cache_key)
+        if signing_key is None:
+            signing_key = f'AWS4{secret_key}'.encode()
+            for part in (date_stamp, self.region, 's3', 'aws4_request'):
+                signing_key = hmac.new(signing_key, part.encode(), hashlib.sha256).digest()
+            with self._cache_lock:
+                self._signing_keys = {cache_key: signing_key}
+        return signing_key
+
+    def _boto_presigned_url(self, key: str, expiration: int, download: bool, filename: str | None) -> str:
         params = {'Bucket': self.bucket_name, 'Key': key}
         if download:
             download_filename = filename or key.split('/')[-1]
             params['ResponseContentDisposition'] = f'attachment; filename="{download_filename}"'
 
-        url = self.client.generate_presigned_url('get_object', Params=params, ExpiresIn=expiration)
-        return url
+        return self.client.generate_presigned_url('get_object', Params=params, ExpiresIn=expiration)
@@ -1,14 +1,19 @@
 from common.constants import Success
 from common.pagination.base_pagination import BasePagination
+from common.pagination.count_strategy import CachedCount, EstimatedCount
+from common.pagination.cursor_pagination import CursorPaginationMixin
 
 
-class KYCRequestsPagination(BasePagination):
+class KYCRequestsPagination(CursorPaginationMixin, BasePagination):
     message = Success.KYC_LIST
+    count_strategy = EstimatedCount()
 
 
-class TenantInvitationPagination(BasePagination):
+class TenantInvitationPagination(CursorPaginationMixin, BasePagination):
     message = Success.TENANT_INVITATIONS_LIST
+    count_strategy = CachedCount()
 
 
 class VendorInvitationPagination(BasePagination):
     message = Success.VENDOR_INVITATIONS_LIST
+    count_strategy = CachedCount()
@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class UserManagementConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.user_management"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from apps.user_management.infrastructure.models import KYCRequest, TenantInvitation, VendorInvitation
+        from common.model_version import bump_model_version
+
+        # cached counts are keyed on these versions
+        for model in (KYCRequest, TenantInvitation, VendorInvitation):
+            post_save.connect(bump_model_version, sender=model)
+            post_delete.connect(bump_model_version, sender=model)
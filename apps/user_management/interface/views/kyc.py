@@ -11,7 +11,7 @@ from apps.user_management.application.pagination import KYCRequestsPagination
 from apps.user_management.infrastructure.models import KYCRequest, Role
 from apps.user_management.interface.serializers import KYCVerifySerializer
 from common.constants import Error, Success
-from common.utils import CustomResponse, get_presigned_url
+from common.utils import CustomResponse, get_presigned_urls
 
 
 class KYCView(APIView):
@@ -69,6 +69,10 @@ class KYCView(APIView):
         paginator = self.pagination_class()
         result_page = paginator.paginate_queryset(kyc_requests, request)
 
+        image_urls = get_presigned_urls(
+            [kyc.front_image.name for kyc in result_page] + [kyc.back_image.name for kyc in result_page if kyc.back_image]
+        )
+
         response_data = []
         for kyc in result_page:
             kyc_data = KYCVerifySerializer(kyc).data
@@ -80,8 +84,8 @@ class KYCView(APIView):
                 'status': kyc.status,
                 'role': user_role,
                 'registration_date': kyc.created_at.strftime('%Y-%m-%d'),
-                'front_image': get_presigned_url(kyc.front_image.name),
-                'back_image': get_presigned_url(kyc.back_image.name) if kyc.back_image else None,
+                'front_image': image_urls.get(kyc.front_image.name),
+                'back_image': image_urls.get(kyc.back_image.name) if kyc.back_image else None,
             }
             kyc_data.update(user_data)
             response_data.append(kyc_data)
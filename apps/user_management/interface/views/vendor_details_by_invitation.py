@@ -11,7 +11,7 @@ from rest_framework.views import APIView
 from apps.user_management.infrastructure.models import LicenseAndCertificate, Vendor, VendorInvitation, VendorService
 from apps.user_management.interface.serializers import BulkVendorInviteSerializer
 from common.constants import Error, Success
-from common.utils import CustomResponse, get_presigned_url, send_email_, unsnake_case
+from common.utils import CustomResponse, get_presigned_urls, send_email_, unsnake_case
 
 
 class VendorDetailsByInvitationView(APIView):
@@ -104,15 +104,8 @@ class VendorDetailsByInvitationView(APIView):
         }
 
     def _get_business_license_url(self, vendor):
-        data = []
         licenses = LicenseAndCertificate.objects.filter(user_id=vendor.user_id, profile_type='vendor', document_type='business_license')
-        for license in licenses:
-            cert_data = {
-                'name': unsnake_case(license.document.name.split('/')[-1].split('.')[0]),
-                'url': get_presigned_url(license.document.name),
-            }
-            data.append(cert_data)
-        return data
+        return self._get_document_urls(licenses)
 
     def _get_services_info(self, vendor):
         """Get services information"""
@@ -129,27 +122,24 @@ class VendorDetailsByInvitationView(APIView):
 
     def _get_certification_info(self, vendor):
         """Get certification information"""
-        data = []
-        certificates = LicenseAndCertificate.objects.filter(
-            user_id=vendor.user_id, profile_type='vendor', document_type='insurance_certificate'
-        )
-        for certificate in certificates:
-            cert_data = {
-                'name': unsnake_case(certificate.document.name.split('/')[-1].split('.')[0]),
-                'url': get_presigned_url(certificate.document.name),
-            }
-            data.append(cert_data)
-
         certificates = LicenseAndCertificate.objects.filter(
-            user_id=vendor.user_id, profile_type='vendor', document_type='other_certificate'
+            user_id=vendor.user_id, profile_type='vendor', document_type__in=['insurance_certificate', 'other_certificate']
         )
-        for certificate in certificates:
-            cert_data = {
-                'name': unsnake_case(certificate.document.name.split('/')[-1].split('.')[0]),
-                'url': get_presigned_url(certificate.document.name),
+        # keep insurance certificates ahead of the other certificates
+        certificates = sorted(certificates, key=lambda certificate: certificate.document_type != 'insurance_certificate')
+        return self._get_document_urls(certificates)
+
+    @staticmethod
+    def _get_document_urls(documents):
+        """Sign all document urls in one batch"""
+        urls = get_presigned_urls([document.document.name for document in documents])
+        return [
+            {
+                'name': unsnake_case(document.document.name.split('/')[-1].split('.')[0]),
+                'url': urls.get(document.document.name),
             }
-            data.append(cert_data)
-        return data
+            for document in documents
+        ]
 
 
 class BulkVendorInviteAPIView(APIView):
@@ -191,12 +191,17 @@ class Success:
     COST_FEE_UPDATED = "Cost Fees updated successfully."
     KYC_LIST = "KYC requests list."
     PROPERTIES_LIST = "Properties list."
+    PUBLIC_LISTINGS_LIST = "Public listings list."
+    PROPERTY_VIEW_STATS = "Property view stats."
     UNITS_LIST = "Units list."
     DOCUMENT_DELETED = "Document successfully deleted."
     DOCUMENTS_LIST = "Documents list."
     PROPERTY_METRICS = "Property Metrics."
+    DASHBOARD = "Portfolio dashboard."
     COST_FEE_TYPES = "Cost-Fee types."
     ALL_UNITS_CREATED = "All units created successfully."
+    UNIT_IMPORT_QUEUED = "Unit import queued."
+    UNIT_IMPORT_STATUS = "Unit import status."
     LISTING_INFO_UPDATED = "Listing info updated successfully."
     RENTAL_INFO_UPDATED = "Rental details updated successfully."
     UNIT_INFO_UPDATED = "Unit information updated successfully."
@@ -241,10 +246,16 @@ class Error:
     REFRESH_TOKEN_REQUIRED = "refresh_token is required"
     EMAIL_REQUIRED = "Email is required."
     INVALID_FIELD = "Invalid field."
+    INVALID_CURSOR = "Invalid cursor."
     OWNER_EXISTS = "This owner is already assigned to this property."
     OWNER_AND_PROPERTY_EXISTS = "This property is already posted from another source."
     PROPERTY_NOT_FOUND = "Property not found."
     UNIT_NOT_FOUND = "Unit not found."
+    UNIT_IMPORT_JOB_NOT_FOUND = "Unit import not found."
+    UNIT_IMPORT_STOPPED = "The import stopped before it finished. Units created: {}."
+    MEDIA_EXTENSION_NOT_ALLOWED = "File extension '{}' is not allowed. Only PDF, JPG, PNG, and DOCX are permitted."
+    MEDIA_TYPE_NOT_ALLOWED = "File type '{}' is not allowed. Only PDF, JPG, PNG, and DOCX are permitted."
+    MEDIA_TOO_LARGE = "File is larger than {} MB."
     PUBLISHED_FIELD_REQUIRED = "'published' field is required."
     INVALID_UNIT_TYPE = "Invalid unit type for {}."
     RENT_DETAILS_EXISTS = "Rent details for this property already exist."
@@ -254,6 +265,13 @@ class Error:
     DOCUMENT_TYPE_EXISTS = "A document with this type already exists."
     AVAILABILITY_EXISTS = "Availability selection for {} has already been set."
     UNAVAILABLE_DATES_REQUIRED = "Unavailable dates are required"
+    CALENDAR_RANGE_REQUIRED = "Either month and year or start and end dates are required."
+    CALENDAR_RANGE_INVALID = "End date must not be before the start date."
+    VIEW_STATS_DAYS_INVALID = "days must be a number from 1 to 365."
+    CALENDAR_RANGE_TOO_LONG = "Date range can not be longer than {} days."
+    CALENDAR_DATE_OUTSIDE_SLOT = "Date is not part of this slot."
+    CALENDAR_DATE_REQUIRED = "Date is required to change one day of a range, pass scope=range to change the whole range."
+    CALENDAR_RANGE_SCOPE_REQUIRED = "Start and end dates can only be changed with scope=range."
     NUMERIC_ZIP_CODE = "Zip code must contain only numeric characters."
     PHOTO_REQUIRED = "At least one photo is required."
     PHOTO_REQUIRED_FOR_UNIT = "Photo required for unit(s): {}"
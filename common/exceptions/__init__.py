@@ -1 +1,2 @@
 from .custom_validation_error import *
+from .not_modified import *
@@ -0,0 +1,10 @@
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class NotModified(APIException):
+    """Raised when the client's cached copy is still current, turned into an empty 304 by ConditionalGetMixin."""
+
+    status_code = status.HTTP_304_NOT_MODIFIED
+    default_detail = ''
+    default_code = 'not_modified'
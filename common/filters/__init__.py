@@ -1 +1,2 @@
 from .custom_search_filter import *
+from .ranked_ordering_filter import *
@@ -0,0 +1,10 @@
+from rest_framework.filters import OrderingFilter
+
+
+class RankedOrderingFilter(OrderingFilter):
+    """Orders keyword search results by their search_rank unless the client asked for an explicit ordering."""
+
+    def filter_queryset(self, request, queryset, view):
+        if 'search_rank' in queryset.query.annotations and not request.query_params.get(self.ordering_param):
+            return queryset.order_by('-search_rank', *(self.get_default_ordering(view) or []))
+        return super().filter_queryset(request, queryset, view)
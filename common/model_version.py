@@ -0,0 +1,21 @@
+from django.core.cache import cache
+
+
+def _version_key(model):
+    return f'model_version:{model._meta.label_lower}'
+
+
+def get_model_version(model):
+    """
+    A number that changes whenever a row of the model is written, for building cache keys of data read from it. It is
+    kept in the default cache, which has to be shared by every process writing the model (see CACHES).
+    """
+    return cache.get_or_set(_version_key(model), 1, timeout=None)
+
+
+def bump_model_version(sender, **kwargs):
+    """post_save/post_delete receiver that makes cache entries keyed on the sender's version unreachable."""
+    try:
+        cache.incr(_version_key(sender))
+    except ValueError:
+        cache.set(_version_key(sender), 2, timeout=None)
@@ -1 +1,3 @@
 from .base_pagination import *
+from .count_strategy import *
+from .cursor_pagination import *
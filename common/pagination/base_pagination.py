@@ -1,19 +1,32 @@
+from functools import partial
+
 from rest_framework.pagination import PageNumberPagination
 
 from common.utils import CustomResponse
 
+from .count_strategy import CountStrategyPaginator, ExactCount
+
 
 class BasePagination(PageNumberPagination):
     page_size = 10
     page_size_query_param = 'page_size'
     max_page_size = 100
     message = None
+    count_strategy = ExactCount()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(CountStrategyPaginator, count_strategy=self.count_strategy, request=request)
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        return CustomResponse(self.get_paginated_data(data))
+
+    def get_paginated_data(self, data):
         response_data = {
             'count': self.page.paginator.count,
+            'count_is_approximate': self.page.paginator.count_is_approximate,
             'next': self.get_next_link(),
             'previous': self.get_previous_link(),
             'results': data,
         }
-        return CustomResponse({'data': response_data, 'message': self.message})
+        return {'data': response_data, 'message': self.message}
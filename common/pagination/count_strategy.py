@@ -0,0 +1,98 @@
+import hashlib
+import json
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+from common.model_version import get_model_version
+
+
+class ExactCount:
+    """COUNT(*) of the filtered queryset on every request."""
+
+    def count(self, object_list, request):
+        if isinstance(object_list, QuerySet):
+            return object_list.count(), False
+        return len(object_list), False
+
+
+class CachedCount(ExactCount):
+    """
+    Exact count cached per user and filtered query for ``timeout`` seconds. The key contains the versions of every
+    model whose table the query reads, the tables joined or queried by the filters included, so the
+    post_save/post_delete receivers connected in the app configs drop the cached counts on writes to any of them. Bulk
+    updates don't send signals, those are only picked up once the entry expires.
+    """
+
+    def __init__(self, timeout=60):
+        self.timeout = timeout
+
+    def count(self, object_list, request):
+        if not isinstance(object_list, QuerySet):
+            return super().count(object_list, request)
+
+        sql, params = object_list.query.sql_with_params()
+        query_hash = hashlib.sha1(f'{sql}{params}'.encode()).hexdigest()
+        versions = '.'.join(str(get_model_version(model)) for model in self._read_models(sql))
+        key = f'paginated_count:{object_list.model._meta.label_lower}:{versions}:{request.user.pk}:{query_hash}'
+
+        count = cache.get(key)
+        if count is None:
+            count = object_list.count()
+            cache.set(key, count, self.timeout)
+        return count, False
+
+    @staticmethod
+    def _read_models(sql):
+        return [model for model in apps.get_models() if f'"{model._meta.db_table}"' in sql]
+
+
+class EstimatedCount(ExactCount):
+    """
+    Row estimate of the Postgres planner for very large tables. Estimates below ``threshold`` rows are replaced by an
+    exact count, so small results keep exact page numbers. Other databases always count. The estimate is low while
+    the statistics are stale, the paginator counts exactly before it treats a page as the last one or past the end.
+    """
+
+    def __init__(self, threshold=10000):
+        self.threshold = threshold
+
+    def count(self, object_list, request):
+        if not isinstance(object_list, QuerySet) or connections[object_list.db].vendor != 'postgresql':
+            return super().count(object_list, request)
+
+        plan = json.loads(object_list.order_by().explain(format='json'))
+        estimate = plan[0]['Plan']['Plan Rows']
+        if estimate < self.threshold:
+            return super().count(object_list, request)
+        return estimate, True
+
+
+class CountStrategyPaginator(Paginator):
+    def __init__(self, object_list, per_page, count_strategy, request, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count_strategy = count_strategy
+        self.request = request
+        self.count_is_approximate = False
+
+    @cached_property
+    def count(self):
+        count, self.count_is_approximate = self.count_strategy.count(self.object_list, self.request)
+        return count
+
+    def validate_number(self, number):
+        try:
+            number = super().validate_number(number)
+            if not self.count_is_approximate or number < self.num_pages:
+                return number
+        except EmptyPage:
+            if not self.count_is_approximate or int(number) < 1:
+                raise
+        # an estimated last page may have more pages behind it, and a page past the estimate may exist
+        self.count, self.count_is_approximate = ExactCount().count(self.object_list, self.request)
+        self.__dict__.pop('num_pages', None)
+        return super().validate_number(number)
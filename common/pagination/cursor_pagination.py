@@ -0,0 +1,85 @@
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
+
+from common.constants import Error
+
+
+class CursorPaginationMixin:
+    """
+    Keyset pagination on (created_at, id), newest first, for pagination classes of models with a created_at field.
+
+    It is used instead of page numbers when the request carries a ``cursor`` parameter, or always with
+    ``cursor_by_default``. An empty cursor starts at the newest row. Pages are read with a range predicate instead of
+    OFFSET and without counting the rows, ``next`` and ``previous`` link to the neighbouring pages through opaque
+    cursors and ``count`` is null. The links keep the query string of the request, ``get_link_url`` can narrow it.
+    """
+
+    cursor_query_param = 'cursor'
+    cursor_by_default = False
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_by_default or self.cursor_query_param in request.query_params
+        if not self.cursor_mode:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request)
+        position = self.decode_cursor(request.query_params.get(self.cursor_query_param))
+
+        if position is None:
+            reverse = False
+            rows = list(queryset.order_by('-created_at', '-id')[: page_size + 1])
+        else:
+            created_at, pk, reverse = position
+            if reverse:
+                after = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+                rows = list(queryset.filter(after).order_by('created_at', 'id')[: page_size + 1])
+            else:
+                before = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+                rows = list(queryset.filter(before).order_by('-created_at', '-id')[: page_size + 1])
+
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.page_rows = rows
+        return rows
+
+    def get_paginated_data(self, data):
+        if not self.cursor_mode:
+            return super().get_paginated_data(data)
+
+        response_data = {
+            'count': None,
+            'next': self.get_cursor_link(self.page_rows[-1], reverse=False) if self.has_next and self.page_rows else None,
+            'previous': self.get_cursor_link(self.page_rows[0], reverse=True) if self.has_previous and self.page_rows else None,
+            'results': data,
+        }
+        return {'data': response_data, 'message': self.message}
+
+    def get_cursor_link(self, row, reverse):
+        position = {'c': row.created_at.isoformat(), 'i': row.id, 'r': int(reverse)}
+        cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+        return replace_query_param(self.get_link_url(), self.cursor_query_param, cursor)
+
+    def get_link_url(self):
+        return self.request.build_absolute_uri()
+
+    @staticmethod
+    def decode_cursor(cursor):
+        if not cursor:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return datetime.fromisoformat(position['c']), int(position['i']), bool(position['r'])
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(Error.INVALID_CURSOR)
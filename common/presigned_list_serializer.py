@@ -0,0 +1,17 @@
+from django.db import models
+from rest_framework import serializers
+
+from common.utils import get_presigned_urls
+
+
+class PresignedListSerializer(serializers.ListSerializer):
+    """
+    Signs the file fields listed in the child's ``Meta.presigned_fields`` for the whole list in one batch,
+    so the per row ``get_presigned_url`` calls are served from the S3Service url cache.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        for field_name, options in getattr(self.child.Meta, 'presigned_fields', {}).items():
+            get_presigned_urls((getattr(item, field_name).name for item in items), **options)
+        return super().to_representation(items)
@@ -1,11 +1,6 @@
 import logging
-import os
-import tempfile
-from urllib.parse import urlparse
 
-import requests
 from django.conf import settings
-from django.core.files import File
 from django.core.mail import send_mail
 from django.db import IntegrityError
 from django.http import Http404
@@ -118,6 +113,11 @@ class CustomAPIError(APIException):
 
 class CustomResponse(DRFResponse):
     def __init__(self, data_dict, *args, **kwargs):
+        super().__init__(self.envelope(data_dict), *args, **kwargs)
+
+    @staticmethod
+    def envelope(data_dict):
+        """The {data, error, success, message} body of a response, with dict errors flattened to their first message."""
         if isinstance(data_dict.get('error'), dict):
             error_dict = data_dict.get('error')
             # Check for non_field_errors first
@@ -136,13 +136,12 @@ class CustomResponse(DRFResponse):
                 if isinstance(data_dict['error'], dict):
                     data_dict['error'] = str(error_dict)
 
-        formatted_data = {
+        return {
             'data': data_dict.get('data', {}),
             'error': data_dict.get('error', None),
             'success': data_dict.get('success', True),
             'message': data_dict.get('message', ''),
         }
-        super().__init__(formatted_data, *args, **kwargs)
 
 
 def get_presigned_url(key, expiration=3600, download=False, filename=None):
@@ -167,6 +166,34 @@ def get_presigned_url(key, expiration=3600, download=False, filename=None):
     return url
 
 
+def get_presigned_urls(keys, expiration=3600, download=False, filename=None):
+    """
+    Generate presigned URLs for several S3 objects in one go.
+
+    Args:
+        keys: Iterable of S3 object keys, empty keys are skipped
+        expiration: URL expiration time in seconds (default: 3600)
+        download: Whether to force download instead of in-browser display (default: False)
+        filename: Custom filename for download (default: None, uses original filename)
+
+    Returns:
+        Dict mapping every key to its presigned URL
+    """
+    urls = {}
+    s3_keys = []
+    for key in keys:
+        if not key:
+            continue
+        if key.startswith("http") or key.startswith("https"):
+            urls[key] = key
+        else:
+            s3_keys.append(key)
+
+    if s3_keys:
+        urls.update(S3Service().generate_presigned_urls(s3_keys, expiration=expiration, download=download, filename=filename))
+    return urls
+
+
 def send_email_(email, variables, action):
     try:
         recipient_list = [email]
@@ -205,66 +232,3 @@ def unsnake_case(value):
 
 def str_to_bool(value):
     return str(value).lower() in ('true', '1', 't', 'y', 'yes')
-
-
-def download_file_from_url(url, filename=None):
-    """
-    Downloads a file from a URL and returns a Django File object.
-    Only allows PDF, JPG, PNG, and DOCX file types.
-
-    Args:
-        url (str): The URL to download the file from
-        filename (str, optional): Custom filename to use. If None, extracts from URL.
-
-    Returns:
-        tuple: (Django File object, temp file path to be cleaned up)
-
-    Raises:
-        Exception: If download fails or file type is not allowed
-    """
-    try:
-        if not filename:
-            parsed_url = urlparse(url)
-            filename = os.path.basename(parsed_url.path)
-
-            if not filename or '.' not in filename:
-                response = requests.head(url)
-                content_type = response.headers.get('Content-Type', '').lower()
-
-                allowed_types = {
-                    'application/pdf': '.pdf',
-                    'image/jpeg': '.jpg',
-                    'image/jpg': '.jpg',
-                    'image/png': '.png',
-                    'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '.docx',
-                }
-
-                if content_type not in allowed_types:
-                    raise ValueError(f"File type '{content_type}' is not allowed. Only PDF, JPG, PNG, and DOCX are permitted.")
-
-                extension = allowed_types[content_type]
-                filename = f"document_{os.path.basename(tempfile.mktemp())}{extension}"
-            else:
-                ext = os.path.splitext(filename)[1].lower()
-                allowed_extensions = ['.pdf', '.jpg', '.jpeg', '.png', '.docx']
-
-                if ext not in allowed_extensions:
-                    return False, f"File extension '{ext}' is not allowed. Only PDF, JPG, PNG, and DOCX are permitted."
-        # Download the file
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
-
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_file.write(chunk)
-            temp_file_path = temp_file.name
-
-        # Create a Django File object from the temp file
-        django_file = File(open(temp_file_path, 'rb'), name=filename)
-
-        return django_file, temp_file_path
-
-    except Exception as e:
-        logger.error(f"Error downloading file from URL {url}: {str(e)}")
-        raise
@@ -17,6 +17,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 log_directory = os.path.join(BASE_DIR, 'logs')
 log_file = os.path.join(log_directory, 'error.log')
+# the log directory is not tracked, the file handlers need it to exist
+os.makedirs(log_directory, exist_ok=True)
 
 
 class BaseSettings:
@@ -61,6 +63,7 @@ class BaseSettings:
         "django.contrib.sessions",
         "django.contrib.messages",
         "django.contrib.staticfiles",
+        "django.contrib.postgres",
         "rest_framework",
         "rest_framework_simplejwt",
         "rest_framework_simplejwt.token_blacklist",
@@ -80,6 +83,10 @@ class BaseSettings:
     REST_FRAMEWORK = {
         'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication',),
         'EXCEPTION_HANDLER': 'common.utils.custom_exception_handler',
+        'DEFAULT_RENDERER_CLASSES': (
+            'common.renderers.ORJSONRenderer',
+            'rest_framework.renderers.BrowsableAPIRenderer',
+        ),
     }
 
     SIMPLE_JWT = {
@@ -133,6 +140,21 @@ class BaseSettings:
             'PORT': get_env_value('DB_PORT'),
         }
     }
+
+    # The cache holds the version counters that key the cached responses, counts, ETags and dashboards
+    # (common.model_version, PropertyCache, DashboardService). The counters are bumped by whichever process writes the
+    # rows, so every process serving requests or running the unit import worker has to share one cache. Without
+    # REDIS_URL each process gets its own local memory cache, which is only correct for a single process that serves
+    # every request and runs no worker, e.g. runserver in development.
+    REDIS_URL = get_env_value("REDIS_URL")
+    CACHES = {
+        'default': (
+            {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': REDIS_URL}
+            if REDIS_URL
+            else {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+        )
+    }
+
     # Password validation
     # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -195,6 +217,23 @@ class BaseSettings:
     SITE_DOMAIN = get_env_value("SITE_DOMAIN")
     FRONTEND_DOMAIN = get_env_value("FRONTEND_DOMAIN")
 
+    # seconds between background recomputations of the top listings snapshot, 0 only recomputes on demand
+    TOP_LISTINGS_REFRESH_INTERVAL = int(get_env_value("TOP_LISTINGS_REFRESH_INTERVAL", 300))
+
+    # listing views are buffered per process and written behind every interval, or once this many rows are pending
+    VIEW_COUNTER_FLUSH_INTERVAL = int(get_env_value("VIEW_COUNTER_FLUSH_INTERVAL", 30))
+    VIEW_COUNTER_MAX_PENDING = int(get_env_value("VIEW_COUNTER_MAX_PENDING", 500))
+
+    # photos and documents of bulk imports are downloaded by this many threads, at most MEDIA_FETCH_PER_HOST per host,
+    # with a timeout in seconds per request and a size limit in bytes per file
+    MEDIA_FETCH_WORKERS = int(get_env_value("MEDIA_FETCH_WORKERS", 8))
+    MEDIA_FETCH_PER_HOST = int(get_env_value("MEDIA_FETCH_PER_HOST", 4))
+    MEDIA_FETCH_TIMEOUT = int(get_env_value("MEDIA_FETCH_TIMEOUT", 30))
+    MEDIA_FETCH_MAX_SIZE = int(get_env_value("MEDIA_FETCH_MAX_SIZE", 25 * 1024 * 1024))
+
+    # a bulk import job whose worker hasn't saved its progress for this many seconds has stopped and is failed
+    UNIT_IMPORT_JOB_LEASE = int(get_env_value("UNIT_IMPORT_JOB_LEASE", 900))
+
     MEDIA_URL = '/media/'
     MEDIA_ROOT = BASE_DIR / 'media'
 
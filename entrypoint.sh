@@ -7,6 +7,11 @@ while ! nc -z $DB_HOST $DB_PORT; do
 done
 echo "PostgreSQL started"
 
+# The unit import worker runs from the same image, the API container applies the migrations
+if [ "$1" = "worker" ]; then
+  exec python manage.py process_unit_import_jobs
+fi
+
 # Run migrations
 python manage.py migrate
 